@@ -0,0 +1,143 @@
+# encoding: utf-8
+
+import asyncio
+from itertools import islice
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+
+from src.blockchain.models.blockchain import Blockchain
+from src.client.models.transaction import Transaction
+from src.client.models.transactions_pool import TransactionsPool
+from src.config.settings import ADMISSION_BATCH_SIZE, ADMISSION_DELAY
+
+# Custom logger for admission queue class module
+fileConfig(join(dirname(dirname(__file__)), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+
+class AdmissionQueue(object):
+    """
+    Queue of the transactions received from the network nodes before
+    they are added to the transactions pool. Incoming transactions are
+    collected for a short delay and validated in batches outside the
+    event loop. Duplicated, already confirmed and invalid transactions
+    are dropped, and the valid ones are added to the pool together.
+    The queue holds as many transactions as the pool, the overflow is dropped.
+    """
+
+    def __init__(self, blockchain: Blockchain, transactions_pool: TransactionsPool,
+                 delay: float = ADMISSION_DELAY, batch_size: int = ADMISSION_BATCH_SIZE):
+        """
+        Create a new AdmissionQueue instance.
+
+        :param Blockchain blockchain: local copy of the blockchain.
+        :param TransactionsPool transactions_pool: unconfirmed transactions pool.
+        :param float delay: seconds to collect transactions before a batch is validated.
+        :param int batch_size: maximum number of transactions validated together.
+        """
+        self.blockchain = blockchain
+        self.transactions_pool = transactions_pool
+        self.delay = delay
+        self.batch_size = batch_size
+        self.queue = {}
+        self.task = None
+        self.admitted = 0
+        self.dropped = 0
+
+    def __str__(self):
+        """
+        Represent class instance via params string.
+
+        :return str: instance representation.
+        """
+        return ('AdmissionQueue('
+            f'queued: {self.size}, '
+            f'admitted: {self.admitted}, '
+            f'dropped: {self.dropped})')
+
+    @property
+    def size(self):
+        """
+        Get the number of transactions waiting to be validated.
+
+        :return int: queued transactions.
+        """
+        return len(self.queue)
+
+    @property
+    def is_full(self):
+        """
+        Check wether the queue reached the pool transactions limit.
+
+        :return bool: wether if the queue is full.
+        """
+        max_transactions = self.transactions_pool.max_transactions
+        return max_transactions is not None and self.size >= max_transactions
+
+    def put(self, transaction: Transaction):
+        """
+        Queue an incoming transaction and schedule the batch processing in
+        the running event loop. A transaction queued again with the same uuid
+        (e.g. an updated transaction) replaces the queued one. New transactions
+        are dropped while the queue is full.
+
+        :param Transaction transaction: transaction received from the network.
+        :return Task: batch processing task.
+        """
+        if transaction.uuid not in self.queue and self.is_full:
+            self.dropped += 1
+            message = f'Transaction dropped: {transaction}.'
+            logger.warning(f'[AdmissionQueue] Queue full. {message}')
+            return self.task
+        self.queue[transaction.uuid] = transaction
+        if self.task is None or self.task.done():
+            self.task = asyncio.ensure_future(self._process())
+        return self.task
+
+    async def admit(self, transactions: list):
+        """
+        Validate a batch of transactions in an executor thread and add the valid
+        ones to the pool. Transactions already in the chain or already pooled
+        with the same data are dropped before validation.
+
+        :param list transactions: transactions to admit.
+        :return list: transactions added to the pool.
+        """
+        transaction_uuids, _ = self.blockchain.ledger
+        candidates = [transaction for transaction in transactions
+                      if transaction.uuid not in transaction_uuids and not self._is_pooled(transaction)]
+        loop = asyncio.get_event_loop()
+        valid = await loop.run_in_executor(None, self.transactions_pool.validate_transactions, candidates)
+        added = [transaction for transaction in valid if self.transactions_pool.add_transaction(transaction)]
+        self.admitted += len(added)
+        self.dropped += len(transactions) - len(added)
+        message = f'Transactions admitted: {len(added)} of {len(transactions)}.'
+        logger.info(f'[AdmissionQueue] Batch processed. {message}')
+        return added
+
+    async def _process(self):
+        """
+        Admit the queued transactions in batches until the queue is empty.
+        Batches are collected for the admission delay unless already full.
+        """
+        while self.queue:
+            if len(self.queue) < self.batch_size:
+                await asyncio.sleep(self.delay)
+            uuids = list(islice(self.queue, self.batch_size))
+            batch = [self.queue.pop(uuid) for uuid in uuids]
+            try:
+                await self.admit(batch)
+            except Exception as err:
+                self.dropped += len(batch)
+                logger.error(f'[AdmissionQueue] Admission error. {err}')
+
+    def _is_pooled(self, transaction: Transaction):
+        """
+        Check whether the same transaction data is already in the pool.
+
+        :param Transaction transaction: incoming transaction.
+        :return bool: wether if the transaction is a duplicate of a pooled one.
+        """
+        pooled = self.transactions_pool.pool.get(transaction.uuid)
+        return pooled is not None and pooled.serialize() == transaction.serialize()
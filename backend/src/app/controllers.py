@@ -1,11 +1,19 @@
 # encoding: utf-8
 
+import asyncio
+import copy
 from logging import getLogger
 from logging.config import fileConfig
 from os.path import dirname, join
 
+from fastapi import Query, status
+from fastapi.responses import JSONResponse
+
 from src.app.routing import APIRoute, APIRouter
+from src.blockchain.models.merkle import merkle_branch
 from src.client.models.transaction import Transaction
+from src.config.settings import API_MAX_PAGE_LIMIT, API_PAGE_LIMIT, BLOCK_LEGACY_VERSION
+from src.exceptions import BlockError, BlockchainError
 
 # Custom logger for controllers module
 fileConfig(join(dirname(dirname(__file__)), 'config', 'logging.cfg'))
@@ -22,20 +30,41 @@ async def root():
 @router.get('/blockchain')
 async def blockchain():
     logger.info('[API] GET blockchain.')
-    return {'blockchain': router.blockchain}
+    return {'blockchain': router.blockchain.info}
 
 @router.get('/mine')
 async def mine_block():
     logger.info('[API] GET mine. Mining block.')
-    transaction_reward = Transaction.reward_mining(router.wallet)
-    data = router.transactions_pool.data
-    data.append(transaction_reward.info)
-    block = router.blockchain.add_block(data)
+    data = router.transactions_pool.get_block_data(router.wallet)
+    loop = asyncio.get_event_loop()
+    try:
+        block = await loop.run_in_executor(None, router.blockchain.add_block, data)
+    except (BlockError, BlockchainError) as err:
+        logger.error(f'[API] GET mine. Block discarded. {err.message}')
+        content = {'errors': [err.message]}
+        return JSONResponse(content=content, status_code=status.HTTP_409_CONFLICT)
     logger.info(f'[API] GET mine. Block mined: {block}.')
     await router.p2p_server.broadcast_chain()
-    router.transactions_pool.clear_pool(router.blockchain)
+    router.transactions_pool.clear_blocks([block])
     return {'block': block}
 
+@router.get('/miner')
+async def miner():
+    logger.info('[API] GET miner. Retrieving mining daemon status.')
+    return {'miner': router.miner.status}
+
+@router.post('/miner/start')
+async def start_miner():
+    logger.info('[API] POST miner start. Starting mining daemon.')
+    router.miner.start()
+    return {'miner': router.miner.status}
+
+@router.post('/miner/stop')
+async def stop_miner():
+    logger.info('[API] POST miner stop. Stopping mining daemon.')
+    await router.miner.stop()
+    return {'miner': router.miner.status}
+
 @router.post('/transact')
 async def transact(data: dict):
     logger.info('[API] POST transact. New transaction.')
@@ -43,12 +72,17 @@ async def transact(data: dict):
     amount = data.get('amount')
     transaction = router.transactions_pool.get_transaction(router.wallet.address)
     if transaction:
+        transaction = copy.deepcopy(transaction)
         transaction.update(router.wallet, recipient, amount)
         logger.info(f'[API] POST transact. Transaction updated: {transaction}.')
     else:
         transaction = Transaction.create(sender=router.wallet, recipient=recipient, amount=amount)
         logger.info(f'[API] POST transact. Transaction made: {transaction}.')
-    router.transactions_pool.add_transaction(transaction)
+    if not router.transactions_pool.add_transaction(transaction):
+        message = f'Transaction {transaction.uuid} exceeds the transactions pool size limit.'
+        logger.error(f'[API] POST transact. Transaction rejected. {message}')
+        content = {'errors': [message]}
+        return JSONResponse(content=content, status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
     await router.p2p_server.broadcast_transaction(transaction)
     return {'transaction': transaction}
 
@@ -61,16 +95,43 @@ async def balance():
     return {'address': address, 'balance': balance}
 
 @router.get('/addresses')
-async def addresses():
+async def addresses(prefix: str = '', cursor: str = None,
+                    limit: int = Query(API_PAGE_LIMIT, ge=1, le=API_MAX_PAGE_LIMIT)):
     logger.info('[API] GET addresses. Retrieving known addresses.')
-    addresses = set()
-    for block in router.blockchain.chain:
-        for transaction in block.data:
-            addresses.update(transaction.get('output').keys())
-    return {'addresses': list(addresses)}
+    addresses, next_cursor = router.blockchain.get_addresses(prefix, cursor, limit)
+    return {'addresses': addresses, 'cursor': next_cursor}
+
+@router.get('/addresses/{address}/transactions')
+async def address_transactions(address: str, cursor: int = Query(0, ge=0),
+                               limit: int = Query(API_PAGE_LIMIT, ge=1, le=API_MAX_PAGE_LIMIT)):
+    logger.info(f'[API] GET address transactions. Retrieving transactions for address {address}.')
+    transactions, next_cursor = router.blockchain.get_address_transactions(address, cursor, limit)
+    return {'address': address, 'transactions': transactions, 'cursor': next_cursor}
 
 @router.get('/transactions')
 async def transactions():
     logger.info('[API] GET transactions. Retrieving transactions.')
+    router.transactions_pool.expire()
     transactions = router.transactions_pool.data
     return {'transactions': transactions}
+
+@router.get('/transactions/pool')
+async def transactions_pool():
+    logger.info('[API] GET transactions pool. Retrieving transactions pool metrics.')
+    router.transactions_pool.expire()
+    return {'pool': router.transactions_pool.info}
+
+@router.get('/transactions/{uuid}/proof')
+async def transaction_proof(uuid: int):
+    logger.info(f'[API] GET transaction proof. Retrieving inclusion proof for transaction {uuid}.')
+    found = router.blockchain.find_transaction(uuid)
+    if found is None:
+        message = f'Transaction {uuid} not found in the blockchain.'
+        logger.error(f'[API] GET transaction proof. {message}')
+        return JSONResponse(content={'errors': [message]}, status_code=status.HTTP_404_NOT_FOUND)
+    block, index = found
+    if block.header_version == BLOCK_LEGACY_VERSION:
+        message = f'Block {block.index} has no transactions merkle root in its header.'
+        logger.error(f'[API] GET transaction proof. {message}')
+        return JSONResponse(content={'errors': [message]}, status_code=status.HTTP_409_CONFLICT)
+    return {'transaction': block.data[index], 'header': block.header, 'branch': merkle_branch(block.data, index)}
@@ -0,0 +1,183 @@
+# encoding: utf-8
+
+import asyncio
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+from threading import Event
+
+from src.blockchain.models.blockchain import Blockchain
+from src.client.models.transactions_pool import TransactionsPool
+from src.client.models.wallet import Wallet
+from src.config.settings import MINING_TEMPLATE_REFRESH_RATE
+from src.exceptions import BlockError, BlockchainError
+
+# Custom logger for mining daemon class module
+fileConfig(join(dirname(dirname(__file__)), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+
+class MiningDaemon(object):
+    """
+    Background block producer. Mines blocks continuously on top of the
+    local chain with the unconfirmed transactions of the pool. The
+    candidate block template is rebuilt whenever the pool changes or
+    a new last block is accepted from the network.
+    """
+
+    def __init__(self, blockchain: Blockchain, wallet: Wallet,
+                 transactions_pool: TransactionsPool, p2p_server: 'P2PServer'):
+        """
+        Create a new MiningDaemon instance.
+
+        :param Blockchain blockchain: local copy of the blockchain.
+        :param Wallet wallet: miner wallet to receive the mining rewards.
+        :param TransactionsPool transactions_pool: unconfirmed transactions pool.
+        :param P2PServer p2p_server: peer-to-peer server to broadcast mined blocks.
+        """
+        self.blockchain = blockchain
+        self.wallet = wallet
+        self.transactions_pool = transactions_pool
+        self.p2p_server = p2p_server
+        self.task = None
+        self.event = None
+        self.template = None
+        self.pool_version = None
+        self.blocks_mined = 0
+        self.templates = 0
+
+    def __str__(self):
+        """
+        Represent class instance via params string.
+
+        :return str: instance representation.
+        """
+        return ('MiningDaemon('
+            f'running: {self.running}, '
+            f'blocks mined: {self.blocks_mined}, '
+            f'templates: {self.templates})')
+
+    @property
+    def running(self):
+        """
+        Check whether the daemon is mining.
+
+        :return bool: wether if the mining task is alive.
+        """
+        return self.task is not None and not self.task.done()
+
+    @property
+    def status(self):
+        """
+        Get the mining daemon status.
+
+        :return dict: running state, counters and current block template.
+        """
+        return {
+            'running': self.running,
+            'blocks_mined': self.blocks_mined,
+            'templates': self.templates,
+            'template': self.template
+        }
+
+    def start(self):
+        """
+        Start mining blocks continuously in the running event loop.
+
+        :return Task: mining task.
+        """
+        if not self.running:
+            self.task = asyncio.ensure_future(self._mine())
+            logger.info('[MiningDaemon] Mining started.')
+        return self.task
+
+    async def stop(self):
+        """
+        Stop mining and wait for the current block search to be aborted.
+        """
+        if not self.running:
+            return
+        self.task.cancel()
+        self.refresh()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+        logger.info(f'[MiningDaemon] Mining stopped. Blocks mined: {self.blocks_mined}.')
+
+    def refresh(self):
+        """
+        Abort the current block search so that a new block template is built.
+        """
+        if self.event:
+            self.event.set()
+
+    async def _mine(self):
+        """
+        Mine blocks until the daemon is stopped while watching the pool.
+        Unexpected errors are logged and mining goes on with a new template.
+        """
+        watcher = asyncio.ensure_future(self._watch_pool())
+        try:
+            while True:
+                try:
+                    await self._mine_template()
+                except Exception as err:
+                    logger.error(f'[MiningDaemon] Mining error. {err}')
+                    await asyncio.sleep(MINING_TEMPLATE_REFRESH_RATE)
+        finally:
+            watcher.cancel()
+            self.template = None
+
+    async def _mine_template(self):
+        """
+        Build a block template from the current pool and try to mine it.
+        If the daemon is stopped meanwhile, the search is aborted but a block
+        mined before the abort is still published.
+        """
+        self.event = Event()
+        self.pool_version = self.transactions_pool.version
+        data = self.transactions_pool.get_block_data(self.wallet)
+        last_block = self.blockchain.last_block
+        self.template = {'index': last_block.index + 1, 'last_hash': last_block.hash,
+                         'transactions': len(data)}
+        self.templates += 1
+        loop = asyncio.get_event_loop()
+        future = loop.run_in_executor(None, self.blockchain.add_block, data, self.event)
+        try:
+            await asyncio.wait([future])
+        except asyncio.CancelledError:
+            self.refresh()
+            await asyncio.wait([future])
+            await self._publish(future)
+            raise
+        await self._publish(future)
+
+    async def _publish(self, future: asyncio.Future):
+        """
+        Broadcast the block added by a finished search to the network nodes.
+
+        :param Future future: finished block search.
+        :return Block: new mined block, None if the template was discarded.
+        """
+        try:
+            block = future.result()
+        except (BlockError, BlockchainError) as err:
+            logger.info(f'[MiningDaemon] Template discarded. {err.message}')
+            return None
+        self.blocks_mined += 1
+        logger.info(f'[MiningDaemon] Block mined: {block}.')
+        await self.p2p_server.broadcast_chain()
+        self.transactions_pool.clear_blocks([block])
+        return block
+
+    async def _watch_pool(self):
+        """
+        Periodically check the transactions pool and refresh the block
+        template when its content changed.
+        """
+        while True:
+            await asyncio.sleep(MINING_TEMPLATE_REFRESH_RATE)
+            if self.transactions_pool.version != self.pool_version:
+                logger.info('[MiningDaemon] Transactions pool changed. Refreshing template.')
+                self.refresh()
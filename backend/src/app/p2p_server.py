@@ -12,6 +12,7 @@ from websockets.client import WebSocketClientProtocol as Socket
 from websockets.exceptions import WebSocketException
 from websockets.server import WebSocketServer
 
+from src.app.admission import AdmissionQueue
 from src.app.nodes import NodesNetwork
 from src.app.utils import parse, stringify
 from src.blockchain.models.blockchain import Blockchain
@@ -39,12 +40,14 @@ class P2PServer(object):
         Create a new P2PServer instance.
 
         :param Blockchain blockchain: local copy of the blockchain.
+        :param TransactionsPool transactions_pool: unconfirmed transactions pool.
         """
         self.host = None
         self.port = None
         self.server = None
         self.blockchain = blockchain
         self.transactions_pool = transactions_pool
+        self.admission = AdmissionQueue(blockchain, transactions_pool)
         self.nodes = NodesNetwork()
 
     def __str__(self):
@@ -109,11 +112,13 @@ class P2PServer(object):
     async def heartbeat(self):
         """
         Run periodic signal to synchronize all the network nodes.
+        Expired transactions are removed from the pool on every beat.
 
         :return func: heartbeat daemon.
         """
         async def _heartbeat():
             while True:
+                self.transactions_pool.expire()
                 await self._synchronize()
                 await asyncio.sleep(HEARTBEAT_RATE)
         return await _heartbeat()
@@ -295,13 +300,13 @@ class P2PServer(object):
                 chain = data.get('content')
                 logger.info(f'[P2PServer] Chain received. {chain}.')
                 blockchain = Blockchain.deserialize(chain)
-                self.blockchain.set_valid_chain(blockchain.chain)
-                self.transactions_pool.clear_pool(self.blockchain)
+                blocks = self.blockchain.set_valid_chain(blockchain.chain)
+                self.transactions_pool.clear_blocks(blocks)
             elif channel == CHANNELS.get('transact'):
                 transaction_info = data.get('content')
                 logger.info(f'[P2PServer] Transaction received. {transaction_info}.')
                 transaction = Transaction.deserialize(transaction_info)
-                self.transactions_pool.add_transaction(transaction)
+                self.admission.put(transaction)
             else:
                 error_msg = f'Unknown channel received: {channel}.'
                 logger.error(f'[P2PServer] Channel error. {error_msg}')
@@ -8,8 +8,10 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute as BaseAPIRoute
 
+from src.app.miner import MiningDaemon
 from src.app.p2p_server import P2PServer
 from src.app.request import Request
+from src.app.work_server import WorkServer
 from src.blockchain.models.blockchain import Blockchain
 from src.client.models.transactions_pool import TransactionsPool
 from src.client.models.wallet import Wallet
@@ -65,4 +67,15 @@ class APIRouter(BaseAPIRouter):
         if not hasattr(self, '_p2p_server'):
             self._p2p_server = P2PServer(self.blockchain, self.transactions_pool)
         return self._p2p_server
-            
\ No newline at end of file
+
+    @property
+    def miner(self) -> MiningDaemon:
+        if not hasattr(self, '_miner'):
+            self._miner = MiningDaemon(self.blockchain, self.wallet, self.transactions_pool, self.p2p_server)
+        return self._miner
+
+    @property
+    def work_server(self) -> WorkServer:
+        if not hasattr(self, '_work_server'):
+            self._work_server = WorkServer(self.blockchain, self.wallet, self.transactions_pool, self.p2p_server)
+        return self._work_server
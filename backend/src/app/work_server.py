@@ -0,0 +1,334 @@
+# encoding: utf-8
+
+import asyncio
+import json
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+
+from src.blockchain.models.block import Block
+from src.blockchain.models.blockchain import Blockchain
+from src.blockchain.models.mining import MiningKernel
+from src.blockchain.models.utils import get_hash_fields, get_hash_values, hash_block
+from src.client.models.transactions_pool import TransactionsPool
+from src.client.models.wallet import Wallet
+from src.config.settings import WORK_METHODS, WORK_NONCE_RANGE
+from src.exceptions import BlockError, WorkServerError
+
+# Custom logger for work server class module
+fileConfig(join(dirname(dirname(__file__)), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+
+def encode(message: dict):
+    """
+    Encode a work protocol message as a json line.
+
+    :param dict message: message with data to transfer.
+    :return bytes: newline terminated message.
+    :raise WorkServerError: on data encoding error.
+    """
+    try:
+        return json.dumps(message).encode('utf-8') + b'\n'
+    except (OverflowError, TypeError) as err:
+        message = f'Could not encode message data. {err.args[0]}.'
+        logger.error(f'[WorkServer] Encode error. {message}')
+        raise WorkServerError(message)
+
+
+def decode(line: bytes):
+    """
+    Decode a work protocol json line message.
+
+    :param bytes line: newline terminated message.
+    :return dict: decoded message with data.
+    :raise WorkServerError: on data decoding error.
+    """
+    try:
+        return json.loads(line.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError) as err:
+        message = f'Could not decode message data. {err.args[0]}.'
+        logger.error(f'[WorkServer] Decode error. {message}')
+        raise WorkServerError(message)
+
+
+class WorkServer(object):
+    """
+    Local socket server that hands out mining jobs to external worker
+    processes, stratum-style. Each job holds the hashed block template
+    attributes with fixed timestamp and difficulty (only the header for
+    versioned blocks), the hash target and a disjoint nonce range.
+    Workers submit found nonces that are validated and added to the local
+    blockchain, which is then broadcasted to the network nodes.
+    Messages are json lines with a method and its params.
+    """
+
+    def __init__(self, blockchain: Blockchain, wallet: Wallet,
+                 transactions_pool: TransactionsPool, p2p_server: 'P2PServer'):
+        """
+        Create a new WorkServer instance.
+
+        :param Blockchain blockchain: local copy of the blockchain.
+        :param Wallet wallet: miner wallet to receive the mining rewards.
+        :param TransactionsPool transactions_pool: unconfirmed transactions pool.
+        :param P2PServer p2p_server: peer-to-peer server to broadcast mined blocks.
+        """
+        self.host = None
+        self.port = None
+        self.server = None
+        self.blockchain = blockchain
+        self.wallet = wallet
+        self.transactions_pool = transactions_pool
+        self.p2p_server = p2p_server
+        self.job = None
+        self.block = None
+        self.jobs = 0
+        self.next_nonce = 0
+        self.accepted = 0
+        self.rejected = 0
+
+    def __str__(self):
+        """
+        Represent class instance via params string.
+
+        :return str: instance representation.
+        """
+        return ('WorkServer('
+            f'host: {self.host}, '
+            f'port: {self.port}, '
+            f'accepted: {self.accepted}, '
+            f'rejected: {self.rejected})')
+
+    def bind(self, host: str, port: int):
+        """
+        Set work server host and port.
+
+        :param str host: server host name.
+        :param int port: server port.
+        """
+        self.host, self.port = host, port
+
+    async def start(self, host: str = None, port: int = None):
+        """
+        Start work server that accepts incoming mining worker connections.
+
+        :param str host: server host name.
+        :param int port: server port.
+        :return Server: work socket server.
+        """
+        if not self.host or not self.port: self.bind(host, port)
+        self.server = await asyncio.start_server(self._listen, self.host, self.port)
+        logger.info(f'[WorkServer] Listening on {self.host}:{self.port}.')
+        return self.server
+
+    def close(self):
+        """
+        Close work server.
+        Stop accepting connections from mining workers.
+        """
+        self.server.close()
+
+    @property
+    def stale(self):
+        """
+        Check whether the current job no longer matches the local chain
+        last block or the transactions pool content.
+
+        :return bool: wether if a new job template is required.
+        """
+        return (self.job is None
+                or self.job.get('block').get('last_hash') != self.blockchain.last_block.hash
+                or self.job.get('pool_version') != self.transactions_pool.version)
+
+    def get_job(self):
+        """
+        Get the next job for a mining worker with a fresh nonce range.
+        A new block template is built if the current one is stale.
+
+        :return dict: job id, block template, target and nonce range.
+        """
+        if self.stale:
+            self._new_job()
+        start, self.next_nonce = self.next_nonce, self.next_nonce + WORK_NONCE_RANGE
+        job = {key: value for key, value in self.job.items() if key != 'pool_version'}
+        job.update({'nonce_start': start, 'nonce_end': self.next_nonce})
+        return job
+
+    def _new_job(self):
+        """
+        Build a new block template from the local chain last block and the
+        transactions pool, including the mining reward.
+        """
+        last_block = self.blockchain.last_block
+        data = self.transactions_pool.get_block_data(self.wallet)
+        block = Block.prepare_block(last_block, data)
+        self.jobs += 1
+        self.next_nonce = 0
+        self.block = block
+        header = {key: block.get(key) for key in get_hash_fields(block)}
+        target = MiningKernel(last_block, block).get_target(block.get('difficulty'))
+        self.job = {'id': self.jobs, 'block': header, 'target': f'{target:064x}',
+                    'pool_version': self.transactions_pool.version}
+        logger.info(f'[WorkServer] New job {self.jobs} for block {block["index"]}.')
+
+    async def submit(self, job_id: int, nonce: int):
+        """
+        Validate a nonce submitted by a mining worker and add the mined block
+        to the local blockchain. The new chain is broadcasted to the network.
+
+        :param int job_id: identifier of the job the nonce was found for.
+        :param int nonce: found nonce.
+        :return Block: new mined block.
+        :raise WorkServerError: on stale job or invalid solution.
+        """
+        if self.stale or self.job.get('id') != job_id:
+            self.rejected += 1
+            message = f'Stale job {job_id}.'
+            logger.warning(f'[WorkServer] Submit rejected. {message}')
+            raise WorkServerError(message)
+        block_info = dict(self.block, nonce=nonce)
+        block_info['hash'] = hash_block(*get_hash_values(block_info))
+        try:
+            block = self.blockchain.append_block(Block(**block_info))
+        except BlockError as err:
+            self.rejected += 1
+            logger.warning(f'[WorkServer] Submit rejected. {err.message}')
+            raise WorkServerError(err.message)
+        self.accepted += 1
+        logger.info(f'[WorkServer] Block mined by worker: {block}.')
+        await self.p2p_server.broadcast_chain()
+        self.transactions_pool.clear_blocks([block])
+        return block
+
+    async def _listen(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Handle the incoming mining worker connection until it is closed.
+
+        :param StreamReader reader: worker connection reader.
+        :param StreamWriter writer: worker connection writer.
+        """
+        logger.info(f'[WorkServer] Worker connected: {writer.get_extra_info("peername")}.')
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            response = await self._message_handler(line)
+            writer.write(encode(response))
+            await writer.drain()
+        writer.close()
+
+    async def _message_handler(self, line: bytes):
+        """
+        Process a mining worker request message.
+
+        :param bytes line: stringified request message.
+        :return dict: response message.
+        """
+        try:
+            data = decode(line)
+            if not isinstance(data, dict):
+                message = f'Invalid message received: {data}.'
+                logger.error(f'[WorkServer] Message error. {message}')
+                raise WorkServerError(message)
+            method = data.get('method')
+            params = data.get('params') or {}
+            if not isinstance(params, dict):
+                message = f'Invalid params received: {params}.'
+                logger.error(f'[WorkServer] Message error. {message}')
+                raise WorkServerError(message)
+            if method == WORK_METHODS.get('job'):
+                return {'method': method, 'result': self.get_job()}
+            elif method == WORK_METHODS.get('submit'):
+                block = await self.submit(params.get('job_id'), params.get('nonce'))
+                return {'method': method, 'result': block.hash}
+            message = f'Unknown method received: {method}.'
+            logger.error(f'[WorkServer] Method error. {message}')
+            raise WorkServerError(message)
+        except WorkServerError as err:
+            return {'error': err.message}
+
+
+class MiningWorker(object):
+    """
+    Stand-in external mining worker. Requests jobs from a work server,
+    searches its nonce range with the mining kernel and submits the
+    solutions found.
+    """
+
+    def __init__(self, host: str, port: int):
+        """
+        Create a new MiningWorker instance.
+
+        :param str host: work server host name.
+        :param int port: work server port.
+        """
+        self.host = host
+        self.port = port
+        self.reader = None
+        self.writer = None
+        self.accepted = 0
+        self.rejected = 0
+
+    async def connect(self):
+        """
+        Open the connection with the work server.
+        """
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    def close(self):
+        """
+        Close the connection with the work server.
+        """
+        self.writer.close()
+
+    async def request(self, method: str, params: dict = None):
+        """
+        Send a request to the work server and wait for its response.
+
+        :param str method: work protocol method.
+        :param dict params: method params.
+        :return dict: response result.
+        :raise WorkServerError: on error response.
+        """
+        self.writer.write(encode({'method': method, 'params': params or {}}))
+        await self.writer.drain()
+        response = decode(await self.reader.readline())
+        if 'error' in response:
+            raise WorkServerError(response.get('error'))
+        return response.get('result')
+
+    async def run(self, solutions: int = None):
+        """
+        Mine jobs from the work server continuously.
+
+        :param int solutions: number of submitted solutions to stop after, none to run forever.
+        """
+        loop = asyncio.get_event_loop()
+        submitted = 0
+        while solutions is None or submitted < solutions:
+            job = await self.request(WORK_METHODS.get('job'))
+            solution = await loop.run_in_executor(None, self.search, job)
+            if solution is None:
+                continue
+            submitted += 1
+            try:
+                await self.request(WORK_METHODS.get('submit'), {'job_id': job.get('id'), 'nonce': solution})
+                self.accepted += 1
+            except WorkServerError as err:
+                self.rejected += 1
+                logger.warning(f'[MiningWorker] Solution rejected. {err.message}')
+
+    @staticmethod
+    def search(job: dict):
+        """
+        Search the job nonce range for a hash below the job target.
+
+        :param dict job: job received from the work server.
+        :return int: found nonce, None if not found.
+        """
+        block = job.get('block')
+        kernel = MiningKernel(None, block)
+        result = kernel.search_range(block.get('timestamp'), block.get('difficulty'),
+                                     job.get('nonce_start'), job.get('nonce_end'),
+                                     int(job.get('target'), 16))
+        return result[0] if result else None
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+import argparse
+import time
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+
+from src.blockchain.models.block import Block
+from src.blockchain.models.blockchain import Blockchain
+from src.blockchain.models.mining import MiningKernel
+from src.blockchain.models.utils import get_utcnow_timestamp
+from src.client.models.transaction import Transaction
+from src.client.models.wallet import Wallet
+from src.config.settings import BLOCK_MINING_RATE
+
+# Custom logger for benchmark module
+fileConfig(join(dirname(dirname(__file__)), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+
+def generate_block(last_block: Block, data: list, timestamp: int):
+    """
+    Create a valid block with the lowest difficulty to build benchmark chains fast.
+
+    :param Block last_block: current last block of the chain.
+    :param list data: block transactions data.
+    :param int timestamp: block creation UTC epoch datetime in milliseconds.
+    :return Block: new block.
+    """
+    block = Block.prepare_block(last_block, data)
+    block['timestamp'] = timestamp
+    block['difficulty'] = max(last_block.difficulty - 1, 1)
+    nonce, hash = MiningKernel(last_block, block).search_range(timestamp, block['difficulty'], 0, 2 ** 32)
+    return Block(**dict(block, nonce=nonce, hash=hash))
+
+
+def generate_chain(blocks: int, transactions: int):
+    """
+    Create a chain where every block holds signed transfers between wallets
+    and a mining reward funding the next sender.
+
+    :param int blocks: number of blocks after the genesis block.
+    :param int transactions: number of signed transactions per block.
+    :return list: chain of blocks.
+    """
+    chain = [Block.genesis()]
+    wallets = [Wallet(Blockchain(chain)) for _ in range(transactions + 1)]
+    timestamp = get_utcnow_timestamp() - (blocks + 1) * BLOCK_MINING_RATE
+    for index in range(blocks):
+        data = []
+        for wallet in wallets:
+            wallet.blockchain = Blockchain(chain)
+            if len(data) < transactions and wallet.balance > 1:
+                data.append(Transaction(sender=wallet, recipient=wallets[0].address, amount=1).info)
+        data.append(Transaction.reward_mining(wallets[index % len(wallets)]).info)
+        timestamp += BLOCK_MINING_RATE
+        chain.append(generate_block(chain[-1], data, timestamp))
+    return chain
+
+
+def measure(chain: list, repeat: int, cached: bool):
+    """
+    Measure the full chain validations per second.
+
+    :param list chain: chain of blocks.
+    :param int repeat: number of validations.
+    :param bool cached: wether to keep the validation caches between validations.
+    :return float: validations per second.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if not cached:
+            Wallet.signature_cache.clear()
+            Wallet.public_key_cache.clear()
+            Block.validated_cache.clear()
+        Blockchain.is_valid(chain)
+    return repeat / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='ValidationBenchmark')
+    parser.add_argument('-b', action='store', dest='blocks', type=int, default=50)
+    parser.add_argument('-t', action='store', dest='transactions', type=int, default=10)
+    parser.add_argument('-r', action='store', dest='repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    chain = generate_chain(args.blocks, args.transactions)
+    transactions = sum([len(block.data) for block in chain])
+    for cached in (False, True):
+        rate = measure(chain, args.repeat, cached)
+        caches = 'warm' if cached else 'cold'
+        print(f'Chain validations/s ({caches} caches): {rate:.2f} '
+              f'({rate * len(chain):.0f} blocks/s, {rate * transactions:.0f} transactions/s)')
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+import argparse
+import asyncio
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+
+from src.app.work_server import MiningWorker
+
+# Custom logger for worker module
+fileConfig(join(dirname(dirname(__file__)), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='MiningWorker')
+    parser.add_argument('-wh', action='store', dest='work_host', default='127.0.0.1')
+    parser.add_argument('-wp', action='store', dest='work_port', type=int, default=7000)
+    args = parser.parse_args()
+
+    worker = MiningWorker(args.work_host, args.work_port)
+    process = asyncio.get_event_loop()
+    process.run_until_complete(worker.connect())
+    logger.info(f'[MiningWorker] Connected to work server on port {args.work_port}.')
+    process.run_until_complete(worker.run())
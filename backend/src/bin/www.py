@@ -12,6 +12,11 @@ from argparse import Namespace
 from fastapi import FastAPI
 
 from src.app.api import app
+from src.blockchain.models.block import Block
+from src.client.models.journal import PoolJournal
+from src.client.models.verification import get_verification_pool
+from src.config.settings import (BLOCK_LEGACY_VERSION, GENESIS_BLOCKS, MINING_WORKERS, POOL_MAX_BYTES,
+                                 POOL_MAX_TRANSACTIONS, POOL_TRANSACTION_TTL, VERIFICATION_WORKERS)
 
 # Custom logger for www module
 fileConfig(join(dirname(dirname(__file__)), 'config', 'logging.cfg'))
@@ -36,6 +41,19 @@ class BlockchainApp(object):
         self.app.port = args.api_port
         self.app.router.p2p_server.bind(args.p2p_host, args.p2p_port)
         self.app.router.p2p_server.add_uris(nodes)
+        self.app.router.blockchain.mining_workers = args.mining_workers
+        self.app.router.blockchain.chain = [Block.genesis(args.block_version)]
+        self.app.router.transactions_pool.max_transactions = args.pool_transactions
+        self.app.router.transactions_pool.max_bytes = args.pool_bytes
+        self.app.router.transactions_pool.ttl = args.pool_ttl
+        if args.pool_journal:
+            journal = PoolJournal(args.pool_journal)
+            self.app.router.transactions_pool.restore(journal, self.app.router.blockchain)
+        get_verification_pool(args.verification_workers)
+        self.mining = args.mining
+        self.work_server_enabled = bool(args.work_port)
+        if self.work_server_enabled:
+            self.app.router.work_server.bind(args.work_host, args.work_port)
 
     async def start_api_server(self):
         """
@@ -63,12 +81,35 @@ class BlockchainApp(object):
         await self.app.router.p2p_server.connect_nodes()
         await self.app.router.p2p_server.heartbeat()
 
+    async def start_mining_daemon(self):
+        """
+        Start blockchain application backend continuous mining daemon.
+
+        :return Task: mining daemon task.
+        """
+        logger.info(f'[BlockchainApp] Blockchain mining daemon up.')
+        return self.app.router.miner.start()
+
+    async def start_work_server(self):
+        """
+        Start blockchain application backend work server for external mining workers.
+
+        :return Server: Blockchain backend work server.
+        """
+        logger.info(f'[BlockchainApp] Blockchain work server running on port {self.app.router.work_server.port}.')
+        return await self.app.router.work_server.start()
+
     def run(self):
         """
         Start infinite loop to run all servers asynchronously in the same thread.
         """
         process = asyncio.get_event_loop()
-        servers = asyncio.gather(self.start_api_server(), self.start_p2p_server(), self.start_p2p_heartbeat())
+        coroutines = [self.start_api_server(), self.start_p2p_server(), self.start_p2p_heartbeat()]
+        if self.mining:
+            coroutines.append(self.start_mining_daemon())
+        if self.work_server_enabled:
+            coroutines.append(self.start_work_server())
+        servers = asyncio.gather(*coroutines)
         process.run_until_complete(servers)
 
 
@@ -79,6 +120,17 @@ if __name__ == '__main__':
     parser.add_argument('-ph', action='store', dest='p2p_host', default='127.0.0.1')
     parser.add_argument('-pp', action='store', dest='p2p_port', default=6000)
     parser.add_argument('-n', action='store', dest='nodes', default='')
+    parser.add_argument('-mw', action='store', dest='mining_workers', type=int, default=MINING_WORKERS)
+    parser.add_argument('-m', action='store_true', dest='mining', default=False)
+    parser.add_argument('-vw', action='store', dest='verification_workers', type=int, default=VERIFICATION_WORKERS)
+    parser.add_argument('-bv', action='store', dest='block_version', type=int, default=BLOCK_LEGACY_VERSION,
+                        choices=list(GENESIS_BLOCKS))
+    parser.add_argument('-wh', action='store', dest='work_host', default='127.0.0.1')
+    parser.add_argument('-wp', action='store', dest='work_port', type=int, default=None)
+    parser.add_argument('-pt', action='store', dest='pool_transactions', type=int, default=POOL_MAX_TRANSACTIONS)
+    parser.add_argument('-pb', action='store', dest='pool_bytes', type=int, default=POOL_MAX_BYTES)
+    parser.add_argument('-pe', action='store', dest='pool_ttl', type=float, default=POOL_TRANSACTION_TTL)
+    parser.add_argument('-pj', action='store', dest='pool_journal', default=None)
     args = parser.parse_args()
 
     blockchain_app = BlockchainApp(app, args)
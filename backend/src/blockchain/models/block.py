@@ -5,12 +5,16 @@ import re
 from logging import getLogger
 from logging.config import fileConfig
 from os.path import dirname, join
+from threading import Event
 
 from pydantic import ValidationError
 
 from src.blockchain.models import utils
+from src.blockchain.models.merkle import merkle_root
+from src.blockchain.models.mining import MiningKernel, MiningPool
 from src.blockchain.schemas.block import BlockSchema
-from src.config.settings import BLOCK_MINING_RATE, GENESIS_BLOCK
+from src.cache import LRUCache
+from src.config.settings import BLOCK_CACHE_SIZE, BLOCK_LEGACY_VERSION, BLOCK_MINING_RATE, GENESIS_BLOCKS
 from src.exceptions import BlockError
 
 # Custom logger for block class module
@@ -25,10 +29,15 @@ class Block(object):
     ledger called blockchain.
     """
 
-    def __init__(self, index: int, timestamp: int, nonce: int,
-                 difficulty: int, data: list, last_hash: str, hash: str):
+    # Attributes digest of the already validated blocks by their hash
+    validated_cache = LRUCache(BLOCK_CACHE_SIZE)
+
+    def __init__(self, index: int, timestamp: int, nonce: int, difficulty: int, data: list,
+                 last_hash: str, hash: str, version: int = None, merkle_root: str = None):
         """
         Create a new Block instance.
+        Legacy blocks have no version and their hash covers all the attributes.
+        Versioned blocks hash a header committing to data via its merkle root.
 
         :param int index: block number in the blockchain.
         :param int timestamp: block creation UTC epoch datetime in milliseconds.
@@ -37,6 +46,8 @@ class Block(object):
         :param list data: transactions between the nodes in the network.
         :param str last_hash: previous block hash to link the blockchain.
         :param str hash: block data unique hash to prevent fraud.
+        :param int version: block header version (versioned blocks only).
+        :param str merkle_root: transactions data merkle root (versioned blocks only).
         """
         self.index = index
         self.timestamp = timestamp
@@ -45,6 +56,9 @@ class Block(object):
         self.data = data
         self.last_hash = last_hash
         self.hash = hash
+        if version is not None:
+            self.version = version
+            self.merkle_root = merkle_root
 
     def __str__(self):
         """
@@ -52,14 +66,7 @@ class Block(object):
 
         :return str: instance representation.
         """
-        return ('Block('
-            f'index: {self.index}, '
-            f'timestamp: {self.timestamp}, '
-            f'nonce: {self.nonce}, '
-            f'difficulty: {self.difficulty}, '
-            f'data: {self.data}, '
-            f'last_hash: {self.last_hash}, '
-            f'hash: {self.hash})')
+        return f'Block({", ".join([f"{key}: {value}" for key, value in self.info.items()])})'
 
     def __eq__(self, block: 'Block'):
         """
@@ -80,6 +87,28 @@ class Block(object):
         """
         return self.__dict__
 
+    @property
+    def header_version(self):
+        """
+        Get the block header version. Legacy blocks have no version attribute.
+
+        :return int: block header version.
+        """
+        return self.__dict__.get('version', BLOCK_LEGACY_VERSION)
+
+    @property
+    def header(self):
+        """
+        Get the block attributes covered by the block hash along with the hash.
+        For versioned blocks it excludes the transactions data.
+
+        :return dict: block header fields and hash.
+        """
+        info = self.info
+        header = {key: info.get(key) for key in utils.get_hash_fields(info)}
+        header['hash'] = self.hash
+        return header
+
     def serialize(self):
         """
         Stringify the Block instance to be able to send the block over
@@ -113,8 +142,8 @@ class Block(object):
         return cls(**block_info)
 
     @classmethod
-    def create(cls, index: int, timestamp: int, nonce: int,
-               difficulty: int, data: list, last_hash: str, hash: str):
+    def create(cls, index: int, timestamp: int, nonce: int, difficulty: int, data: list,
+               last_hash: str, hash: str, version: int = None, merkle_root: str = None):
         """
         Initialize a new class instance after performing attributes validations
         and checking block data integrity.
@@ -126,12 +155,15 @@ class Block(object):
         :param list data: transactions between the nodes in the network.
         :param str last_hash: previous block hash to link the blockchain.
         :param str hash: block data unique hash to prevent fraud.
+        :param int version: block header version (versioned blocks only).
+        :param str merkle_root: transactions data merkle root (versioned blocks only).
         :return Block: new class instance.
         :raise BlockError: on attributes validation error.
         """
         kwargs = locals().copy()
         kwargs.pop('cls')
-        block_info = {key: value for key, value in kwargs.items()}
+        block_info = {key: value for key, value in kwargs.items()
+                      if key not in utils.HEADER_ATTRIBUTES or version is not None}
         cls.is_valid_schema(block_info)
         return cls(**block_info)
 
@@ -151,22 +183,31 @@ class Block(object):
             raise BlockError(message)
 
     @classmethod
-    def genesis(cls):
+    def genesis(cls, version: int = BLOCK_LEGACY_VERSION):
         """
         Create the first block for the blockchain called the genesis block.
+        The genesis block version sets the blocks version for the whole network.
 
+        :param int version: network block version.
         :return Block: first block (genesis) in the blockchain.
+        :raise BlockError: on unknown block version.
         """
-        return cls(**GENESIS_BLOCK)
+        if version not in GENESIS_BLOCKS:
+            message = f'Unknown block version: {version}.'
+            logger.error(f'[Block] Genesis error. {message}')
+            raise BlockError(message)
+        return cls(**GENESIS_BLOCKS.get(version))
 
     @classmethod
-    def mine_block(cls, last_block: 'Block', data: list):
+    def prepare_block(cls, last_block: 'Block', data: list):
         """
-        Create a new Block instance to add to the blockchain.
+        Create the attributes of the next block to be mined, except the
+        unknown block hash. The new block keeps the last block version.
 
         :param Block last_block: current last block of the blockchain.
         :param list data: transactions between the nodes in the network.
-        :return Block: new block instance.
+        :return dict: block attributes template.
+        :raise BlockError: on transaction data encoding error.
         """
         block = {}
         block['index'] = last_block.index + 1
@@ -175,29 +216,55 @@ class Block(object):
         block['difficulty'] = cls.adjust_difficulty(last_block, block['timestamp'])
         block['data'] = data
         block['last_hash'] = last_block.hash
-        block = cls.proof_of_work(last_block, block)
+        if last_block.header_version != BLOCK_LEGACY_VERSION:
+            block['version'] = last_block.header_version
+            block['merkle_root'] = merkle_root(data)
+        return block
+
+    @classmethod
+    def mine_block(cls, last_block: 'Block', data: list,
+                   pool: MiningPool = None, event: Event = None):
+        """
+        Create a new Block instance to add to the blockchain.
+        The mined block schema is validated before it is returned, so that
+        malformed transactions data is never added to the local chain nor
+        broadcasted to the network.
+
+        :param Block last_block: current last block of the blockchain.
+        :param list data: transactions between the nodes in the network.
+        :param MiningPool pool: worker processes to mine the block in parallel with.
+        :param Event event: signal to abort mining before a solution is found.
+        :return Block: new block instance.
+        :raise BlockError: if mining is aborted.
+        """
+        block = cls.prepare_block(last_block, data)
+        block = cls.proof_of_work(last_block, block, pool, event)
+        if block is None:
+            message = f'Mining aborted for block on top of block {last_block.index}.'
+            logger.warning(f'[Block] Mining stopped. {message}')
+            raise BlockError(message)
         return cls.create(**block)
 
     @classmethod
-    def proof_of_work(cls, last_block: 'Block', block: dict):
+    def proof_of_work(cls, last_block: 'Block', block: dict,
+                      pool: MiningPool = None, event: Event = None):
         """
         Consensus protocol requiring certain computational effort to mine
         a new block to be able to add it to the blockchain. The solution
         is then verified by the entire network.
+        With a mining pool the nonce space is split between its
+        worker processes.
 
         :param Block last_block: current last block of the blockchain.
         :param dict block: block attributes except the unknown block hash.
-        :return dict: block data for the next block in the blockchain.
-        """
-        block_values = block.values()
-        hash = utils.hash_block(*block_values)
-        while not utils.hex_to_binary(hash).startswith('0' * block['difficulty']):
-            block['nonce'] += 1
-            block['timestamp'] = utils.get_utcnow_timestamp()
-            block['difficulty'] = cls.adjust_difficulty(last_block, block['timestamp'])
-            hash = utils.hash_block(*block_values)
-        block['hash'] = hash
-        return block
+        :param MiningPool pool: worker processes to mine the block in parallel with.
+        :param Event event: signal to abort mining before a solution is found.
+        :return dict: block data for the next block in the blockchain, None if aborted.
+        """
+        if pool is not None:
+            return pool.search(last_block, block, event)
+        kernel = MiningKernel(last_block, block)
+        return kernel.search(event=event)
 
     @staticmethod
     def adjust_difficulty(last_block: 'Block', timestamp: int):
@@ -213,16 +280,37 @@ class Block(object):
         return last_block.difficulty - 1 if last_block.difficulty > 1 else 1
 
     @classmethod
-    def is_valid(cls, last_block: 'Block', block: 'Block'):
+    def is_validated(cls, last_block: 'Block', block: 'Block'):
+        """
+        Check wether the block was already validated with the same attributes
+        on top of a block with the last block hash. The last block must have
+        been validated itself, e.g. by the chain validation walking forward.
+
+        :param Block last_block: already validated previous block.
+        :param Block block: candidate block.
+        :return bool: wether if the block is known to be valid.
+        """
+        digest = cls.validated_cache.get(block.hash)
+        if digest is None or block.last_hash != last_block.hash:
+            return False
+        return digest == utils.digest_block(block.info)
+
+    @classmethod
+    def is_valid(cls, last_block: 'Block', block: 'Block', cached: bool = False):
         """
         Perform checks to candidate block before adding it to the blockchain
         to prevent fraudulent insertions into the blockchain. Block attributes
         must fullfill certain conditions for the block to be valid.
+        With cache enabled, blocks already validated are skipped and the newly
+        validated ones are remembered, so the last block must be validated too.
 
         :param Block last_block: current last block in the blockchain.
         :param Block block: candidate block to add to the blockchain.
+        :param bool cached: wether to use the validated blocks cache.
         :raise BlockError: on invalid block attributes.
         """
+        if cached and cls.is_validated(last_block, block):
+            return
         cls.is_valid_schema(block.info)
 
         messages = []
@@ -230,6 +318,11 @@ class Block(object):
             message = (f'Block {last_block.index} hash "{last_block.hash}" and '
                        f'block {block.index} last_hash "{block.last_hash}" must match.')
             messages.append(message)
+        if last_block.header_version != block.header_version:
+            message = (f'Version must match between blocks: '
+                       f'block {last_block.index} version: {last_block.header_version}, '
+                       f'block {block.index} version: {block.header_version}.')
+            messages.append(message)
         if abs(last_block.difficulty - block.difficulty) > 1:
             message = (f'Difficulty must differ as much by 1 between blocks: '
                        f'block {last_block.index} difficulty: {last_block.difficulty}, '
@@ -240,3 +333,5 @@ class Block(object):
             for message in messages:
                 logger.error(f'[Block] Validation error. {message}')
             raise BlockError("\n".join(messages))
+        if cached:
+            cls.validated_cache.set(block.hash, utils.digest_block(block.info))
@@ -1,16 +1,20 @@
 # encoding: utf-8
 
 import re
+from bisect import bisect_left, bisect_right, insort
+from collections import ChainMap
 from logging import getLogger
 from logging.config import fileConfig
 from os.path import dirname, join
+from threading import Event, Lock
 
 from pydantic import ValidationError
 
 from src.blockchain.models.block import Block
+from src.blockchain.models.mining import MiningPool
 from src.blockchain.schemas.blockchain import BlockchainSchema
-from src.config.settings import MINING_REWARD_INPUT
-from src.exceptions import BlockchainError, TransactionError
+from src.config.settings import BLOCK_LEGACY_VERSION, MINING_REWARD_INPUT, MINING_WORKERS
+from src.exceptions import BlockError, BlockchainError, TransactionError
 
 # Custom logger for blockchain class module
 fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
@@ -22,13 +26,22 @@ class Blockchain(object):
     Distributed inmutable ledger of blocks.
     """
 
-    def __init__(self, chain: list = None):
+    def __init__(self, chain: list = None, mining_workers: int = MINING_WORKERS,
+                 version: int = BLOCK_LEGACY_VERSION):
         """
         Create a new Blockchain instance.
 
         :param list chain: chain of blocks.
+        :param int mining_workers: number of processes to mine new blocks with.
+        :param int version: network block version for a new chain genesis block.
         """
-        self.chain = chain or [Block.genesis()]
+        self.chain = chain or [Block.genesis(version)]
+        self.mining_workers = mining_workers
+        self._mining_pool = None
+        self._ledger = None
+        self.mining_events = set()
+        self.lock = Lock()
+        self.ledger_lock = Lock()
 
     def __str__(self):
         """
@@ -65,6 +78,132 @@ class Blockchain(object):
         """
         return len(self.chain)
 
+    @property
+    def mining_pool(self):
+        """
+        Get the worker processes pool to mine new blocks with. The pool is
+        kept between blocks and rebuilt only if the workers count changes.
+
+        :return MiningPool: mining pool, None to mine in the calling process.
+        """
+        if self.mining_workers <= 1:
+            return None
+        if self._mining_pool is None or self._mining_pool.workers != self.mining_workers:
+            if self._mining_pool is not None:
+                self._mining_pool.shutdown()
+            self._mining_pool = MiningPool(self.mining_workers)
+        return self._mining_pool
+
+    @property
+    def ledger(self):
+        """
+        Get the verified transactions data state of the local chain: the uuids
+        of its transactions and the balance of each address. The state is kept
+        between calls and only the blocks added since the last call are applied.
+
+        :return tuple: transaction uuids set and address balances dict.
+        """
+        with self.ledger_lock:
+            return self.sync_ledger()[:2]
+
+    @property
+    def info(self):
+        """
+        Get blockchain attributes in dict format.
+
+        :return dict: dictionary with the chain of blocks.
+        """
+        return {'chain': self.chain}
+
+    def sync_ledger(self):
+        """
+        Apply to the transactions data state the blocks added to the chain
+        since its last update. The state is rebuilt if the chain was replaced
+        outside set_valid_chain. Must be called holding the ledger lock.
+
+        :return tuple: transaction uuids set, address balances dict, address
+                       transactions history dict, sorted known addresses list
+                       and transaction locations dict.
+        """
+        length, last_hash, *state = self._ledger or (0, None, set(), {}, {}, [], {})
+        if length > self.length or (length and self.chain[length - 1].hash != last_hash):
+            length, state = 0, [set(), {}, {}, [], {}]
+        transaction_uuids, balances, history, addresses, locations = state
+        for position, block in enumerate(self.chain[length:], length):
+            self.update_ledger(transaction_uuids, balances, block)
+            self.update_history(history, addresses, locations, position, block)
+        self._ledger = (self.length, self.last_block.hash, transaction_uuids, balances, history, addresses, locations)
+        return transaction_uuids, balances, history, addresses, locations
+
+    def get_balance(self, address: str):
+        """
+        Get the current balance of an address from the ledger balances index,
+        where the last transaction sent by an address resets its balance to
+        the change output.
+
+        :param str address: wallet address.
+        :return int: address current balance.
+        """
+        with self.ledger_lock:
+            return self.sync_ledger()[1].get(address, 0)
+
+    def get_address_transactions(self, address: str, cursor: int = 0, limit: int = None):
+        """
+        Get a page of the transactions involving an address, as sender or
+        recipient, in chain order from the address transactions history index.
+
+        :param str address: wallet address.
+        :param int cursor: position of the first history entry to return.
+        :param int limit: maximum number of transactions, all if not set.
+        :return tuple: list of dicts with the block chain position and the
+                       transaction data, and the cursor of the next page (None if last).
+        """
+        with self.ledger_lock:
+            entries = self.sync_ledger()[2].get(address, [])
+            chain = self.chain
+        end = len(entries) if limit is None else cursor + limit
+        transactions = [{'block': position, 'transaction': chain[position].data[index]}
+                        for position, index in entries[cursor:end]]
+        return transactions, end if end < len(entries) else None
+
+    def get_addresses(self, prefix: str = '', cursor: str = None, limit: int = None):
+        """
+        Get a page of the known addresses in the chain transactions, sorted
+        and filtered by prefix, from the maintained known addresses index.
+
+        :param str prefix: start of the addresses to return.
+        :param str cursor: last address of the previous page.
+        :param int limit: maximum number of addresses, all if not set.
+        :return tuple: list of addresses and the cursor of the next page (None if last).
+        """
+        with self.ledger_lock:
+            addresses = self.sync_ledger()[3]
+            start = bisect_left(addresses, prefix)
+            if cursor is not None:
+                start = max(start, bisect_right(addresses, cursor))
+            end = len(addresses) if limit is None else start + limit
+            page = [address for address in addresses[start:end + 1] if address.startswith(prefix)]
+        if limit is not None and len(page) > limit:
+            return page[:limit], page[limit - 1]
+        return page, None
+
+    def find_transaction(self, uuid: int):
+        """
+        Find a transaction in the chain blocks by its unique identifier
+        from the maintained transaction locations index.
+
+        :param int uuid: transaction unique identifier.
+        :return tuple: block including the transaction and its position in
+                       the block data, None if not found.
+        """
+        with self.ledger_lock:
+            location = self.sync_ledger()[4].get(uuid)
+            chain = self.chain
+        if location is None:
+            return None
+        position, index = location
+        return chain[position], index
+
     def serialize(self):
         """
         Stringify the blocks in the chain.
@@ -112,37 +251,124 @@ class Blockchain(object):
             logger.error(f'[Blockchain] Validation error. {message}')
             raise BlockchainError(message)
 
-    def add_block(self, data: list):
+    def add_block(self, data: list, event: Event = None):
         """
         Mine new block and add it to the local blockchain. If new block
         is mined the candidate blockchain will be send over the network
-        to be validated for the rest of the nodes.
+        to be validated for the rest of the nodes. The other ongoing local
+        mining searches are aborted since they became stale.
 
         :param data list: transactions data to be added to the next block.
+        :param Event event: signal to abort mining, also set on chain replacement.
         :return Block: new mined block.
+        :raise BlockError: if mining is aborted.
+        :raise BlockchainError: if the last block changed while mining.
+        """
+        event = event or Event()
+        with self.lock:
+            last_block = self.last_block
+            self.mining_events.add(event)
+        try:
+            block = Block.mine_block(last_block, data, self.mining_pool, event)
+        finally:
+            with self.lock:
+                self.mining_events.discard(event)
+        with self.lock:
+            if self.last_block is not last_block:
+                message = f'Last block changed while mining block {block.index}.'
+                logger.error(f'[Blockchain] Mining error. {message}')
+                raise BlockchainError(message)
+            self.chain.append(block)
+            self.cancel_mining()
+            with self.ledger_lock:
+                self.sync_ledger()
+        return block
+
+    def append_block(self, block: Block):
+        """
+        Add a block mined outside the local blockchain (e.g. by an external
+        mining worker) after checking it can follow the current last block.
+        Ongoing local mining searches are aborted since they became stale.
+
+        :param Block block: candidate block to add to the blockchain.
+        :return Block: added block.
+        :raise BlockError: on invalid block attributes.
         """
-        block = Block.mine_block(self.last_block, data)
-        self.chain.append(block)
+        with self.lock:
+            Block.is_valid(self.last_block, block, cached=True)
+            self.chain.append(block)
+            self.cancel_mining()
+            with self.ledger_lock:
+                self.sync_ledger()
         return block
 
+    def cancel_mining(self):
+        """
+        Abort all the ongoing block mining searches on top of the local chain.
+        Must be called holding the blockchain lock, along with the chain update.
+        """
+        for event in list(self.mining_events):
+            event.set()
+
+    def get_fork_index(self, chain: list):
+        """
+        Get the position of the first block that differs between the local
+        chain and the candidate chain. Blocks are compared by hash starting
+        from the end, since each hash also links the whole previous chain.
+
+        :param list chain: candidate chain of blocks.
+        :return int: length of the prefix shared by both chains.
+        """
+        index = min(len(chain), self.length)
+        while index > 0 and getattr(chain[index - 1], 'hash', None) != self.chain[index - 1].hash:
+            index -= 1
+        return index
+
     def set_valid_chain(self, chain: list):
         """
         Set locally the valid chain among the network nodes.
         The valid chain is the longest one between all the properly formatted chains.
+        Only the candidate chain blocks after the prefix shared with the local chain
+        are validated, on top of the local blocks and transactions data state.
+        The replaced local blocks are removed from the validated blocks cache.
 
         :param chain list: candidate chain to become the valid one.
+        :return list: blocks added to the local chain after the shared prefix,
+                      empty if the candidate chain is rejected.
         """
-        try:
-            assert len(chain) > self.length
-            self.is_valid(chain)
-        except (AssertionError, BlockchainError) as err:
-            len_error = 'Incoming chain is not longer than local chain.'
-            message = err.message if hasattr(err, 'message') else len_error
-            logger.error(f'[Blockchain] Replace error. {message}')
-        else:
-            self.chain = chain
-            message = f'Blockchain length: {self.length}. Last block: {self.last_block}.'
-            logger.info(f'[Blockchain] Replace successfull. {message}')
+        with self.lock:
+            try:
+                assert len(chain) > self.length, 'Incoming chain is not longer than local chain.'
+                start = self.get_fork_index(chain)
+                assert start > 0, 'Incoming chain genesis block does not match local chain.'
+                if start == self.length:
+                    with self.ledger_lock:
+                        transaction_uuids, balances, history, addresses, locations = self.sync_ledger()
+                else:
+                    transaction_uuids, balances, history, addresses, locations = set(), {}, {}, [], {}
+                    for position, block in enumerate(self.chain[:start]):
+                        self.update_ledger(transaction_uuids, balances, block)
+                        self.update_history(history, addresses, locations, position, block)
+                chain = self.chain[:start] + chain[start:]
+                new_uuids, new_balances = self.is_valid_suffix(chain, start, transaction_uuids, balances)
+            except (AssertionError, BlockchainError) as err:
+                message = err.message if hasattr(err, 'message') else err.args[0]
+                logger.error(f'[Blockchain] Replace error. {message}')
+                return []
+            self.cancel_mining()
+            for block in self.chain[start:]:
+                Block.validated_cache.discard(block.hash)
+            with self.ledger_lock:
+                transaction_uuids.update(new_uuids)
+                balances.update(new_balances)
+                for position, block in enumerate(chain[start:], start):
+                    self.update_history(history, addresses, locations, position, block)
+                self.chain = chain
+                self._ledger = (self.length, self.last_block.hash, transaction_uuids, balances, history, addresses,
+                                locations)
+        message = f'Blockchain length: {self.length}. Last block: {self.last_block}.'
+        logger.info(f'[Blockchain] Replace successfull. {message}')
+        return chain[start:]
 
     @classmethod
     def is_valid(cls, chain: list):
@@ -155,33 +381,118 @@ class Blockchain(object):
         :raise BlockchainError: on chain validation error.
         """
         cls.is_valid_schema(chain)
-        cls.is_valid_transaction_data(chain)
+        cls.is_valid_transaction_data(chain, schema=False)
+
+    @classmethod
+    def is_valid_suffix(cls, chain: list, start: int, transaction_uuids: set = None, balances: dict = None):
+        """
+        Perform checks only to the candidate blockchain blocks from the given
+        position, on top of an already verified chain prefix.
+
+        :param list chain: candidate chain to become the distributed chain.
+        :param int start: position of the first block to check (after genesis).
+        :param set transaction_uuids: transaction uuids of the verified prefix.
+        :param dict balances: address balances of the verified prefix.
+        :return tuple: transaction uuids and address balances added by the checked blocks.
+        :raise BlockchainError: on chain validation error.
+        """
+        for last_block, block in zip(chain[start - 1:], chain[start:]):
+            try:
+                assert isinstance(block, Block)
+                Block.is_valid(last_block, block, cached=True)
+            except (AssertionError, BlockError) as err:
+                message = err.message if hasattr(err, 'message') else f'Invalid block: {block}.'
+                logger.error(f'[Blockchain] Validation error. {message}')
+                raise BlockchainError(message)
+        return cls.is_valid_transaction_data(chain[start:], transaction_uuids, balances, schema=False)
+
+    @staticmethod
+    def update_ledger(transaction_uuids: set, balances: dict, block: Block):
+        """
+        Apply the transactions data of a verified block to a chain state.
+
+        :param set transaction_uuids: transaction uuids in the chain.
+        :param dict balances: address balances in the chain.
+        :param Block block: block to apply.
+        """
+        from src.client.models.wallet import Wallet
+        for transaction_info in block.data:
+            transaction_uuids.add(transaction_info.get('uuid'))
+            Wallet.update_balances(balances, transaction_info)
+
+    @staticmethod
+    def update_history(history: dict, addresses: list, locations: dict, position: int, block: Block):
+        """
+        Add the transactions of a verified block to the history of each
+        address involved, as sender or recipient, and to the transaction
+        locations. Addresses seen for the first time are inserted in the
+        sorted known addresses. Entries refer to the block position in the
+        chain, not to its index attribute, which is not checked against
+        the position.
+
+        :param dict history: list of (block chain position, transaction data index) by address.
+        :param list addresses: sorted known addresses.
+        :param dict locations: (block chain position, transaction data index) by transaction uuid.
+        :param int position: block position in the chain.
+        :param Block block: block to apply.
+        """
+        for index, transaction_info in enumerate(block.data):
+            locations[transaction_info.get('uuid')] = (position, index)
+            involved = set(transaction_info.get('output'))
+            involved.add(transaction_info.get('input').get('address'))
+            involved.discard(MINING_REWARD_INPUT.get('address'))
+            for address in involved:
+                if address not in history:
+                    history[address] = []
+                    insort(addresses, address)
+                history[address].append((position, index))
 
     @staticmethod
-    def is_valid_transaction_data(chain: list):
+    def is_valid_transaction_data(chain: list, transaction_uuids: set = None, balances: dict = None,
+                                  schema: bool = True):
         """
         Perform checks to enforce the consistnecy of transactions data in the chain blocks:
         Each transaction mush only appear once in the chain, there can only be one mining
         reward per block and each transaction must be valid.
+        Historic balances are kept in a running map updated after each block, so the
+        chain is validated in a single pass. Signatures are verified beforehand in one
+        batch and the first invalid one is reported at its position in the chain.
+        Transactions attributes are validated once, unless the blocks schema validation
+        already did it. The chain may be a suffix on top of
+        a verified prefix, given its transaction uuids and address balances.
 
         :param list chain: blockchain chain of blocks.
+        :param set transaction_uuids: transaction uuids of the verified prefix.
+        :param dict balances: address balances of the verified prefix.
+        :param bool schema: wether to validate the transactions attributes.
+        :return tuple: transaction uuids and address balances added by the chain blocks.
         :raise BlockchainError: on invalid transaction data.
         """
         from src.client.models.transaction import Transaction
+        from src.client.models.verification import get_verification_pool
         from src.client.models.wallet import Wallet
+        transactions = [transaction_info for block in chain for transaction_info in block.data]
+        signatures = iter(get_verification_pool().verify_signatures(transactions))
+        known_uuids = transaction_uuids or set()
         transaction_uuids = set()
-        for index, block in enumerate(chain, start=0):
+        balances = ChainMap({}, balances or {})
+        for block in chain:
             has_reward = False
             for transaction_info in block.data:
                 try:
-                    transaction = Transaction.create(**transaction_info)
-                    Transaction.is_valid(transaction)
+                    if schema:
+                        transaction = Transaction.create(**transaction_info)
+                    else:
+                        transaction = Transaction(**transaction_info)
+                    Transaction.is_valid(transaction, verify=False, schema=False)
+                    if not next(signatures):
+                        raise TransactionError('Invalid signature verification.')
                 except TransactionError as err:
                     message = f'Invalid transaction. {err.message}.'
                     logger.error(f'[Blockchain] Validation error. {message}')
                     raise BlockchainError(message)
 
-                if transaction.uuid in transaction_uuids:
+                if transaction.uuid in transaction_uuids or transaction.uuid in known_uuids:
                     message = f'Repetead transaction uuid found: {transaction.uuid}.'
                     logger.error(f'[Blockchain] Validation error. {message}')
                     raise BlockchainError(message)
@@ -195,11 +506,12 @@ class Blockchain(object):
                         raise BlockchainError(message)
                     has_reward = True
                 else:
-                    historic_blockchain = Blockchain()
-                    historic_blockchain.chain = chain[:index]
-                    historic_balance = Wallet.get_balance(historic_blockchain, address)
+                    historic_balance = balances.get(address, 0)
                     amount = transaction.input.get('amount')
                     if historic_balance != amount:
                         message = f'Address {address} historic balance inconsistency: {historic_balance} ({amount}).'
                         logger.error(f'[Blockchain] Validation error. {message}')
                         raise BlockchainError(message)
+            for transaction_info in block.data:
+                Wallet.update_balances(balances, transaction_info)
+        return transaction_uuids, balances.maps[0]
@@ -0,0 +1,137 @@
+# encoding: utf-8
+
+import hashlib
+import json
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+
+from src.blockchain.models.utils import HEADER_FIELDS, hash_block, hex_to_binary
+from src.exceptions import BlockError
+
+# Custom logger for merkle tree module
+fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+# Domain separation prefixes for leaves and inner nodes
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+
+
+def hash_transaction(transaction: dict):
+    """
+    Create the merkle tree leaf hash for a transaction from its canonical
+    (sorted keys) json representation.
+
+    :param dict transaction: transaction data.
+    :return str: leaf hash of 64 hexadecimal characters.
+    :raise BlockError: on transaction data encoding error.
+    """
+    try:
+        stringified = json.dumps(transaction, sort_keys=True)
+    except (OverflowError, TypeError) as err:
+        message = f'Could not encode transaction data to generate merkle leaf. {err.args[0]}.'
+        logger.error(f'[Merkle] Stringify error. {message}')
+        raise BlockError(message)
+    return hashlib.sha256(LEAF_PREFIX + stringified.encode('utf-8')).hexdigest()
+
+
+def hash_nodes(left: str, right: str):
+    """
+    Create a merkle tree inner node hash from its two children hashes.
+
+    :param str left: left child hash.
+    :param str right: right child hash.
+    :return str: parent node hash of 64 hexadecimal characters.
+    """
+    return hashlib.sha256(NODE_PREFIX + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def merkle_root(data: list):
+    """
+    Calculate the merkle root of the block transactions. Each level pairs
+    adjacent nodes and an unpaired last node is promoted unchanged to the
+    next level. The root of no transactions is the hash of empty input.
+
+    :param list data: block transactions data.
+    :return str: merkle root of 64 hexadecimal characters.
+    :raise BlockError: on transaction data encoding error.
+    """
+    level = [hash_transaction(transaction) for transaction in data]
+    if not level:
+        return hashlib.sha256(b'').hexdigest()
+    while len(level) > 1:
+        parents = [hash_nodes(level[index], level[index + 1]) for index in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+    return level[0]
+
+
+def merkle_branch(data: list, index: int):
+    """
+    Get the merkle branch of a block transaction: the sibling hashes
+    needed to recalculate the merkle root from the transaction leaf.
+    Levels where the node has no sibling (promoted node) add no hash.
+
+    :param list data: block transactions data.
+    :param int index: position of the transaction in the block data.
+    :return list: sibling hashes from the leaf level up with their side.
+    :raise BlockError: on transaction data encoding error.
+    """
+    level = [hash_transaction(transaction) for transaction in data]
+    branch = []
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            branch.append({'hash': level[sibling], 'left': sibling < index})
+        parents = [hash_nodes(level[position], level[position + 1]) for position in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level, index = parents, index // 2
+    return branch
+
+
+def verify_branch(transaction: dict, branch: list, root: str):
+    """
+    Check a transaction is included in the block with the given merkle root.
+
+    :param dict transaction: transaction data.
+    :param list branch: transaction merkle branch.
+    :param str root: block transactions merkle root.
+    :return bool: wether if the branch leads from the transaction to the root.
+    """
+    try:
+        node = hash_transaction(transaction)
+        for sibling in branch:
+            if sibling.get('left'):
+                node = hash_nodes(sibling.get('hash'), node)
+            else:
+                node = hash_nodes(node, sibling.get('hash'))
+    except (AttributeError, BlockError, TypeError, ValueError):
+        return False
+    return node == root
+
+
+def verify_proof(transaction: dict, branch: list, header: dict):
+    """
+    Check a transaction inclusion proof against a versioned block header,
+    as light clients do without downloading the block transactions.
+    The header hash must match the header fields and meet its difficulty.
+
+    :param dict transaction: transaction data.
+    :param list branch: transaction merkle branch.
+    :param dict header: block header fields and hash.
+    :return bool: wether if the transaction is included in the block.
+    """
+    if header.get('version') is None or header.get('merkle_root') is None:
+        return False
+    try:
+        values = [header[key] for key in HEADER_FIELDS]
+        hash = hash_block(*values)
+        solved = hex_to_binary(hash).startswith('0' * header.get('difficulty'))
+    except (BlockError, KeyError, TypeError, ValueError):
+        return False
+    if hash != header.get('hash') or not solved:
+        return False
+    return verify_branch(transaction, branch, header.get('merkle_root'))
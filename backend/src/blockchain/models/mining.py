@@ -0,0 +1,257 @@
+# encoding: utf-8
+
+import hashlib
+import json
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+from threading import Event, Lock
+
+from src.blockchain.models.utils import get_hash_fields, get_utcnow_timestamp
+from src.config.settings import MINING_EVENT_CHECK_RATE, MINING_EVENT_POLL_RATE
+from src.exceptions import BlockError
+
+# Custom logger for mining kernel module
+fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+# Stop signal shared with the parallel mining worker processes
+_stop_event = None
+
+
+class MiningKernel(object):
+    """
+    Proof of work hashing kernel for a candidate block.
+    The block hash is the sha256 of the sorted stringified block attributes
+    (see utils.hash_block). Stringified json strings always sort before
+    numbers and json arrays or objects always sort after them, so the
+    invariant attributes (e.g. data and last_hash) are serialized only once:
+    the leading ones are absorbed into a reusable sha256 midstate and the
+    trailing ones are kept already encoded. Only the numeric attributes are
+    stringified and sorted for each nonce.
+    For versioned blocks only the fixed-size header is hashed.
+    """
+
+    VARIABLE_ATTRIBUTES = ('timestamp', 'nonce', 'difficulty')
+
+    def __init__(self, last_block: 'Block', block: dict):
+        """
+        Create a new MiningKernel instance.
+
+        :param Block last_block: current last block of the blockchain.
+        :param dict block: block attributes except the unknown block hash.
+        :raise BlockError: on block data encoding error.
+        """
+        self.last_block = last_block
+        self.block = block
+        head, numbers, tail = [], [], []
+        try:
+            for key in get_hash_fields(block):
+                if key in self.VARIABLE_ATTRIBUTES:
+                    continue
+                stringified = json.dumps(block.get(key))
+                if stringified[0] < '-':
+                    head.append(stringified)
+                elif stringified[0] > '9':
+                    tail.append(stringified)
+                else:
+                    numbers.append(stringified)
+        except (OverflowError, TypeError) as err:
+            message = f'Could not encode block data to generate hash. {err.args[0]}.'
+            logger.error(f'[MiningKernel] Stringify error. {message}')
+            raise BlockError(message)
+        self.numbers = numbers
+        self.midstate = hashlib.sha256(''.join(sorted(head)).encode('utf-8'))
+        self.tail = ''.join(sorted(tail)).encode('utf-8')
+        self.targets = {}
+
+    def get_target(self, difficulty: int):
+        """
+        Get the integer target a hash must be lower than to have at least
+        as many leading zero bits as the difficulty.
+
+        :param int difficulty: block mining difficulty.
+        :return int: hash upper bound (exclusive).
+        """
+        target = self.targets.get(difficulty)
+        if target is None:
+            target = 1 << (256 - difficulty) if difficulty <= 256 else 0
+            self.targets[difficulty] = target
+        return target
+
+    def digest(self, timestamp: int, nonce: int, difficulty: int):
+        """
+        Calculate the block hash digest for the given variable attributes.
+        The result is bit-identical to utils.hash_block over the block hash values.
+
+        :param int timestamp: block creation UTC epoch datetime in milliseconds.
+        :param int nonce: arbitrary number for cryptographic security.
+        :param int difficulty: block mining difficulty.
+        :return bytes: block hash raw digest.
+        """
+        numbers = self.numbers + [str(timestamp), str(nonce), str(difficulty)]
+        numbers.sort()
+        sha = self.midstate.copy()
+        sha.update(''.join(numbers).encode('utf-8'))
+        sha.update(self.tail)
+        return sha.digest()
+
+    def is_solved(self, digest: bytes, difficulty: int):
+        """
+        Check whether the hash digest meets the difficulty target.
+
+        :param bytes digest: block hash raw digest.
+        :param int difficulty: block mining difficulty.
+        :return bool: wether if the digest has the required leading zeros.
+        """
+        return int.from_bytes(digest, 'big') < self.get_target(difficulty)
+
+    def search_range(self, timestamp: int, difficulty: int, start: int, end: int, target: int = None):
+        """
+        Search a valid nonce within a nonce range keeping timestamp and
+        difficulty fixed, as external mining workers do for a given job.
+
+        :param int timestamp: block creation UTC epoch datetime in milliseconds.
+        :param int difficulty: block mining difficulty.
+        :param int start: first nonce of the range.
+        :param int end: last nonce of the range (exclusive).
+        :param int target: hash upper bound, defaults to the difficulty target.
+        :return tuple: found nonce and block hash, None if not found.
+        """
+        target = self.get_target(difficulty) if target is None else target
+        for nonce in range(start, end):
+            digest = self.digest(timestamp, nonce, difficulty)
+            if int.from_bytes(digest, 'big') < target:
+                return nonce, digest.hex()
+        return None
+
+    def search(self, step: int = 1, event: Event = None):
+        """
+        Increase the block nonce, refreshing timestamp and difficulty,
+        until the block hash meets the difficulty target.
+        The search can be partitioned between several kernels by starting
+        at different nonces with the same step, and aborted by setting
+        the provided event.
+
+        :param int step: nonce increment between attempts.
+        :param Event event: stop signal checked periodically during the search.
+        :return dict: block data with the found nonce and hash, None if stopped.
+        """
+        from src.blockchain.models.block import Block
+        block, last_block = self.block, self.last_block
+        digest = self.digest(block['timestamp'], block['nonce'], block['difficulty'])
+        attempts = 0
+        while not self.is_solved(digest, block['difficulty']):
+            attempts += 1
+            if event and attempts % MINING_EVENT_CHECK_RATE == 0 and event.is_set():
+                logger.info(f'[MiningKernel] Search stopped. Attempts: {attempts}.')
+                return None
+            block['nonce'] += step
+            block['timestamp'] = get_utcnow_timestamp()
+            block['difficulty'] = Block.adjust_difficulty(last_block, block['timestamp'])
+            digest = self.digest(block['timestamp'], block['nonce'], block['difficulty'])
+        block['hash'] = digest.hex()
+        return block
+
+
+class MiningPool(object):
+    """
+    Long-lived pool of worker processes to mine blocks in parallel.
+    The nonce space is split between the workers: each one searches the
+    nonces congruent to its number modulo the workers count. As soon as
+    one worker finds a valid hash, or the caller stop signal is set, all
+    of them are stopped. Worker processes are spawned (not forked) since
+    mining runs from threads of a process also running the event loop.
+    Searches on the same pool are serialized.
+    """
+
+    def __init__(self, workers: int):
+        """
+        Create a new MiningPool instance. Worker processes are started
+        on the first search.
+
+        :param int workers: number of worker processes.
+        """
+        self.workers = workers
+        self.context = multiprocessing.get_context('spawn')
+        self.stop_event = self.context.Event()
+        self.executor = None
+        self.lock = Lock()
+
+    def __str__(self):
+        """
+        Represent class instance via params string.
+
+        :return str: instance representation.
+        """
+        return f'MiningPool(workers: {self.workers}, started: {self.executor is not None})'
+
+    def search(self, last_block: 'Block', block: dict, event: Event = None):
+        """
+        Search the block nonce in parallel with all the pool workers.
+
+        :param Block last_block: current last block of the blockchain.
+        :param dict block: block attributes except the unknown block hash.
+        :param Event event: stop signal checked periodically during the search.
+        :return dict: block data with the found nonce and hash, None if stopped.
+        :raise BlockError: on block data encoding error.
+        """
+        with self.lock:
+            if event and event.is_set():
+                logger.info(f'[MiningPool] Search stopped. Workers: {self.workers}.')
+                return None
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(self.workers, mp_context=self.context,
+                                                    initializer=_set_stop_event,
+                                                    initargs=(self.stop_event,))
+            self.stop_event.clear()
+            futures = [self.executor.submit(_search, last_block, dict(block, nonce=block['nonce'] + offset),
+                                            self.workers) for offset in range(self.workers)]
+            try:
+                pending = futures
+                while pending:
+                    done, pending = wait(pending, MINING_EVENT_POLL_RATE, FIRST_COMPLETED)
+                    if event and event.is_set():
+                        logger.info(f'[MiningPool] Search stopped. Workers: {self.workers}.')
+                        return None
+                    for future in done:
+                        result = future.result()
+                        if result is not None:
+                            return result
+            finally:
+                self.stop_event.set()
+                wait(futures)
+
+    def shutdown(self):
+        """
+        Stop the pool worker processes.
+        """
+        self.stop_event.set()
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+def _set_stop_event(event: Event):
+    """
+    Share the stop signal with the worker process.
+
+    :param Event event: stop signal shared between worker processes.
+    """
+    global _stop_event
+    _stop_event = event
+
+
+def _search(last_block: 'Block', block: dict, step: int):
+    """
+    Worker process nonce search.
+
+    :param Block last_block: current last block of the blockchain.
+    :param dict block: block attributes with the worker starting nonce.
+    :param int step: nonce increment between attempts.
+    :return dict: block data with the found nonce and hash, None if stopped.
+    """
+    kernel = MiningKernel(last_block, block)
+    return kernel.search(step, _stop_event)
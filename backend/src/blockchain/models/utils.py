@@ -13,6 +13,11 @@ from src.exceptions import BlockError
 fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
 logger = getLogger(__name__)
 
+# Block attributes only present in versioned blocks
+HEADER_ATTRIBUTES = ('version', 'merkle_root')
+# Block attributes covered by the hash of versioned blocks
+HEADER_FIELDS = ('version', 'index', 'timestamp', 'nonce', 'difficulty', 'merkle_root', 'last_hash')
+
 
 def get_utcnow_timestamp():
     """
@@ -42,6 +47,49 @@ def hash_block(*args: tuple):
     return hashlib.sha256(joined.encode('utf-8')).hexdigest()
 
 
+def digest_block(block: dict):
+    """
+    Create a digest of all the block attributes, including the ones not
+    covered by the block hash, to compare blocks without keeping them.
+
+    :param dict block: block attributes.
+    :return str: block attributes sha256 hex digest.
+    :raise BlockError: on block data encoding error.
+    """
+    try:
+        stringified = json.dumps(block, sort_keys=True)
+    except (OverflowError, TypeError) as err:
+        message = f'Could not encode block data to generate digest. {err.args[0]}.'
+        logger.error(f'[Block] Stringify error. {message}')
+        raise BlockError(message)
+    return hashlib.sha256(stringified.encode('utf-8')).hexdigest()
+
+
+def get_hash_fields(block: dict):
+    """
+    Get the block attributes covered by the block hash. Legacy blocks
+    (without version) hash all their attributes, including transactions
+    data. Versioned blocks hash a fixed-size header that commits to the
+    transactions data through its merkle root.
+
+    :param dict block: block attributes.
+    :return list: names of the attributes to hash.
+    """
+    if block.get('version') is None:
+        return [key for key in block.keys() if key != 'hash' and key not in HEADER_ATTRIBUTES]
+    return list(HEADER_FIELDS)
+
+
+def get_hash_values(block: dict):
+    """
+    Get the block attributes values covered by the block hash.
+
+    :param dict block: block attributes.
+    :return list: values to hash with hash_block.
+    """
+    return [block.get(key) for key in get_hash_fields(block)]
+
+
 def hex_to_binary(hash: str):
     """
     Convert hexadecimal hash string to binary.
@@ -1,5 +1,6 @@
 # encoding: utf-8
 
+import json
 import math
 import re
 from logging import getLogger
@@ -9,8 +10,10 @@ from os.path import dirname, join
 from pydantic import BaseModel, ValidationError, validator
 from pydantic.fields import Field
 
-from src.blockchain.models.utils import hash_block, hex_to_binary
-from src.config.settings import BLOCK_HASH_LENGTH, BLOCK_TIMESTAMP_LENGTH
+from src.blockchain.models.merkle import merkle_root
+from src.blockchain.models.utils import get_hash_values, hash_block, hex_to_binary
+from src.config.settings import (BLOCK_HASH_LENGTH, BLOCK_HEADER_VERSION, BLOCK_MAX_BYTES,
+                                 BLOCK_MAX_TRANSACTIONS, BLOCK_TIMESTAMP_LENGTH)
 
 
 # Custom logger for block schema module
@@ -21,12 +24,16 @@ logger = getLogger(__name__)
 class BlockSchema(BaseModel):
     """
     Schema for definition and validation of block attributes.
+    Versioned blocks also include the header version and the
+    transactions data merkle root.
     """
+    version: int = None
     index: int
     timestamp: int
     nonce: int
     difficulty: int
     data: list
+    merkle_root: str = None
     last_hash: str
     hash: str
 
@@ -35,6 +42,25 @@ class BlockSchema(BaseModel):
         anystr_strip_whitespace = True
         validate_all = True
 
+    @validator('version')
+    def valid_version(cls, value: int):
+        """
+        Validate block header version value.
+
+        :param int value: provided version value.
+        :return int: validated version value.
+        :raise ValueError: if version is not a supported header version.
+        """
+        if value is None:
+            return value
+        try:
+            assert value == BLOCK_HEADER_VERSION
+        except AssertionError:
+            message = f'Invalid version: {value}.'
+            logger.error(f'[BlockSchema] Validation error. {message}')
+            raise ValueError(message)
+        return value
+
     @validator('index', 'nonce', 'difficulty')
     def valid_positive_integer(cls, value: int, field: Field):
         """
@@ -77,9 +103,14 @@ class BlockSchema(BaseModel):
 
         :param list value: provided data value.
         :return list: validated transactions list data.
-        :raise ValueError: if transaction data is invalid.
+        :raise ValueError: if transaction data is invalid or exceeds the block limits.
         """
         from src.client.schemas.transaction import TransactionSchema
+        size = sum([len(json.dumps(transaction_info)) for transaction_info in value])
+        if len(value) > BLOCK_MAX_TRANSACTIONS or size > BLOCK_MAX_BYTES:
+            message = f'Block data exceeds limits: {len(value)} transactions, {size} bytes.'
+            logger.error(f'[BlockSchema] Validation error. {message}')
+            raise ValueError(message)
         try:
             for transaction_info in value:
                 TransactionSchema(**transaction_info)
@@ -89,6 +120,28 @@ class BlockSchema(BaseModel):
             raise ValueError(message)
         return value
 
+    @validator('merkle_root')
+    def valid_merkle_root(cls, value: str, values: dict):
+        """
+        Validate transactions data merkle root value.
+
+        :param str value: provided merkle root value.
+        :param dict values: previous fields already validated.
+        :return str: validated merkle root value.
+        :raise ValueError: if merkle root does not match transactions data
+                           or is set for a legacy block.
+        """
+        if value is None and values.get('version') is None:
+            return value
+        try:
+            assert values.get('version') is not None
+            assert 'data' in values and value == merkle_root(values.get('data'))
+        except AssertionError:
+            message = f'Invalid merkle root: {value}.'
+            logger.error(f'[BlockSchema] Validation error. {message}')
+            raise ValueError(message)
+        return value
+
     @validator('last_hash', 'hash')
     def valid_hash(cls, value: str, values: dict, field: Field):
         """
@@ -107,8 +160,10 @@ class BlockSchema(BaseModel):
             raise ValueError(message)
         if field.alias == 'hash':
             try:
+                if values.get('version') is not None:
+                    assert values.get('merkle_root') is not None
                 assert hex_to_binary(value).startswith('0' * values.get('difficulty'))
-                assert value == hash_block(*values.values())
+                assert value == hash_block(*get_hash_values(values))
             except AssertionError:
                 message = f'Invalid hash: {value}.'
                 logger.error(f'[BlockSchema] Validation error. {message}')
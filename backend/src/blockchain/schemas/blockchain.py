@@ -7,6 +7,7 @@ from os.path import dirname, join
 from pydantic import BaseModel, validator
 
 from src.blockchain.models.block import Block
+from src.config.settings import GENESIS_BLOCKS
 from src.exceptions import BlockError
 
 # Custom logger for blockchain schema module
@@ -28,20 +29,22 @@ class BlockchainSchema(BaseModel):
     def valid_chain(cls, value: list):
         """
         Validate chain items values.
+        Blocks already validated by the node are not checked again.
 
         :param list value: provided chain value.
         :return list: validated chain value.
         :raise ValueError: on invalid block in chain.
         """
         genesis = last_block = value[0]
-        if not isinstance(genesis, Block) or genesis != Block.genesis():
+        genesis_blocks = [Block.genesis(version) for version in GENESIS_BLOCKS.keys()]
+        if not isinstance(genesis, Block) or genesis not in genesis_blocks:
             message = f'Invalid chain genesis block: {genesis}.'
             logger.error(f'[BlockchainSchema] Validation error. {message}')
             raise ValueError(message)
         for block in value[1:]:
             try:
                 assert isinstance(block, Block)
-                Block.is_valid(last_block, block)
+                Block.is_valid(last_block, block, cached=True)
             except (AssertionError, BlockError) as err:
                 message = err.message if hasattr(err, 'message') else f'Invalid block: {block}.'
                 logger.error(f'[BlockchainSchema] Validation error. {message}')
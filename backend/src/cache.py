@@ -0,0 +1,117 @@
+# encoding: utf-8
+
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache(object):
+    """
+    Bounded thread-safe mapping that evicts the least recently used
+    entries once its capacity is reached. Keeps hit and miss counters
+    of the lookups to measure its effectiveness.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Create a new LRUCache instance.
+
+        :param int capacity: maximum number of entries.
+        """
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = Lock()
+
+    def __str__(self):
+        """
+        Represent class instance via params string.
+
+        :return str: instance representation.
+        """
+        return ('LRUCache('
+            f'size: {self.size}, '
+            f'capacity: {self.capacity}, '
+            f'hits: {self.hits}, '
+            f'misses: {self.misses})')
+
+    def __contains__(self, key):
+        """
+        Check whether the key is cached without counting a lookup.
+
+        :param key: entry key.
+        :return bool: wether if the key is cached.
+        """
+        return key in self.entries
+
+    @property
+    def size(self):
+        """
+        Get the number of cached entries.
+
+        :return int: cached entries.
+        """
+        return len(self.entries)
+
+    @property
+    def info(self):
+        """
+        Get the cache metrics.
+
+        :return dict: size, capacity and lookup counters.
+        """
+        return {
+            'size': self.size,
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def get(self, key, default=None):
+        """
+        Look up an entry and mark it as the most recently used.
+
+        :param key: entry key.
+        :param default: value returned on cache miss.
+        :return: cached value or default.
+        """
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def set(self, key, value):
+        """
+        Store an entry, evicting the least recently used ones if full.
+
+        :param key: entry key.
+        :param value: entry value.
+        """
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def discard(self, key):
+        """
+        Remove an entry if cached.
+
+        :param key: entry key.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove all the entries and reset the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,168 @@
+# encoding: utf-8
+
+import json
+import os
+from collections import OrderedDict
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+from threading import Lock
+
+from src.client.models.transaction import Transaction
+from src.config.settings import POOL_JOURNAL_COMPACTION_MIN, POOL_JOURNAL_COMPACTION_RATIO
+from src.exceptions import TransactionError
+
+# Custom logger for pool journal class module
+fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+ADD = 'add'
+REMOVE = 'remove'
+
+
+class PoolJournal(object):
+    """
+    Append-only file of the transactions pool changes, one JSON record per
+    line, used to restore the unconfirmed transactions after a restart.
+    Added transactions and removed uuids are appended as they happen and the
+    file is compacted to a snapshot of the pool when the obsolete records
+    outgrow the pooled transactions.
+    """
+
+    def __init__(self, path: str, compaction_ratio: int = POOL_JOURNAL_COMPACTION_RATIO,
+                 compaction_min: int = POOL_JOURNAL_COMPACTION_MIN):
+        """
+        Create a new PoolJournal instance.
+
+        :param str path: journal file path.
+        :param int compaction_ratio: journal records per pooled transaction that trigger a compaction.
+        :param int compaction_min: minimum journal records before compacting.
+        """
+        self.path = path
+        self.compaction_ratio = compaction_ratio
+        self.compaction_min = compaction_min
+        self.records = 0
+        self.compactions = 0
+        self.file = None
+        self.lock = Lock()
+
+    def __str__(self):
+        """
+        Represent class instance via params string.
+
+        :return str: instance representation.
+        """
+        return ('PoolJournal('
+            f'path: {self.path}, '
+            f'records: {self.records}, '
+            f'compactions: {self.compactions})')
+
+    def load(self):
+        """
+        Replay the journal records to get the pooled transactions by arrival
+        order. A truncated or corrupted record, e.g. the last one written
+        before a crash, is skipped.
+
+        :return OrderedDict: transactions by uuid.
+        """
+        transactions = OrderedDict()
+        if not os.path.exists(self.path):
+            return transactions
+        with open(self.path) as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                    if record.get('op') == ADD:
+                        transaction = Transaction(**record.get('transaction'))
+                        transactions.pop(transaction.uuid, None)
+                        transactions[transaction.uuid] = transaction
+                    elif record.get('op') == REMOVE:
+                        transactions.pop(record.get('uuid'), None)
+                except (ValueError, TypeError, AttributeError, TransactionError) as err:
+                    message = f'Record skipped: {line.strip()}. {err}'
+                    logger.warning(f'[PoolJournal] Load error. {message}')
+        message = f'Transactions loaded: {len(transactions)}.'
+        logger.info(f'[PoolJournal] Journal loaded. {message}')
+        return transactions
+
+    def add(self, transaction: Transaction):
+        """
+        Append a transaction added to the pool.
+
+        :param Transaction transaction: added transaction.
+        """
+        self._append({'op': ADD, 'transaction': transaction.info})
+
+    def remove(self, uuid: int):
+        """
+        Append a transaction removed from the pool.
+
+        :param int uuid: removed transaction unique identifier.
+        """
+        self._append({'op': REMOVE, 'uuid': uuid})
+
+    def needs_compaction(self, size: int):
+        """
+        Check wether the journal records outgrow the pooled transactions.
+
+        :param int size: number of pooled transactions.
+        :return bool: wether if the journal should be compacted.
+        """
+        return self.records > max(self.compaction_min, self.compaction_ratio * size)
+
+    def compact(self, transactions: list):
+        """
+        Replace the journal with a snapshot of the pooled transactions.
+        The snapshot is written to a temporary file and atomically renamed.
+
+        :param list transactions: pooled transactions by arrival order.
+        """
+        temporary_path = f'{self.path}.tmp'
+        with self.lock:
+            self._close()
+            with open(temporary_path, 'w') as journal:
+                for transaction in transactions:
+                    journal.write(self._encode({'op': ADD, 'transaction': transaction.info}))
+            os.replace(temporary_path, self.path)
+            self.records = len(transactions)
+            self.compactions += 1
+        message = f'Transactions kept: {self.records}.'
+        logger.info(f'[PoolJournal] Journal compacted. {message}')
+
+    def close(self):
+        """
+        Close the journal file.
+        """
+        with self.lock:
+            self._close()
+
+    def _append(self, record: dict):
+        """
+        Write a record at the end of the journal and flush it.
+
+        :param dict record: pool change record.
+        """
+        with self.lock:
+            if self.file is None:
+                self.file = open(self.path, 'a')
+            self.file.write(self._encode(record))
+            self.file.flush()
+            self.records += 1
+
+    def _close(self):
+        """
+        Close the journal file if open. Must be called holding the lock.
+        """
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    @staticmethod
+    def _encode(record: dict):
+        """
+        Stringify a journal record as a single line.
+
+        :param dict record: pool change record.
+        :return str: record line.
+        """
+        return f'{json.dumps(record)}\n'
@@ -175,21 +175,26 @@ class Transaction(object):
             raise TransactionError(message)
 
     @staticmethod
-    def is_valid(transaction: Union[dict, 'Transaction']):
+    def is_valid(transaction: Union[dict, 'Transaction'], verify: bool = True, schema: bool = True):
         """
         Perform transaction logic validations.
 
         :param Transaction transaction: transaction instance to verify.
+        :param bool verify: wether to check the signature, skipped if already batch verified.
+        :param bool schema: wether to check the attributes, skipped if already validated.
         :raise TransactionError: on transaction validation error.
         """
         transaction = transaction if not isinstance(transaction, dict) else Transaction(**transaction)
-        Transaction.is_valid_schema(transaction.info)
+        if schema:
+            Transaction.is_valid_schema(transaction.info)
         if transaction.input.get('address') != MINING_REWARD_INPUT.get('address'):
             amount = sum(transaction.output.values())
             if not transaction.input.get('amount') == amount:
                 message = f'Invalid transaction amount: {amount}.'
                 logger.error(f'[Transaction] Validation error. {message}')
                 raise TransactionError(message)
+            if not verify:
+                return
             public_key = transaction.input.get('public_key')
             signature = transaction.input.get('signature')
             output = transaction.output
@@ -1,11 +1,19 @@
 # encoding: utf-8
 
+import heapq
+import time
 from logging import getLogger
 from logging.config import fileConfig
 from os.path import dirname, join
 
 from src.blockchain.models.blockchain import Blockchain
+from src.client.models.journal import PoolJournal
 from src.client.models.transaction import Transaction
+from src.client.models.verification import get_verification_pool
+from src.client.models.wallet import Wallet
+from src.config.settings import (BLOCK_MAX_BYTES, BLOCK_MAX_TRANSACTIONS, POOL_MAX_BYTES, POOL_MAX_TRANSACTIONS,
+                                 POOL_TRANSACTION_TTL)
+from src.exceptions import TransactionError
 
 # Custom logger for transaction pool class module
 fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
@@ -17,13 +25,40 @@ class TransactionsPool(object):
     Collection of unconfimed transactions.
     A set of transactions from the pool will be mined and added to the blockchain
     in each future block to confirm the transactions.
+    The pool is bounded by number of transactions and serialized bytes. Its
+    transactions are kept by arrival order and the oldest ones are evicted
+    when it is full. Transactions not mined within their time-to-live since
+    arrival are expired, using a heap of expiry times ordered by deadline.
+    Once restored from a journal, the pool changes are appended to it.
     """
 
-    def __init__(self, pool: dict = None):
+    def __init__(self, pool: dict = None, max_transactions: int = POOL_MAX_TRANSACTIONS,
+                 max_bytes: int = POOL_MAX_BYTES, ttl: float = POOL_TRANSACTION_TTL):
         """
         Create a new transactions pool instance.
+        The pooled transactions uuids are indexed by sender address.
+
+        :param dict pool: transactions by uuid.
+        :param int max_transactions: maximum number of transactions, unbounded if None.
+        :param int max_bytes: maximum serialized transactions bytes, unbounded if None.
+        :param float ttl: seconds a transaction is kept in the pool, never expired if None.
         """
         self.pool = pool or {}
+        self.max_transactions = max_transactions
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.senders = {}
+        self.sizes = {}
+        self.expiries = {}
+        self.timers = []
+        self.bytes = 0
+        self.journal = None
+        for transaction in self.pool.values():
+            self.index_transaction(transaction)
+        self.version = 0
+        self.evicted = 0
+        self.expired = 0
+        self.evict()
 
     def __str__(self):
         """
@@ -51,6 +86,50 @@ class TransactionsPool(object):
         """
         return list(map(lambda transaction: transaction.info, self.pool.values()))
 
+    @property
+    def info(self):
+        """
+        Get the transactions pool metrics.
+
+        :return dict: size, limits and eviction and expiry counters.
+        """
+        return {
+            'size': self.size,
+            'bytes': self.bytes,
+            'max_transactions': self.max_transactions,
+            'max_bytes': self.max_bytes,
+            'ttl': self.ttl,
+            'evicted': self.evicted,
+            'expired': self.expired
+        }
+
+    def get_block_data(self, wallet: Wallet, max_transactions: int = BLOCK_MAX_TRANSACTIONS,
+                       max_bytes: int = BLOCK_MAX_BYTES):
+        """
+        Build the transactions data of a new block template: the pool transactions
+        in priority order (oldest first) that fit in the block limits, and the
+        mining reward, which is always included and counts towards the limits.
+
+        :param Wallet wallet: miner wallet to receive the mining reward.
+        :param int max_transactions: maximum number of transactions per block.
+        :param int max_bytes: maximum serialized transactions bytes per block.
+        :return list: block transactions data.
+        """
+        self.expire()
+        reward = Transaction.reward_mining(wallet)
+        count = max_transactions - 1
+        budget = max_bytes - len(reward.serialize())
+        data = []
+        for uuid, transaction in self.pool.items():
+            if len(data) >= count:
+                break
+            size = self.sizes.get(uuid)
+            if size <= budget:
+                data.append(transaction.info)
+                budget -= size
+        data.append(reward.info)
+        return data
+
     def serialize(self):
         """
         Stringify the transactions in the pool.
@@ -73,39 +152,225 @@ class TransactionsPool(object):
 
     def get_transaction(self, address: str):
         """
-        Get a transaction from the pool.
+        Get a transaction from the pool by its sender address index.
+        With several transactions from the sender, the oldest one is returned.
 
         :param str address: sender wallet address.
         :return Transaction: found transaction if exists.
         """
-        for transaction in self.pool.values():
-            if transaction.input.get('address') == address:
-                message = f'Transaction found in the pool with sender address: {address}.'
-                logger.info(f'[TransactionsPool] Get transaction. {message}')
-                return transaction
+        uuids = self.senders.get(address)
+        if uuids:
+            message = f'Transaction found in the pool with sender address: {address}.'
+            logger.info(f'[TransactionsPool] Get transaction. {message}')
+            return self.pool.get(next(iter(uuids)))
         message = f'Transaction not found in the pool with sender address: {address}.'
         logger.warning(f'[TransactionsPool] Get transaction. {message}')
         return None
 
+    @property
+    def is_full(self):
+        """
+        Check wether the pool exceeds any of its limits.
+
+        :return bool: wether if the pool is over its limits.
+        """
+        if self.max_transactions is not None and self.size > self.max_transactions:
+            return True
+        return self.max_bytes is not None and self.bytes > self.max_bytes
+
     def add_transaction(self, transaction: Transaction):
         """
         Insert a new transaction to the pool of unconfirmed transactions.
+        An updated transaction is moved to the newest position. The oldest
+        transactions are evicted if the pool becomes full.
 
         :param Transaction transaction: transaction to add to the pool.
+        :return bool: wether if the transaction was added.
         """
+        self.expire()
+        if self.max_bytes is not None and len(transaction.serialize()) > self.max_bytes:
+            message = f'Transaction exceeds the pool size limit: {transaction}.'
+            logger.warning(f'[TransactionsPool] Add transaction. {message}')
+            return False
+        if transaction.uuid in self.pool:
+            self.remove_transaction(transaction.uuid)
         self.pool[transaction.uuid] = transaction
+        self.index_transaction(transaction)
+        if self.journal is not None:
+            self.journal.add(transaction)
+        self.version += 1
         message = f'New transaction added to the pool: {transaction}.'
         logger.info(f'[TransactionsPool] Add transaction. {message}')
+        self.evict()
+        self.compact_journal()
+        return True
+
+    def add_transactions(self, transactions: list):
+        """
+        Validate a batch of incoming transactions and insert the valid ones to the
+        pool of unconfirmed transactions.
+
+        :param list transactions: transactions to add to the pool.
+        :return list: transactions added to the pool.
+        """
+        valid = self.validate_transactions(transactions)
+        return [transaction for transaction in valid if self.add_transaction(transaction)]
+
+    @staticmethod
+    def validate_transactions(transactions: list):
+        """
+        Validate a batch of incoming transactions without modifying the pool,
+        so that it can run outside the event loop. Attributes are validated
+        for each transaction and signatures are verified in one batch.
+
+        :param list transactions: transactions to validate.
+        :return list: valid transactions.
+        """
+        signatures = get_verification_pool().verify_signatures([transaction.info for transaction in transactions])
+        valid = []
+        for transaction, signature in zip(transactions, signatures):
+            try:
+                Transaction.is_valid(transaction, verify=False)
+                if not signature:
+                    raise TransactionError('Invalid signature verification.')
+            except TransactionError as err:
+                message = f'Transaction rejected: {transaction}. {err.message}'
+                logger.warning(f'[TransactionsPool] Add transaction. {message}')
+                continue
+            valid.append(transaction)
+        return valid
 
     def clear_pool(self, blockchain: Blockchain):
         """
         Remove added transactions to the blockchain from the pool.
+        The whole chain is walked, use clear_blocks to remove only the
+        transactions of the blocks added since the last clear.
 
         :param Blockchain blockchain: network shared blockchain.
         """
-        for block in blockchain.chain:
+        self.clear_blocks(blockchain.chain)
+
+    def clear_blocks(self, blocks: list):
+        """
+        Remove from the pool the transactions of blocks newly added to the
+        blockchain, e.g. a mined block or the suffix of a replaced chain.
+
+        :param list blocks: blocks added to the blockchain.
+        """
+        for block in blocks:
             for transaction in block.data:
-                if transaction.get('uuid') in self.pool.keys():
-                    self.pool.pop(transaction.get('uuid'))
+                if self.remove_transaction(transaction.get('uuid')) is not None:
                     message = f'Transaction cleared from pool: {transaction}.'
                     logger.info(f'[TransactionsPool] Clear transaction. {message}')
+        self.compact_journal()
+
+    def remove_transaction(self, uuid: int):
+        """
+        Remove a transaction from the pool and from the sender address index.
+
+        :param int uuid: transaction unique identifier.
+        :return Transaction: removed transaction, None if not in the pool.
+        """
+        transaction = self.pool.pop(uuid, None)
+        if transaction is None:
+            return None
+        address = transaction.input.get('address')
+        uuids = self.senders.get(address, {})
+        uuids.pop(uuid, None)
+        if not uuids:
+            self.senders.pop(address, None)
+        self.bytes -= self.sizes.pop(uuid, 0)
+        self.expiries.pop(uuid, None)
+        if self.journal is not None:
+            self.journal.remove(uuid)
+        self.version += 1
+        return transaction
+
+    def index_transaction(self, transaction: Transaction):
+        """
+        Add a pooled transaction uuid to its sender address index, which
+        keeps the sender transactions in insertion order, and account for
+        its serialized size. Its expiry time is scheduled in the timers heap.
+
+        :param Transaction transaction: pooled transaction.
+        """
+        self.senders.setdefault(transaction.input.get('address'), {})[transaction.uuid] = None
+        self.sizes[transaction.uuid] = len(transaction.serialize())
+        self.bytes += self.sizes.get(transaction.uuid)
+        if self.ttl is not None:
+            expiry = time.monotonic() + self.ttl
+            self.expiries[transaction.uuid] = expiry
+            heapq.heappush(self.timers, (expiry, transaction.uuid))
+
+    def evict(self):
+        """
+        Remove the oldest transactions until the pool is within its limits.
+        """
+        while self.pool and self.is_full:
+            transaction = self.remove_transaction(next(iter(self.pool)))
+            self.evicted += 1
+            message = f'Transaction evicted from full pool: {transaction}.'
+            logger.warning(f'[TransactionsPool] Evict transaction. {message}')
+
+    def expire(self):
+        """
+        Remove the transactions whose time-to-live is over. Only the due timers
+        at the top of the heap are visited. Timers of removed or re-added
+        transactions are stale and skipped, and the heap is rebuilt when
+        stale timers outnumber the pooled transactions.
+
+        :return int: number of expired transactions.
+        """
+        now = time.monotonic()
+        expired = 0
+        while self.timers and self.timers[0][0] <= now:
+            expiry, uuid = heapq.heappop(self.timers)
+            if self.expiries.get(uuid) != expiry:
+                continue
+            transaction = self.remove_transaction(uuid)
+            expired += 1
+            message = f'Transaction expired from pool: {transaction}.'
+            logger.warning(f'[TransactionsPool] Expire transaction. {message}')
+        if len(self.timers) > 2 * len(self.expiries):
+            self.timers = [(expiry, uuid) for uuid, expiry in self.expiries.items()]
+            heapq.heapify(self.timers)
+        self.expired += expired
+        self.compact_journal()
+        return expired
+
+    def restore(self, journal: PoolJournal, blockchain: Blockchain = None):
+        """
+        Load the journaled transactions to the pool in bulk, skipping the ones
+        already added to the blockchain, and journal the later pool changes.
+        Loaded transactions are validated in one batch like the incoming ones,
+        since the journal file may be corrupted or edited. The journal is
+        compacted to the restored pool. Restored transactions start a new
+        time-to-live.
+
+        :param PoolJournal journal: pool changes journal.
+        :param Blockchain blockchain: local copy of the blockchain.
+        :return int: number of restored transactions.
+        """
+        transaction_uuids = blockchain.ledger[0] if blockchain is not None else set()
+        candidates = [transaction for uuid, transaction in journal.load().items()
+                      if uuid not in transaction_uuids and uuid not in self.pool]
+        restored = 0
+        for transaction in self.validate_transactions(candidates):
+            self.pool[transaction.uuid] = transaction
+            self.index_transaction(transaction)
+            restored += 1
+        self.version += 1
+        self.evict()
+        journal.compact(list(self.pool.values()))
+        self.journal = journal
+        message = f'Transactions restored: {restored}.'
+        logger.info(f'[TransactionsPool] Pool restored. {message}')
+        return restored
+
+    def compact_journal(self):
+        """
+        Rewrite the journal as a snapshot of the pool if its obsolete records
+        outgrow the pooled transactions.
+        """
+        if self.journal is not None and self.journal.needs_compaction(self.size):
+            self.journal.compact(list(self.pool.values()))
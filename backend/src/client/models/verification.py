@@ -0,0 +1,156 @@
+# encoding: utf-8
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from logging import getLogger
+from logging.config import fileConfig
+from os.path import dirname, join
+from threading import Lock
+
+from src.client.models.wallet import Wallet
+from src.config.settings import MINING_REWARD_INPUT, VERIFICATION_BATCH_SIZE, VERIFICATION_WORKERS
+from src.exceptions import TransactionError
+
+# Custom logger for signature verification module
+fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
+logger = getLogger(__name__)
+
+# Shared signature verification pool
+_verification_pool = None
+
+
+class VerificationPool(object):
+    """
+    Long-lived pool of worker processes to verify transaction signatures
+    in batches, e.g. for a block or a whole candidate chain. Batches not
+    larger than the batch size, or pools with a single worker, are
+    verified in the calling process. Worker processes are spawned on
+    the first parallel verification.
+    """
+
+    def __init__(self, workers: int = VERIFICATION_WORKERS, batch_size: int = VERIFICATION_BATCH_SIZE):
+        """
+        Create a new VerificationPool instance.
+
+        :param int workers: number of worker processes.
+        :param int batch_size: number of transactions verified per worker task.
+        """
+        self.workers = workers
+        self.batch_size = batch_size
+        self.executor = None
+        self.lock = Lock()
+
+    def __str__(self):
+        """
+        Represent class instance via params string.
+
+        :return str: instance representation.
+        """
+        return f'VerificationPool(workers: {self.workers}, started: {self.executor is not None})'
+
+    def verify_signatures(self, transactions: list):
+        """
+        Verify the signatures of the transactions. Mining rewards are not signed.
+        Signatures already in the wallet signature cache are not sent to the workers,
+        and the ones verified by the workers are added to it.
+
+        :param list transactions: transactions data.
+        :return list: wether if each transaction signature is valid.
+        """
+        if self.workers <= 1 or len(transactions) <= self.batch_size:
+            return _verify_batch(transactions)
+        signatures = [True] * len(transactions)
+        digests, pending = {}, []
+        for index, transaction in enumerate(transactions):
+            digest = _get_digest(transaction)
+            if digest is None or not Wallet.signature_cache.get(digest, False):
+                digests[index] = digest
+                pending.append(index)
+        batches = [[transactions[index] for index in pending[start:start + self.batch_size]]
+                   for start in range(0, len(pending), self.batch_size)]
+        with self.lock:
+            if self.executor is None:
+                context = multiprocessing.get_context('spawn')
+                self.executor = ProcessPoolExecutor(self.workers, mp_context=context)
+            results = self.executor.map(_verify_batch, batches)
+        for index, valid in zip(pending, [valid for batch in results for valid in batch]):
+            signatures[index] = valid
+            if valid and digests.get(index) is not None:
+                Wallet.signature_cache.set(digests.get(index), True)
+        return signatures
+
+    def verify(self, transactions: list):
+        """
+        Verify the signatures of the transactions and fail on the first
+        invalid one, as Transaction.is_valid does.
+
+        :param list transactions: transactions data.
+        :raise TransactionError: on the first invalid signature.
+        """
+        for transaction, valid in zip(transactions, self.verify_signatures(transactions)):
+            if not valid:
+                message = 'Invalid signature verification.'
+                logger.error(f'[VerificationPool] Validation error. {message} Transaction: {transaction}.')
+                raise TransactionError(message)
+
+    def shutdown(self):
+        """
+        Stop the pool worker processes.
+        """
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown()
+                self.executor = None
+
+
+def get_verification_pool(workers: int = None):
+    """
+    Get the signature verification pool shared by the node.
+
+    :param int workers: number of worker processes, rebuilds the pool if it differs.
+    :return VerificationPool: shared verification pool.
+    """
+    global _verification_pool
+    if _verification_pool is None:
+        _verification_pool = VerificationPool(workers or VERIFICATION_WORKERS)
+    elif workers is not None and workers != _verification_pool.workers:
+        _verification_pool.shutdown()
+        _verification_pool = VerificationPool(workers)
+    return _verification_pool
+
+
+def _get_digest(transaction: dict):
+    """
+    Get the signature cache key of a signed transaction.
+
+    :param dict transaction: transaction data.
+    :return str: signature digest, None for mining rewards or malformed transactions.
+    """
+    try:
+        input = transaction.get('input')
+        if input.get('address') == MINING_REWARD_INPUT.get('address'):
+            return None
+        return Wallet.signature_digest(input.get('public_key'), input.get('signature'), transaction.get('output'))
+    except AttributeError:
+        return None
+
+
+def _verify_batch(transactions: list):
+    """
+    Verify a batch of transaction signatures in the current process.
+    Malformed transactions are reported as invalid.
+
+    :param list transactions: transactions data.
+    :return list: wether if each transaction signature is valid.
+    """
+    results = []
+    for transaction in transactions:
+        try:
+            input = transaction.get('input')
+            if input.get('address') == MINING_REWARD_INPUT.get('address'):
+                results.append(True)
+                continue
+            results.append(Wallet.verify(input.get('public_key'), input.get('signature'), transaction.get('output')))
+        except Exception:
+            results.append(False)
+    return results
@@ -1,5 +1,6 @@
 # encoding: utf-8
 
+import hashlib
 import uuid
 from logging import getLogger
 from logging.config import fileConfig
@@ -14,7 +15,9 @@ from cryptography.hazmat.primitives.asymmetric.utils import (encode_dss_signatur
                                                              decode_dss_signature)
 
 from src.blockchain.models.blockchain import Blockchain
+from src.cache import LRUCache
 from src.client.models.utils import serialize
+from src.config.settings import PUBLIC_KEY_CACHE_SIZE, SIGNATURE_CACHE_SIZE
 
 # Custom logger for wallet class module
 fileConfig(join(dirname(dirname(dirname(__file__))), 'config', 'logging.cfg'))
@@ -28,6 +31,11 @@ class Wallet(object):
     allowes to make transactions.
     """
 
+    # Digests of the already verified valid signatures
+    signature_cache = LRUCache(SIGNATURE_CACHE_SIZE)
+    # Deserialized public keys by their PEM text
+    public_key_cache = LRUCache(PUBLIC_KEY_CACHE_SIZE)
+
     def __init__(self, blockchain: Blockchain = None):
         """
         Create a new wallet instance.
@@ -38,6 +46,7 @@ class Wallet(object):
         self.address = self.generate_address()
         self.private_key = self.generate_private_key()
         self.public_key = self.generate_public_key(self.private_key)
+        self._balance = None
 
     def __str__(self):
         """"
@@ -52,11 +61,19 @@ class Wallet(object):
     @property
     def balance(self):
         """
-        Get the balance for the wallet address.
+        Get the balance for the wallet address. The balance is kept as a
+        snapshot of the blockchain last block it was read at, so that the
+        several reads made to create and validate a transaction share it
+        until a new block is added or the chain is replaced.
 
         :return int: wallet address current available balance.
         """
-        return self.get_balance(self.blockchain, self.address)
+        if not self.blockchain:
+            return 0
+        last_hash = self.blockchain.last_block.hash
+        if self._balance is None or self._balance[0] is not self.blockchain or self._balance[1] != last_hash:
+            self._balance = (self.blockchain, last_hash, self.get_balance(self.blockchain, self.address))
+        return self._balance[2]
 
     @staticmethod
     def generate_address():
@@ -90,25 +107,63 @@ class Wallet(object):
             format=serialization.PublicFormat.SubjectPublicKeyInfo)
         return encoded_key.decode('utf-8')
 
+    @staticmethod
+    def load_public_key(public_key: str):
+        """
+        Deserialize a PEM public key. Parsed keys are cached since
+        active addresses sign many transactions.
+
+        :param str public_key: wallet public key.
+        :return EllipticCurvePublicKey: deserialized public key.
+        """
+        deserialized_key = Wallet.public_key_cache.get(public_key)
+        if deserialized_key is None:
+            encoded_key = public_key.encode('utf-8')
+            deserialized_key = serialization.load_pem_public_key(encoded_key, default_backend())
+            Wallet.public_key_cache.set(public_key, deserialized_key)
+        return deserialized_key
+
+    @staticmethod
+    def signature_digest(public_key: str, signature: tuple, data: dict):
+        """
+        Get the signature cache key: a digest of the public key, the signature
+        and the signed data exactly as serialized for verification.
+
+        :param str public_key: wallet public key.
+        :param tuple signature: data signature.
+        :param data: signed data.
+        :return str: hexadecimal digest, None for malformed values.
+        """
+        try:
+            stringified = '\n'.join([public_key, ','.join(map(str, signature)), serialize(data)])
+        except Exception:
+            return None
+        return hashlib.sha256(stringified.encode('utf-8')).hexdigest()
+
     @staticmethod
     def verify(public_key: str, signature: tuple, data: dict):
         """
         Verify a signature based on the original public key and data.
+        Valid signatures are cached so that they are verified only once.
 
         :param str public_key: wallet public key.
         :param tuple signature: data signature candidate.
         :param data: signed data to verify its signature.
         :return bool: wether if signature is valid or not.
         """
-        encoded_key = public_key.encode('utf-8')
+        digest = Wallet.signature_digest(public_key, signature, data)
+        if digest is not None and Wallet.signature_cache.get(digest, False):
+            return True
         encoded_sign = encode_dss_signature(*signature)
         encoded_data = serialize(data).encode('utf-8')
-        deserialized_key = serialization.load_pem_public_key(encoded_key, default_backend())
+        deserialized_key = Wallet.load_public_key(public_key)
         try:
             deserialized_key.verify(encoded_sign, encoded_data, ec.ECDSA(hashes.SHA256()))
         except InvalidSignature:
             logger.warning('[Wallet] Verification error. Invalid signature.')
             return False
+        if digest is not None:
+            Wallet.signature_cache.set(digest, True)
         return True
 
     @staticmethod
@@ -117,22 +172,34 @@ class Wallet(object):
         Get the balance for the wallet given address from all the transactions
         data in the blockchain. Thus the balance is calculated by adding the
         output values for the address since the most recent transaction by
-        that address.
+        that address. It is read from the blockchain balances index, which
+        is updated with each new block instead of scanning the chain.
 
         :param Blockchain blockchain: blockchain instance.
         :param str address: wallet address to calculate balance for.
         :return int: wallet address current available balance.
         """
-        balance = 0
         if not blockchain:
-            return balance
-        for block in blockchain.chain:
-            for transaction in block.data:
-                if transaction['input']['address'] == address:
-                    balance = transaction['output'][address]
-                elif address in transaction['output']:
-                    balance += transaction['output'][address]
-        return balance
+            return 0
+        return blockchain.get_balance(address)
+
+    @staticmethod
+    def update_balances(balances: dict, transaction: dict):
+        """
+        Apply a chain transaction to a running map of address balances,
+        following the same rules as get_balance: the sender balance is set
+        to its change output and the recipients outputs are added.
+
+        :param dict balances: current balance for each address.
+        :param dict transaction: transaction data in the blockchain.
+        :return dict: updated balances.
+        """
+        sender = transaction['input']['address']
+        for address, amount in transaction['output'].items():
+            if address != sender:
+                balances[address] = balances.get(address, 0) + amount
+        balances[sender] = transaction['output'].get(sender, 0)
+        return balances
 
     def sign(self, data: dict):
         """
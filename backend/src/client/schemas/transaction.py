@@ -157,11 +157,12 @@ class TransactionSchema(BaseModel):
         :return float: validated amount value.
         :raise ValueError: if exchange amount is less than sender balance.
         """
-        sender = values.get('sender', Wallet())
+        sender = values.get('sender')
+        balance = sender.balance if sender is not None else 0
         try:
-            assert sender.balance > value
+            assert balance > value
         except AssertionError:
-            message = f'Amount {value} exceeds wallet balance {sender.balance}.'
+            message = f'Amount {value} exceeds wallet balance {balance}.'
             logger.error(f'[TransactionSchema] Validation error. {message}')
             raise ValueError(message)
         return value
@@ -1,11 +1,17 @@
 # encoding: utf-8
 
-from src.blockchain.models.utils import hash_block
+from src.blockchain.models.merkle import merkle_root
+from src.blockchain.models.utils import get_hash_values, hash_block
 
 # Block
 BLOCK_HASH_LENGTH = 64
 BLOCK_MINING_RATE = 10 * 1000  # milliseconds (10 secs)
 BLOCK_TIMESTAMP_LENGTH = 13
+BLOCK_LEGACY_VERSION = 1  # legacy blocks, hash covers all attributes
+BLOCK_HEADER_VERSION = 2  # hash covers header with transactions merkle root
+BLOCK_CACHE_SIZE = 10000  # validated blocks
+BLOCK_MAX_TRANSACTIONS = 1000  # transactions per block, including the mining reward
+BLOCK_MAX_BYTES = 1024 * 1024  # serialized transactions bytes per block (1 MB)
 
 GENESIS_BLOCK = {
     'index': 0,
@@ -17,7 +23,39 @@ GENESIS_BLOCK = {
 }
 GENESIS_BLOCK['hash'] = hash_block(*GENESIS_BLOCK.values())
 
+GENESIS_HEADER_BLOCK = {
+    'index': 0,
+    'timestamp': 1,
+    'nonce': 0,
+    'difficulty': 1,
+    'data': [],
+    'last_hash': 'genesis_last_hash',
+    'version': BLOCK_HEADER_VERSION,
+    'merkle_root': merkle_root([])
+}
+GENESIS_HEADER_BLOCK['hash'] = hash_block(*get_hash_values(GENESIS_HEADER_BLOCK))
+
+GENESIS_BLOCKS = {
+    BLOCK_LEGACY_VERSION: GENESIS_BLOCK,
+    BLOCK_HEADER_VERSION: GENESIS_HEADER_BLOCK
+}
+
+# Mining
+MINING_EVENT_CHECK_RATE = 1000  # nonces between stop signal checks
+MINING_EVENT_POLL_RATE = 0.1  # seconds
+MINING_TEMPLATE_REFRESH_RATE = 1  # seconds
+MINING_WORKERS = 1  # processes (1 mines in the calling process)
+
+# Signature Verification
+PUBLIC_KEY_CACHE_SIZE = 1000  # deserialized public keys
+SIGNATURE_CACHE_SIZE = 10000  # verified signatures
+VERIFICATION_BATCH_SIZE = 100  # transactions per worker task
+VERIFICATION_WORKERS = 1  # processes (1 verifies in the calling process)
+
 # API Server
+API_PAGE_LIMIT = 100  # items per page by default
+API_MAX_PAGE_LIMIT = 1000  # items per page
+
 ORIGINS = [
     "http://localhost:3000",
 ]
@@ -30,6 +68,8 @@ CORS_MIDDLEWARE_PARAMS = {
 
 # P2P Server
 HEARTBEAT_RATE = 5  # seconds
+ADMISSION_DELAY = 0.005  # seconds to collect incoming transactions (5 ms)
+ADMISSION_BATCH_SIZE = 100  # transactions validated together
 
 NODE = 'node'
 CHAIN = 'chain'
@@ -42,6 +82,23 @@ CHANNELS = {
     TRANSACTION: 'transact'
 }
 
+# Work Server
+WORK_NONCE_RANGE = 100000  # nonces per job
+
+JOB = 'job'
+SUBMIT = 'submit'
+WORK_METHODS = {
+    JOB: 'job',
+    SUBMIT: 'submit'
+}
+
+# Transactions Pool
+POOL_MAX_TRANSACTIONS = 10000  # transactions
+POOL_MAX_BYTES = 10 * 1024 * 1024  # serialized transactions bytes (10 MB)
+POOL_TRANSACTION_TTL = 60 * 60  # seconds since arrival to the pool (1 hour)
+POOL_JOURNAL_COMPACTION_RATIO = 2  # journal records per pooled transaction
+POOL_JOURNAL_COMPACTION_MIN = 1000  # journal records
+
 # Transaction
 MINING_REWARD = 50
 MINING_REWARD_INPUT = {'address': '*--mining-reward--*'}
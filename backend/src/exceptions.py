@@ -41,6 +41,13 @@ class P2PServerError(BaseError):
     pass
 
 
+class WorkServerError(BaseError):
+    """
+    Handle exception for WorkServer and MiningWorker instances.
+    """
+    pass
+
+
 class WalletError(BaseError):
     """
     Handle exception for Wallet instances.
@@ -0,0 +1,88 @@
+# encoding: utf-8
+
+from aiounittest import async_test
+
+from src.app.admission import AdmissionQueue
+from src.blockchain.models.blockchain import Blockchain
+from src.client.models.transaction import Transaction
+from src.client.models.transactions_pool import TransactionsPool
+from src.client.models.wallet import Wallet
+from tests.unit.logging import LoggingMixin
+
+
+class AdmissionQueueTest(LoggingMixin):
+
+    def setUp(self):
+        self.blockchain = Blockchain()
+        self.wallet = Wallet(self.blockchain)
+        self.recipient = Wallet().address
+        self.transactions_pool = TransactionsPool()
+        self.admission = AdmissionQueue(self.blockchain, self.transactions_pool, delay=0, batch_size=2)
+
+    def _generate_transaction(self, amount: int = 1):
+        return Transaction(sender=self.wallet, recipient=self.recipient, amount=amount)
+
+    def test_admission_queue_string_representation(self):
+        attrs = ['queued', 'admitted', 'dropped']
+        self.assertTrue(all([attr in str(self.admission) for attr in attrs]))
+
+    @async_test
+    async def test_admission_queue_put(self):
+        transactions = [self._generate_transaction() for _ in range(3)]
+        for transaction in transactions:
+            task = self.admission.put(transaction)
+        self.assertEqual(self.admission.size, 3)
+        await task
+        self.assertEqual(self.admission.size, 0)
+        self.assertEqual(self.admission.admitted, 3)
+        self.assertEqual(list(self.transactions_pool.pool.keys()), [transaction.uuid for transaction in transactions])
+
+    @async_test
+    async def test_admission_queue_put_replaces_queued_transaction(self):
+        transaction = self._generate_transaction(amount=0)
+        self.admission.put(transaction)
+        updated = Transaction.deserialize(transaction.serialize())
+        updated.update(self.wallet, Wallet().address, 0)
+        await self.admission.put(updated)
+        self.assertEqual(self.admission.admitted, 1)
+        self.assertEqual(self.transactions_pool.pool.get(transaction.uuid).output, updated.output)
+
+    @async_test
+    async def test_admission_queue_put_full(self):
+        self.transactions_pool.max_transactions = 2
+        transactions = [self._generate_transaction() for _ in range(3)]
+        for transaction in transactions:
+            task = self.admission.put(transaction)
+        self.assertEqual(self.admission.size, 2)
+        self.assertEqual(self.admission.dropped, 1)
+        self.admission.put(transactions[0])
+        self.assertEqual(self.admission.size, 2)
+        await task
+        self.assertEqual(list(self.transactions_pool.pool.keys()), [transaction.uuid for transaction in transactions[:2]])
+
+    @async_test
+    async def test_admission_queue_admit_drops_invalid_transactions(self):
+        valid_transaction = self._generate_transaction()
+        invalid_transaction = self._generate_transaction()
+        invalid_transaction.input['signature'] = Wallet().sign(invalid_transaction.output)
+        added = await self.admission.admit([invalid_transaction, valid_transaction])
+        self.assertEqual(added, [valid_transaction])
+        self.assertEqual(self.admission.dropped, 1)
+        self.assertNotIn(invalid_transaction.uuid, self.transactions_pool.pool)
+
+    @async_test
+    async def test_admission_queue_admit_drops_duplicated_transactions(self):
+        transaction = self._generate_transaction()
+        self.transactions_pool.add_transaction(transaction)
+        duplicate = Transaction.deserialize(transaction.serialize())
+        added = await self.admission.admit([duplicate])
+        self.assertEqual(added, [])
+        self.assertEqual(self.admission.dropped, 1)
+
+    @async_test
+    async def test_admission_queue_admit_drops_confirmed_transactions(self):
+        transaction = self._generate_transaction()
+        self.blockchain.add_block([transaction.info])
+        added = await self.admission.admit([transaction])
+        self.assertEqual(added, [])
+        self.assertNotIn(transaction.uuid, self.transactions_pool.pool)
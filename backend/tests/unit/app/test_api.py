@@ -3,14 +3,20 @@
 import asyncio
 import random
 import uuid
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from starlette.testclient import TestClient
 
 from src.app.api import app
+from src.app.controllers import router
+from src.app.p2p_server import P2PServer
 from src.blockchain.models.block import Block
 from src.blockchain.models.blockchain import Blockchain
+from src.blockchain.models.merkle import verify_proof
+from src.client.models.transaction import Transaction
 from src.client.models.transactions_pool import TransactionsPool
+from src.config.settings import BLOCK_HEADER_VERSION
+from src.exceptions import BlockError
 from tests.unit.blockchain.utilities import BlockchainMixin
 from tests.unit.client.utilities import ClientMixin
 
@@ -40,19 +46,28 @@ class ApiTest(BlockchainMixin, ClientMixin):
         self.assertEqual(len(chain), app.blockchain.length)
 
     @patch('src.app.api.app.p2p_server.broadcast_chain')
-    @patch('src.app.api.app.transactions_pool.clear_pool')
-    def test_api_get_mine_block_route(self, mock_clear_pool, mock_broadcast_chain):
+    @patch('src.app.api.app.transactions_pool.clear_blocks')
+    def test_api_get_mine_block_route(self, mock_clear_blocks, mock_broadcast_chain):
         mock_broadcast_chain.return_value = asyncio.Future()
         mock_broadcast_chain.return_value.set_result(None)
-        mock_clear_pool.return_value = True
+        mock_clear_blocks.return_value = True
         response = self.client.get("/mine")
         self.assertTrue(mock_broadcast_chain.called)
-        self.assertTrue(mock_clear_pool.called)
+        self.assertTrue(mock_clear_blocks.called)
         self.assertEqual(response.status_code, 200)
         self.assertIn('block', response.json())
         block_info = response.json().get('block')
         self.assertEqual(Block.create(**block_info), app.blockchain.last_block)
 
+    @patch.object(Blockchain, 'add_block')
+    def test_api_get_mine_block_route_mining_aborted(self, mock_add_block):
+        err_message = 'Mining aborted'
+        mock_add_block.side_effect = Mock(side_effect=BlockError(err_message))
+        response = self.client.get("/mine")
+        self.assertTrue(mock_add_block.called)
+        self.assertEqual(response.status_code, 409)
+        self.assertIn(err_message, response.json().get('errors'))
+
     @patch('src.app.api.app.p2p_server.broadcast_transaction')
     @patch('src.client.models.transaction.Transaction.is_valid_schema')
     def test_api_post_transact_route(self, mock_is_valid_schema, mock_broadcast_transaction):
@@ -70,6 +85,33 @@ class ApiTest(BlockchainMixin, ClientMixin):
         self.assertTrue(all([key in transaction for key in ('uuid', 'output', 'input')]))
         self.assertEqual(transaction.get('output').get(recipient), amount)
 
+    @patch.object(P2PServer, 'broadcast_transaction')
+    @patch.object(TransactionsPool, 'add_transaction')
+    @patch('src.client.models.transaction.Transaction.is_valid_schema')
+    def test_api_post_transact_route_rejected(self, mock_is_valid_schema, mock_add_transaction,
+                                              mock_broadcast_transaction):
+        mock_is_valid_schema.return_value = True
+        mock_add_transaction.return_value = False
+        response = self.client.post("/transact", json={"recipient": uuid.uuid4().hex, "amount": 0})
+        self.assertTrue(mock_add_transaction.called)
+        self.assertFalse(mock_broadcast_transaction.called)
+        self.assertEqual(response.status_code, 413)
+        self.assertIn('errors', response.json())
+
+    @patch.object(P2PServer, 'broadcast_transaction')
+    @patch.object(TransactionsPool, 'add_transaction')
+    @patch.object(TransactionsPool, 'get_transaction')
+    def test_api_post_transact_route_update_rejected(self, mock_get_transaction, mock_add_transaction,
+                                                     mock_broadcast_transaction):
+        pooled = Transaction(sender=router.wallet, recipient=uuid.uuid4().hex, amount=0)
+        output = dict(pooled.output)
+        mock_get_transaction.return_value = pooled
+        mock_add_transaction.return_value = False
+        response = self.client.post("/transact", json={"recipient": uuid.uuid4().hex, "amount": 0})
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(pooled.output, output)
+        self.assertFalse(mock_broadcast_transaction.called)
+
     def test_api_get_balance_route(self):
         response = self.client.get("/balance")
         self.assertEqual(response.status_code, 200)
@@ -86,6 +128,36 @@ class ApiTest(BlockchainMixin, ClientMixin):
         self.assertIsInstance(addresses, list)
         self.assertTrue(all([uuid.UUID(hex=address) for address in addresses]))
 
+    def test_api_get_addresses_route_pagination(self):
+        with patch.object(router, '_blockchain', app.blockchain, create=True):
+            response = self.client.get("/addresses?limit=1")
+            self.assertEqual(response.status_code, 200)
+            addresses = response.json().get('addresses')
+            cursor = response.json().get('cursor')
+            self.assertEqual(addresses, [cursor])
+            prefix = cursor[:4]
+            response = self.client.get(f"/addresses?prefix={prefix}")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(cursor, response.json().get('addresses'))
+        self.assertTrue(all([address.startswith(prefix) for address in response.json().get('addresses')]))
+
+    def test_api_get_address_transactions_route(self):
+        transaction = app.blockchain.last_block.data[0]
+        address = transaction.get('input').get('address')
+        with patch.object(router, '_blockchain', app.blockchain, create=True):
+            response = self.client.get(f"/addresses/{address}/transactions?limit=1")
+        self.assertEqual(response.status_code, 200)
+        transactions = response.json().get('transactions')
+        self.assertEqual(len(transactions), 1)
+        self.assertEqual(transactions[0].get('block'), app.blockchain.last_block.index)
+        self.assertEqual(transactions[0].get('transaction').get('uuid'), transaction.get('uuid'))
+        self.assertIsNone(response.json().get('cursor'))
+
+    def test_api_get_address_transactions_route_invalid_limit(self):
+        response = self.client.get(f"/addresses/{uuid.uuid4().hex}/transactions?limit=0")
+        self.assertEqual(response.status_code, 422)
+        self.assertIn('errors', response.json())
+
     def test_api_get_transactions_route(self):
         response = self.client.get("/transactions")
         self.assertEqual(response.status_code, 200)
@@ -93,3 +165,52 @@ class ApiTest(BlockchainMixin, ClientMixin):
         transactions = response.json().get('transactions')
         self.assertIsInstance(transactions, list)
         self.assertTrue(all([isinstance(transaction, dict) for transaction in transactions]))
+
+    def test_api_get_transactions_pool_route(self):
+        response = self.client.get("/transactions/pool")
+        self.assertEqual(response.status_code, 200)
+        pool = response.json().get('pool')
+        self.assertIsInstance(pool.get('size'), int)
+        self.assertTrue(all([metric in pool for metric in ['bytes', 'ttl', 'evicted', 'expired']]))
+
+    def test_api_get_transaction_proof_route(self):
+        chain = [Block.genesis(BLOCK_HEADER_VERSION)]
+        data = [self._generate_transaction().info for _ in range(random.randint(2, 6))]
+        chain.append(Block.mine_block(chain[-1], data))
+        transaction = random.choice(data)
+        with patch.object(router, '_blockchain', Blockchain(chain), create=True):
+            response = self.client.get(f"/transactions/{transaction.get('uuid')}/proof")
+        self.assertEqual(response.status_code, 200)
+        proof = response.json()
+        self.assertNotIn('data', proof.get('header'))
+        self.assertTrue(verify_proof(transaction, proof.get('branch'), proof.get('header')))
+
+    def test_api_get_transaction_proof_route_legacy_block(self):
+        transaction = app.blockchain.last_block.data[0]
+        with patch.object(router, '_blockchain', app.blockchain, create=True):
+            response = self.client.get(f"/transactions/{transaction.get('uuid')}/proof")
+        self.assertEqual(response.status_code, 409)
+        self.assertIn('errors', response.json())
+
+    def test_api_get_transaction_proof_route_not_found(self):
+        response = self.client.get(f"/transactions/{uuid.uuid4().int}/proof")
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('errors', response.json())
+
+    def test_api_get_miner_route(self):
+        response = self.client.get("/miner")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('miner', response.json())
+        miner = response.json().get('miner')
+        self.assertTrue(all([key in miner for key in ('running', 'blocks_mined', 'templates', 'template')]))
+        self.assertFalse(miner.get('running'))
+
+    @patch('src.app.miner.MiningDaemon.stop')
+    def test_api_post_miner_stop_route(self, mock_stop):
+        future = asyncio.Future()
+        future.set_result(None)
+        mock_stop.return_value = future
+        response = self.client.post("/miner/stop")
+        self.assertTrue(mock_stop.called)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('miner', response.json())
@@ -0,0 +1,107 @@
+# encoding: utf-8
+
+import asyncio
+from threading import Event
+from unittest.mock import Mock, patch
+
+from aiounittest import async_test
+
+from src.app.miner import MiningDaemon
+from src.blockchain.models.blockchain import Blockchain
+from src.client.models.transactions_pool import TransactionsPool
+from src.client.models.wallet import Wallet
+from src.exceptions import BlockError
+from tests.unit.logging import LoggingMixin
+
+
+class MiningDaemonTest(LoggingMixin):
+
+    def setUp(self):
+        self.blockchain = Blockchain()
+        self.wallet = Wallet(self.blockchain)
+        self.transactions_pool = TransactionsPool()
+        self.p2p_server = Mock()
+        self.miner = MiningDaemon(self.blockchain, self.wallet, self.transactions_pool, self.p2p_server)
+
+    def _mock_broadcast_chain(self):
+        future = asyncio.Future()
+        future.set_result(None)
+        self.p2p_server.broadcast_chain.return_value = future
+
+    def test_mining_daemon_string_representation(self):
+        attrs = ['running', 'blocks mined', 'templates']
+        self.assertTrue(all([attr in str(self.miner) for attr in attrs]))
+
+    def test_mining_daemon_status_not_running(self):
+        status = self.miner.status
+        self.assertFalse(status.get('running'))
+        self.assertEqual(status.get('blocks_mined'), 0)
+        self.assertIsNone(status.get('template'))
+
+    def test_mining_daemon_refresh(self):
+        self.miner.event = Event()
+        self.miner.refresh()
+        self.assertTrue(self.miner.event.is_set())
+
+    @async_test
+    async def test_mining_daemon_mine_template(self):
+        self._mock_broadcast_chain()
+        await self.miner._mine_template()
+        self.assertEqual(self.miner.blocks_mined, 1)
+        self.assertEqual(self.blockchain.length, 2)
+        self.assertEqual(self.miner.template.get('index'), 1)
+        self.assertTrue(self.p2p_server.broadcast_chain.called)
+
+    @async_test
+    @patch.object(Blockchain, 'add_block')
+    async def test_mining_daemon_mine_template_discarded(self, mock_add_block):
+        mock_add_block.side_effect = Mock(side_effect=BlockError('Mining aborted'))
+        await self.miner._mine_template()
+        self.assertEqual(self.miner.blocks_mined, 0)
+        self.assertEqual(self.miner.templates, 1)
+        self.assertFalse(self.p2p_server.broadcast_chain.called)
+
+    @async_test
+    async def test_mining_daemon_start_and_stop(self):
+        self._mock_broadcast_chain()
+        self.miner.start()
+        self.assertTrue(self.miner.running)
+        while not self.miner.blocks_mined:
+            self._mock_broadcast_chain()
+            await asyncio.sleep(0.01)
+        await self.miner.stop()
+        self.assertFalse(self.miner.running)
+        self.assertGreater(self.blockchain.length, 1)
+
+    @async_test
+    @patch.object(Blockchain, 'add_block')
+    async def test_mining_daemon_stop_publishes_mined_block(self, mock_add_block):
+        self._mock_broadcast_chain()
+        mined, release = Event(), Event()
+        def add_block(data, event):
+            mined.set()
+            release.wait()
+            return self.blockchain.last_block
+        mock_add_block.side_effect = add_block
+        self.miner.start()
+        while not mined.is_set():
+            await asyncio.sleep(0.01)
+        stop = asyncio.ensure_future(self.miner.stop())
+        await asyncio.sleep(0.01)
+        release.set()
+        await stop
+        self.assertFalse(self.miner.running)
+        self.assertEqual(self.miner.blocks_mined, 1)
+        self.assertTrue(self.p2p_server.broadcast_chain.called)
+
+    @async_test
+    @patch('src.app.miner.MINING_TEMPLATE_REFRESH_RATE', 0.01)
+    @patch.object(Blockchain, 'add_block')
+    async def test_mining_daemon_mine_unexpected_error(self, mock_add_block):
+        mock_add_block.side_effect = Mock(side_effect=ValueError('Unexpected'))
+        self.miner.start()
+        while self.miner.templates < 2:
+            await asyncio.sleep(0.01)
+        self.assertTrue(self.miner.running)
+        await self.miner.stop()
+        self.assertFalse(self.miner.running)
@@ -0,0 +1,144 @@
+# encoding: utf-8
+
+import asyncio
+import random
+from unittest.mock import Mock
+
+from aiounittest import async_test
+
+from src.app.work_server import MiningWorker, WorkServer, decode, encode
+from src.blockchain.models.blockchain import Blockchain
+from src.blockchain.models.mining import MiningKernel
+from src.client.models.transactions_pool import TransactionsPool
+from src.client.models.wallet import Wallet
+from src.config.settings import BLOCK_HEADER_VERSION, WORK_NONCE_RANGE
+from src.exceptions import WorkServerError
+from tests.unit.app.utilities import NodesNetworkMixin
+
+
+class WorkServerTest(NodesNetworkMixin):
+
+    def setUp(self):
+        self.host = '127.0.0.1'
+        self.port = self._get_random_port() + 3000
+        self.blockchain = Blockchain()
+        self.wallet = Wallet(self.blockchain)
+        self.transactions_pool = TransactionsPool()
+        self.p2p_server = Mock()
+        self.work_server = WorkServer(self.blockchain, self.wallet, self.transactions_pool, self.p2p_server)
+        self.work_server.bind(self.host, self.port)
+
+    def _mock_broadcast_chain(self):
+        future = asyncio.Future()
+        future.set_result(None)
+        self.p2p_server.broadcast_chain.return_value = future
+
+    def _find_nonce(self, job: dict, valid: bool):
+        block = job.get('block')
+        kernel = MiningKernel(None, block)
+        for nonce in range(job.get('nonce_start'), job.get('nonce_end')):
+            digest = kernel.digest(block.get('timestamp'), nonce, block.get('difficulty'))
+            if kernel.is_solved(digest, block.get('difficulty')) == valid:
+                return nonce
+
+    def test_work_server_string_representation(self):
+        self.assertTrue(f'host: {self.host}' in str(self.work_server))
+        self.assertTrue(f'port: {self.port}' in str(self.work_server))
+
+    def test_work_server_encode_decode(self):
+        message = {'method': 'job', 'params': {'nonce': random.randint(0, 100)}}
+        line = encode(message)
+        self.assertTrue(line.endswith(b'\n'))
+        self.assertEqual(decode(line), message)
+
+    def test_work_server_decode_error(self):
+        with self.assertRaises(WorkServerError):
+            decode(b'{invalid json\n')
+
+    def test_work_server_get_job(self):
+        job = self.work_server.get_job()
+        next_job = self.work_server.get_job()
+        self.assertTrue(all([key in job for key in ('id', 'block', 'target', 'nonce_start', 'nonce_end')]))
+        self.assertEqual(job.get('id'), next_job.get('id'))
+        self.assertEqual(job.get('nonce_end') - job.get('nonce_start'), WORK_NONCE_RANGE)
+        self.assertEqual(job.get('nonce_end'), next_job.get('nonce_start'))
+        self.assertEqual(job.get('block').get('last_hash'), self.blockchain.last_block.hash)
+        self.assertEqual(len(job.get('block').get('data')), 1)
+
+    def test_work_server_get_job_stale(self):
+        job = self.work_server.get_job()
+        self.assertFalse(self.work_server.stale)
+        self.transactions_pool.version += 1
+        self.assertTrue(self.work_server.stale)
+        new_job = self.work_server.get_job()
+        self.assertNotEqual(job.get('id'), new_job.get('id'))
+        self.assertEqual(new_job.get('nonce_start'), 0)
+
+    @async_test
+    async def test_work_server_submit_valid_solution(self):
+        self._mock_broadcast_chain()
+        job = self.work_server.get_job()
+        block = await self.work_server.submit(job.get('id'), self._find_nonce(job, True))
+        self.assertEqual(self.blockchain.last_block, block)
+        self.assertEqual(self.work_server.accepted, 1)
+        self.assertTrue(self.p2p_server.broadcast_chain.called)
+        self.assertTrue(self.work_server.stale)
+
+    @async_test
+    async def test_work_server_submit_invalid_solution(self):
+        job = self.work_server.get_job()
+        with self.assertRaises(WorkServerError):
+            await self.work_server.submit(job.get('id'), self._find_nonce(job, False))
+        self.assertEqual(self.blockchain.length, 1)
+        self.assertEqual(self.work_server.rejected, 1)
+
+    @async_test
+    async def test_work_server_submit_stale_job(self):
+        job = self.work_server.get_job()
+        self.transactions_pool.version += 1
+        with self.assertRaises(WorkServerError):
+            await self.work_server.submit(job.get('id'), self._find_nonce(job, True))
+        self.assertEqual(self.blockchain.length, 1)
+
+    @async_test
+    async def test_work_server_submit_versioned_block(self):
+        self._mock_broadcast_chain()
+        self.blockchain.chain = [Blockchain(version=BLOCK_HEADER_VERSION).genesis]
+        job = self.work_server.get_job()
+        self.assertNotIn('data', job.get('block'))
+        self.assertIn('merkle_root', job.get('block'))
+        block = await self.work_server.submit(job.get('id'), self._find_nonce(job, True))
+        self.assertEqual(block.version, BLOCK_HEADER_VERSION)
+        self.assertEqual(self.blockchain.length, 2)
+
+    @async_test
+    async def test_work_server_unknown_method(self):
+        response = await self.work_server._message_handler(encode({'method': 'unknown'}))
+        self.assertIn('error', response)
+
+    @async_test
+    async def test_work_server_invalid_message(self):
+        response = await self.work_server._message_handler(encode([1]))
+        self.assertIn('error', response)
+
+    @async_test
+    async def test_work_server_invalid_params(self):
+        response = await self.work_server._message_handler(encode({'method': 'submit', 'params': [1]}))
+        self.assertIn('error', response)
+
+    def test_mining_worker_search(self):
+        job = self.work_server.get_job()
+        nonce = MiningWorker.search(job)
+        self.assertEqual(nonce, self._find_nonce(job, True))
+
+    @async_test
+    async def test_mining_worker_run(self):
+        self._mock_broadcast_chain()
+        await self.work_server.start()
+        worker = MiningWorker(self.host, self.port)
+        await worker.connect()
+        await worker.run(solutions=1)
+        worker.close()
+        self.work_server.close()
+        self.assertEqual(worker.accepted, 1)
+        self.assertEqual(self.blockchain.length, 2)
@@ -3,7 +3,9 @@
 from unittest.mock import Mock, patch
 
 from src.blockchain.models.block import Block
-from src.blockchain.models.utils import get_utcnow_timestamp
+from src.blockchain.models.merkle import merkle_root
+from src.blockchain.models.utils import digest_block, get_hash_values, get_utcnow_timestamp, hash_block
+from src.config.settings import BLOCK_HEADER_VERSION, BLOCK_LEGACY_VERSION, GENESIS_BLOCKS
 from src.exceptions import BlockError
 from tests.unit.blockchain.utilities import BlockMixin
 
@@ -63,6 +65,60 @@ class BlockTest(BlockMixin):
         for attribute in self.genesis_block.info.keys():
             self.assertIn(attribute, attributes)
 
+    def test_block_genesis_versions(self):
+        header_genesis_block = Block.genesis(BLOCK_HEADER_VERSION)
+        self.assertEqual(self.genesis_block.header_version, BLOCK_LEGACY_VERSION)
+        self.assertNotIn('version', self.genesis_block.info)
+        self.assertEqual(header_genesis_block.header_version, BLOCK_HEADER_VERSION)
+        self.assertEqual(header_genesis_block.merkle_root, merkle_root([]))
+        self.assertNotEqual(header_genesis_block, self.genesis_block)
+
+    def test_block_genesis_unknown_version(self):
+        with self.assertRaises(BlockError) as context:
+            Block.genesis(max(GENESIS_BLOCKS) + 1)
+        self.assertIn('Unknown block version', context.exception.message)
+
+    def test_block_prepare_block_legacy(self):
+        block = Block.prepare_block(self.first_block, self.second_block.data)
+        self.assertNotIn('version', block)
+        self.assertNotIn('merkle_root', block)
+
+    def test_block_mine_block_versioned(self):
+        genesis_block = Block.genesis(BLOCK_HEADER_VERSION)
+        data = [self._generate_transaction().info]
+        block = Block.mine_block(genesis_block, data)
+        self.assertEqual(block.version, BLOCK_HEADER_VERSION)
+        self.assertEqual(block.merkle_root, merkle_root(data))
+        self.assertEqual(block.hash, hash_block(*get_hash_values(block.info)))
+        self.assertNotEqual(block.hash, hash_block(*[value for key, value in block.info.items() if key != 'hash']))
+        Block.is_valid(genesis_block, block)
+
+    def test_block_mine_block_legacy_hash(self):
+        block = Block.mine_block(self.second_block, [self._generate_transaction().info])
+        self.assertEqual(block.hash, hash_block(*[value for key, value in block.info.items() if key != 'hash']))
+        Block.is_valid(self.second_block, block)
+
+    def test_block_is_valid_versioned_tampered_data(self):
+        genesis_block = Block.genesis(BLOCK_HEADER_VERSION)
+        block = Block.mine_block(genesis_block, [self._generate_transaction().info])
+        block.data = [self._generate_transaction().info]
+        with self.assertRaises(BlockError):
+            Block.is_valid(genesis_block, block)
+
+    def test_block_is_valid_version_mismatch(self):
+        genesis_block = Block.genesis(BLOCK_HEADER_VERSION)
+        block = Block.mine_block(genesis_block, [self._generate_transaction().info])
+        with self.assertRaises(BlockError) as err:
+            Block.is_valid(self.genesis_block, block)
+        self.assertIn('Version must match between blocks', err.exception.message)
+
+    def test_block_versioned_serialization(self):
+        genesis_block = Block.genesis(BLOCK_HEADER_VERSION)
+        block = Block.mine_block(genesis_block, [self._generate_transaction().info])
+        deserialized_block = Block.deserialize(block.serialize())
+        self.assertEqual(deserialized_block.merkle_root, block.merkle_root)
+        Block.is_valid(genesis_block, deserialized_block)
+
     @patch.object(Block, 'is_valid_schema')
     @patch.object(Block, 'proof_of_work')
     def test_block_mine_block(self, mock_proof_of_work, mock_is_valid_schema):
@@ -73,6 +129,12 @@ class BlockTest(BlockMixin):
         self.assertTrue(mock_proof_of_work.called)
         self.assertIsInstance(block, Block)
 
+    @patch.object(Block, 'proof_of_work')
+    def test_block_mine_block_invalid_data(self, mock_proof_of_work):
+        mock_proof_of_work.return_value = dict(self.block_info, data=[{'uuid': 'uuid'}])
+        with self.assertRaises(BlockError):
+            Block.mine_block(self.first_block, self.second_block.data)
+
     @patch.object(Block, 'is_valid_schema')
     @patch.object(Block, 'adjust_difficulty')
     def test_block_proof_of_work(self, mock_adjust_difficulty, mock_is_valid_schema):
@@ -101,6 +163,23 @@ class BlockTest(BlockMixin):
     def test_block_is_valid(self):
         Block.is_valid(self.first_block, self.second_block)
 
+    @patch.object(Block, 'is_valid_schema')
+    def test_block_is_valid_cached(self, mock_is_valid_schema):
+        Block.is_valid(self.first_block, self.second_block, cached=True)
+        Block.is_valid(self.first_block, self.second_block, cached=True)
+        self.assertEqual(mock_is_valid_schema.call_count, 1)
+        self.assertEqual(Block.validated_cache.get(self.second_block.hash), digest_block(self.second_block.info))
+
+    def test_block_is_valid_cached_tampered_block(self):
+        Block.is_valid(self.first_block, self.second_block, cached=True)
+        self.second_block.data = [self._generate_transaction().info]
+        with self.assertRaises(BlockError):
+            Block.is_valid(self.first_block, self.second_block, cached=True)
+
+    def test_block_is_valid_cached_other_last_block(self):
+        Block.is_valid(self.first_block, self.second_block, cached=True)
+        self.assertFalse(Block.is_validated(self.genesis_block, self.second_block))
+
     def test_block_is_valid_schema_validation_error(self):
         self.second_block.hash = '1nval1d ha57'
         with self.assertRaises(BlockError) as err:
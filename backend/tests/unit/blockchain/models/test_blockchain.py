@@ -1,13 +1,15 @@
 # encoding: utf-8
 
 import random
+from threading import Event
 from unittest.mock import Mock, patch
 
 from src.blockchain.models.block import Block
 from src.blockchain.models.blockchain import Blockchain
 from src.client.models.transaction import Transaction
 from src.client.models.wallet import Wallet
-from src.exceptions import BlockchainError
+from src.config.settings import BLOCK_HEADER_VERSION, MINING_REWARD, MINING_REWARD_INPUT
+from src.exceptions import BlockError, BlockchainError
 from tests.unit.blockchain.utilities import BlockchainMixin
 
 
@@ -48,6 +50,34 @@ class BlockchainTest(BlockchainMixin):
         self.blockchain.add_block(new_block.data)
         self.assertNotEqual(self.blockchain.length, self.chain_length)
 
+    def test_blockchain_info_property(self):
+        self.assertEqual(self.blockchain.info, {'chain': self.blockchain.chain})
+
+    def test_blockchain_find_transaction(self):
+        block = random.choice(self.blockchain.chain[1:])
+        block, index = self.blockchain.find_transaction(block.data[0].get('uuid'))
+        self.assertIn(block, self.blockchain.chain)
+        self.assertEqual(index, 0)
+        self.assertIsNone(self.blockchain.find_transaction(Transaction.generate_uuid()))
+
+    @patch.object(Blockchain, 'update_history', wraps=Blockchain.update_history)
+    def test_blockchain_find_transaction_index(self, mock_update_history):
+        self.blockchain.find_transaction(Transaction.generate_uuid())
+        mock_update_history.reset_mock()
+        block = self.blockchain.add_block([self._generate_transaction().info])
+        self.assertEqual(self.blockchain.find_transaction(block.data[0].get('uuid')), (block, 0))
+        self.assertEqual(mock_update_history.call_count, 1)
+
+    def test_set_valid_chain_fork_find_transaction(self):
+        uuid = self.blockchain.last_block.data[0].get('uuid')
+        fork_chain = self.valid_chain[:-1]
+        while len(fork_chain) <= self.blockchain.length:
+            fork_chain.append(self._generate_block(fork_chain[-1]))
+        self.blockchain.find_transaction(uuid)
+        self.blockchain.set_valid_chain(fork_chain)
+        self.assertIsNone(self.blockchain.find_transaction(uuid))
+        self.assertEqual(self.blockchain.find_transaction(fork_chain[-1].data[0].get('uuid')), (fork_chain[-1], 0))
+
     def test_blockchain_serialize(self):
         self.assertIsInstance(self.serialized, list)
         self.assertTrue(all([isinstance(block, str) for block in self.serialized]))
@@ -86,6 +116,73 @@ class BlockchainTest(BlockchainMixin):
         self.assertEqual(self.blockchain.length, self.chain_length + 1)
         self.assertFalse(self.blockchain.last_block == last_block)
 
+    def test_add_block_last_block_changed(self):
+        peer_block = self._generate_block(self.blockchain.last_block)
+        mine_block = Block.mine_block
+
+        def replace_chain_while_mining(*args):
+            self.blockchain.chain = self.valid_chain + [peer_block]
+            return mine_block(*args)
+
+        with patch.object(Block, 'mine_block', side_effect=replace_chain_while_mining):
+            with self.assertRaises(BlockchainError):
+                self.blockchain.add_block([])
+        self.assertTrue(self.blockchain.last_block == peer_block)
+
+    @patch.object(Block, 'proof_of_work')
+    def test_add_block_mining_aborted(self, mock_proof_of_work):
+        mock_proof_of_work.return_value = None
+        with self.assertRaises(BlockError):
+            self.blockchain.add_block([])
+        self.assertEqual(self.blockchain.length, self.chain_length)
+        self.assertFalse(self.blockchain.mining_events)
+
+    def test_add_block_cancel_mining(self):
+        competing_event = Event()
+        self.blockchain.mining_events.add(competing_event)
+        event = Event()
+        self.blockchain.add_block([], event)
+        self.assertTrue(competing_event.is_set())
+        self.assertFalse(event.is_set())
+
+    def test_append_block(self):
+        new_block = self._generate_block(self.blockchain.last_block)
+        self.blockchain.append_block(new_block)
+        self.assertEqual(self.blockchain.length, self.chain_length + 1)
+        self.assertTrue(self.blockchain.last_block == new_block)
+
+    def test_append_block_invalid(self):
+        new_block = self._generate_block(self.blockchain.chain[-2])
+        with self.assertRaises(BlockError):
+            self.blockchain.append_block(new_block)
+        self.assertEqual(self.blockchain.length, self.chain_length)
+
+    def test_blockchain_mining_pool_property(self):
+        self.assertIsNone(self.blockchain.mining_pool)
+        self.blockchain.mining_workers = 2
+        pool = self.blockchain.mining_pool
+        self.assertEqual(pool.workers, 2)
+        self.assertIs(self.blockchain.mining_pool, pool)
+        self.blockchain.mining_workers = 3
+        self.assertEqual(self.blockchain.mining_pool.workers, 3)
+        self.assertIsNot(self.blockchain.mining_pool, pool)
+
+    def test_cancel_mining(self):
+        events = [Event() for _ in range(random.randint(1, 5))]
+        self.blockchain.mining_events.update(events)
+        self.blockchain.cancel_mining()
+        self.assertTrue(all([event.is_set() for event in events]))
+
+    @patch.object(Blockchain, 'is_valid_suffix')
+    @patch.object(Blockchain, 'cancel_mining')
+    def test_set_valid_chain_cancel_mining(self, mock_cancel_mining, mock_is_valid_suffix):
+        mock_is_valid_suffix.return_value = (set(), {})
+        mock_cancel_mining.side_effect = lambda: self.assertTrue(self.blockchain.lock.locked())
+        longer_chain = self.valid_chain.copy()
+        self.blockchain.chain.pop()
+        self.blockchain.set_valid_chain(longer_chain)
+        self.assertTrue(mock_cancel_mining.called)
+
     @patch.object(Blockchain, 'is_valid')
     def test_set_valid_chain_shorter_chain(self, mock_is_valid):
         mock_is_valid.return_value = True
@@ -97,14 +194,14 @@ class BlockchainTest(BlockchainMixin):
         self.assertTrue(len(short_chain) < self.blockchain.length)
         self.assertEqual(self.blockchain.length, initial_length)
 
-    @patch.object(Blockchain, 'is_valid')
-    def test_set_valid_chain_longer_chain(self, mock_is_valid):
-        mock_is_valid.return_value = True
+    @patch.object(Blockchain, 'is_valid_suffix')
+    def test_set_valid_chain_longer_chain(self, mock_is_valid_suffix):
+        mock_is_valid_suffix.return_value = (set(), {})
         longer_chain = self.valid_chain.copy()
         self.blockchain.chain.pop()
         initial_length = self.blockchain.length
         self.blockchain.set_valid_chain(longer_chain)
-        self.assertTrue(mock_is_valid.called)
+        self.assertTrue(mock_is_valid_suffix.called)
         self.assertTrue(initial_length < len(longer_chain))
         self.assertTrue(initial_length < self.blockchain.length)
         self.assertEqual(self.blockchain.length, len(longer_chain))
@@ -118,6 +215,178 @@ class BlockchainTest(BlockchainMixin):
         self.assertTrue(initial_length < self.blockchain.length)
         self.assertEqual(self.blockchain.length, len(longer_chain))
 
+    @patch.object(Blockchain, 'is_valid_transaction_data', wraps=Blockchain.is_valid_transaction_data)
+    def test_set_valid_chain_only_new_blocks(self, mock_is_valid_transaction_data):
+        longer_chain = self.valid_chain.copy()
+        longer_chain.append(self._generate_block(longer_chain[-1]))
+        longer_chain.append(self._generate_block(longer_chain[-1]))
+        self.blockchain.ledger
+        self.blockchain.set_valid_chain(longer_chain)
+        self.assertEqual(self.blockchain.length, len(longer_chain))
+        self.assertEqual(mock_is_valid_transaction_data.call_args[0][0], longer_chain[-2:])
+        self.assertEqual(self.blockchain.ledger, Blockchain(longer_chain).ledger)
+
+    def test_set_valid_chain_fork(self):
+        fork_chain = self.valid_chain[:-2]
+        while len(fork_chain) <= self.blockchain.length:
+            fork_chain.append(self._generate_block(fork_chain[-1]))
+        blocks = self.blockchain.set_valid_chain(fork_chain)
+        self.assertEqual(blocks, fork_chain[len(self.valid_chain) - 2:])
+        self.assertEqual(self.blockchain.last_block, fork_chain[-1])
+        self.assertEqual(self.blockchain.ledger, Blockchain(fork_chain).ledger)
+
+    def test_set_valid_chain_fork_discards_replaced_blocks(self):
+        Blockchain.is_valid_schema(self.blockchain.chain)
+        replaced_blocks = self.blockchain.chain[-2:]
+        fork_chain = self.valid_chain[:-2]
+        while len(fork_chain) <= self.blockchain.length:
+            fork_chain.append(self._generate_block(fork_chain[-1]))
+        self.blockchain.set_valid_chain(fork_chain)
+        self.assertTrue(all([block.hash not in Block.validated_cache for block in replaced_blocks]))
+        self.assertIn(fork_chain[-1].hash, Block.validated_cache)
+
+    def test_set_valid_chain_invalid_suffix(self):
+        longer_chain = self.valid_chain.copy()
+        block = self._generate_block(longer_chain[-1])
+        block.hash = '0' * 64
+        longer_chain.append(block)
+        local_chain = self.blockchain.chain.copy()
+        self.assertEqual(self.blockchain.set_valid_chain(longer_chain), [])
+        self.assertEqual(self.blockchain.chain, local_chain)
+
+    def test_set_valid_chain_repeated_transaction(self):
+        longer_chain = self.valid_chain.copy()
+        data = [longer_chain[1].data[0]]
+        with patch.object(Block, 'is_valid', return_value=None):
+            longer_chain.append(self._generate_block(longer_chain[-1]))
+            longer_chain[-1].data = data
+            self.blockchain.set_valid_chain(longer_chain)
+        self.assertEqual(self.blockchain.length, len(self.valid_chain))
+
+    def test_blockchain_ledger(self):
+        transaction_uuids, balances = self.blockchain.ledger
+        uuids = {transaction.get('uuid') for block in self.blockchain.chain for transaction in block.data}
+        self.assertEqual(transaction_uuids, uuids)
+        for address in balances:
+            if address != MINING_REWARD_INPUT.get('address'):
+                self.assertEqual(balances.get(address), Wallet.get_balance(self.blockchain, address))
+        self.blockchain.chain.append(self._generate_block(self.blockchain.last_block))
+        transaction_uuids, balances = self.blockchain.ledger
+        self.assertIn(self.blockchain.last_block.data[0].get('uuid'), transaction_uuids)
+
+    def test_blockchain_get_balance(self):
+        wallet = Wallet(self.blockchain)
+        self.assertEqual(self.blockchain.get_balance(wallet.address), 0)
+        self.blockchain.add_block([Transaction.reward_mining(wallet).info])
+        self.assertEqual(self.blockchain.get_balance(wallet.address), MINING_REWARD)
+        recipient = Wallet().address
+        transaction = Transaction(sender=wallet, recipient=recipient, amount=10)
+        self.blockchain.add_block([transaction.info, Transaction.reward_mining(wallet).info])
+        self.assertEqual(self.blockchain.get_balance(wallet.address), 2 * MINING_REWARD - 10)
+        self.assertEqual(self.blockchain.get_balance(recipient), 10)
+
+    @patch.object(Blockchain, 'update_ledger', wraps=Blockchain.update_ledger)
+    def test_blockchain_get_balance_incremental(self, mock_update_ledger):
+        wallet = Wallet(self.blockchain)
+        self.blockchain.get_balance(wallet.address)
+        mock_update_ledger.reset_mock()
+        self.blockchain.add_block([Transaction.reward_mining(wallet).info])
+        self.assertEqual(self.blockchain.get_balance(wallet.address), MINING_REWARD)
+        self.assertEqual(mock_update_ledger.call_count, 1)
+
+    def test_blockchain_get_address_transactions(self):
+        wallet = Wallet(self.blockchain)
+        recipient = Wallet().address
+        self.blockchain.add_block([Transaction.reward_mining(wallet).info])
+        transaction = Transaction(sender=wallet, recipient=recipient, amount=10)
+        self.blockchain.add_block([transaction.info])
+        transactions, cursor = self.blockchain.get_address_transactions(wallet.address)
+        self.assertEqual([item.get('block') for item in transactions], [self.chain_length, self.chain_length + 1])
+        self.assertEqual(transactions[-1].get('transaction'), transaction.info)
+        self.assertIsNone(cursor)
+        transactions, cursor = self.blockchain.get_address_transactions(recipient)
+        self.assertEqual([item.get('transaction') for item in transactions], [transaction.info])
+
+    def test_blockchain_get_address_transactions_pagination(self):
+        wallet = Wallet(self.blockchain)
+        for _ in range(5):
+            self.blockchain.add_block([Transaction.reward_mining(wallet).info])
+        transactions, cursor = self.blockchain.get_address_transactions(wallet.address, 0, 2)
+        self.assertEqual(len(transactions), 2)
+        self.assertEqual(cursor, 2)
+        transactions, cursor = self.blockchain.get_address_transactions(wallet.address, 4, 2)
+        self.assertEqual(len(transactions), 1)
+        self.assertIsNone(cursor)
+        transactions, cursor = self.blockchain.get_address_transactions(Wallet().address, 0, 2)
+        self.assertEqual(transactions, [])
+        self.assertIsNone(cursor)
+
+    def test_blockchain_get_addresses(self):
+        addresses = {address for block in self.blockchain.chain for transaction in block.data
+                     for address in transaction.get('output')}
+        page, cursor = self.blockchain.get_addresses()
+        self.assertEqual(page, sorted(addresses))
+        self.assertIsNone(cursor)
+
+    def test_blockchain_get_addresses_pagination(self):
+        addresses, _ = self.blockchain.get_addresses()
+        page, cursor = self.blockchain.get_addresses(limit=2)
+        self.assertEqual(page, addresses[:2])
+        self.assertEqual(cursor, addresses[1])
+        page, cursor = self.blockchain.get_addresses(cursor=cursor, limit=len(addresses))
+        self.assertEqual(page, addresses[2:])
+        self.assertIsNone(cursor)
+
+    def test_blockchain_get_addresses_prefix(self):
+        wallet = Wallet(self.blockchain)
+        self.blockchain.add_block([Transaction.reward_mining(wallet).info])
+        prefix = wallet.address[:2]
+        addresses, _ = self.blockchain.get_addresses()
+        page, cursor = self.blockchain.get_addresses(prefix=prefix)
+        self.assertIn(wallet.address, page)
+        self.assertEqual(page, [address for address in addresses if address.startswith(prefix)])
+        self.assertEqual(self.blockchain.get_addresses(prefix='z'), ([], None))
+
+    def test_set_valid_chain_fork_address_transactions(self):
+        address = self.blockchain.last_block.data[0].get('input').get('address')
+        fork_chain = self.valid_chain[:-1]
+        while len(fork_chain) <= self.blockchain.length:
+            fork_chain.append(self._generate_block(fork_chain[-1]))
+        self.blockchain.get_address_transactions(address)
+        self.blockchain.set_valid_chain(fork_chain)
+        self.assertEqual(self.blockchain.get_address_transactions(address), ([], None))
+        self.assertNotIn(address, self.blockchain.get_addresses()[0])
+        for block in fork_chain[-2:]:
+            transaction = block.data[0]
+            transactions, _ = self.blockchain.get_address_transactions(transaction.get('input').get('address'))
+            self.assertEqual(transactions, [{'block': block.index, 'transaction': transaction}])
+
+    def test_set_valid_chain_block_index_mismatch_address_transactions(self):
+        blockchain = Blockchain()
+        wallet = Wallet(blockchain)
+        genesis = blockchain.genesis
+        last_block = Block(**dict(genesis.info, index=998))
+        block = Block.mine_block(last_block, [Transaction.reward_mining(wallet).info])
+        self.assertEqual(blockchain.set_valid_chain([genesis, block]), [block])
+        transactions, cursor = blockchain.get_address_transactions(wallet.address)
+        self.assertEqual(transactions, [{'block': 1, 'transaction': block.data[0]}])
+        self.assertIsNone(cursor)
+
+    def test_set_valid_chain_genesis_mismatch(self):
+        chain = [Block.genesis(BLOCK_HEADER_VERSION)]
+        while len(chain) <= self.blockchain.length:
+            chain.append(self._generate_block(chain[-1]))
+        local_chain = self.blockchain.chain
+        self.blockchain.set_valid_chain(chain)
+        self.assertIs(self.blockchain.chain, local_chain)
+
+    def test_blockchain_versioned_genesis(self):
+        blockchain = Blockchain(version=BLOCK_HEADER_VERSION)
+        self.assertEqual(blockchain.genesis.header_version, BLOCK_HEADER_VERSION)
+        block = blockchain.add_block([self._generate_transaction().info])
+        self.assertEqual(block.version, BLOCK_HEADER_VERSION)
+        Blockchain.is_valid(blockchain.chain)
+
     def test_set_valid_chain_invalid(self):
         initial_length = self.blockchain.length
         err_message = '[Blockchain] Validation error.'
@@ -170,6 +439,39 @@ class BlockchainTest(BlockchainMixin):
             self.assertIsInstance(err, BlockchainError)
             self.assertIn(err_message, err.message)
 
+    @patch.object(Transaction, 'is_valid_schema', wraps=Transaction.is_valid_schema)
+    def test_blockchain_is_valid_single_schema_pass(self, mock_is_valid_schema):
+        Blockchain.is_valid(self.valid_chain)
+        self.assertFalse(mock_is_valid_schema.called)
+        Blockchain.is_valid_transaction_data(self.valid_chain)
+        transactions = sum([len(block.data) for block in self.valid_chain])
+        self.assertEqual(mock_is_valid_schema.call_count, transactions)
+
+    def test_blockchain_is_valid_transaction_data_invalid_schema_skipped(self):
+        invalid_transaction = self._generate_transaction().info
+        invalid_transaction['uuid'] = -1
+        self.blockchain.chain[-1].data.append(invalid_transaction)
+        Blockchain.is_valid_transaction_data(self.blockchain.chain, schema=False)
+        with self.assertRaises(BlockchainError):
+            Blockchain.is_valid_transaction_data(self.blockchain.chain)
+        with self.assertRaises(BlockchainError):
+            Blockchain.is_valid(self.blockchain.chain)
+
+    def test_blockchain_is_valid_transaction_data_spent_balance(self):
+        wallet = Wallet(self.blockchain)
+        for _ in range(3):
+            transaction = Transaction(sender=wallet, recipient=Wallet().address, amount=random.randint(1, 10))
+            self.blockchain.add_block([transaction.info, Transaction.reward_mining(wallet).info])
+        Blockchain.is_valid_transaction_data(self.blockchain.chain)
+
+    def test_blockchain_is_valid_transaction_data_same_block_balance(self):
+        wallet = Wallet(self.blockchain)
+        self.blockchain.add_block([Transaction.reward_mining(wallet).info])
+        transaction = Transaction(sender=wallet, recipient=Wallet().address, amount=1)
+        self.blockchain.chain[-1].data.append(transaction.info)
+        with self.assertRaises(BlockchainError):
+            Blockchain.is_valid_transaction_data(self.blockchain.chain)
+
     def test_blockchain_is_valid_transaction_invalid_historic_balance(self):
         wallet = Wallet()
         invalid_transaction = self._generate_transaction(wallet)
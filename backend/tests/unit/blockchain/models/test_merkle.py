@@ -0,0 +1,77 @@
+# encoding: utf-8
+
+import hashlib
+import random
+
+from src.blockchain.models import merkle
+from src.blockchain.models.block import Block
+from src.config.settings import BLOCK_HEADER_VERSION
+from src.exceptions import BlockError
+from tests.unit.blockchain.utilities import BlockMixin
+
+
+class MerkleTest(BlockMixin):
+
+    def setUp(self):
+        super(MerkleTest, self).setUp()
+        self.data = [self._generate_transaction().info for _ in range(random.randint(3, 9))]
+
+    def test_hash_transaction_sorted_keys(self):
+        transaction = self.data[0]
+        reversed_transaction = dict(reversed(list(transaction.items())))
+        self.assertEqual(merkle.hash_transaction(transaction), merkle.hash_transaction(reversed_transaction))
+
+    def test_hash_transaction_invalid_data(self):
+        with self.assertRaises(BlockError):
+            merkle.hash_transaction({'id': object()})
+
+    def test_hash_nodes_domain_separation(self):
+        leaf = merkle.hash_transaction(self.data[0])
+        self.assertNotEqual(merkle.hash_nodes(leaf, leaf), merkle.hash_transaction([leaf, leaf]))
+        self.assertNotEqual(merkle.hash_nodes(leaf, leaf), hashlib.sha256(bytes.fromhex(leaf * 2)).hexdigest())
+
+    def test_merkle_root_empty_data(self):
+        self.assertEqual(merkle.merkle_root([]), hashlib.sha256(b'').hexdigest())
+
+    def test_merkle_root_single_transaction(self):
+        self.assertEqual(merkle.merkle_root(self.data[:1]), merkle.hash_transaction(self.data[0]))
+
+    def test_merkle_root_odd_node_promoted(self):
+        leaves = [merkle.hash_transaction(transaction) for transaction in self.data[:3]]
+        expected = merkle.hash_nodes(merkle.hash_nodes(leaves[0], leaves[1]), leaves[2])
+        self.assertEqual(merkle.merkle_root(self.data[:3]), expected)
+
+    def test_merkle_root_data_changes(self):
+        root = merkle.merkle_root(self.data)
+        self.assertNotEqual(root, merkle.merkle_root(list(reversed(self.data))))
+        self.assertNotEqual(root, merkle.merkle_root(self.data[:-1]))
+
+    def test_merkle_branch_verify_all_positions(self):
+        root = merkle.merkle_root(self.data)
+        for index, transaction in enumerate(self.data):
+            branch = merkle.merkle_branch(self.data, index)
+            self.assertLessEqual(len(branch), len(self.data).bit_length())
+            self.assertTrue(merkle.verify_branch(transaction, branch, root))
+
+    def test_merkle_branch_single_transaction(self):
+        self.assertEqual(merkle.merkle_branch(self.data[:1], 0), [])
+        self.assertTrue(merkle.verify_branch(self.data[0], [], merkle.merkle_root(self.data[:1])))
+
+    def test_verify_branch_wrong_transaction(self):
+        root = merkle.merkle_root(self.data)
+        branch = merkle.merkle_branch(self.data, 0)
+        self.assertFalse(merkle.verify_branch(self.data[1], branch, root))
+        self.assertFalse(merkle.verify_branch(self.data[0], [{'hash': 'n0t h3x'}], root))
+
+    def test_verify_proof(self):
+        block = Block.mine_block(Block.genesis(BLOCK_HEADER_VERSION), self.data)
+        index = random.randrange(len(self.data))
+        branch = merkle.merkle_branch(block.data, index)
+        self.assertTrue(merkle.verify_proof(self.data[index], branch, block.header))
+
+    def test_verify_proof_tampered_header(self):
+        block = Block.mine_block(Block.genesis(BLOCK_HEADER_VERSION), self.data)
+        branch = merkle.merkle_branch(block.data, 0)
+        header = dict(block.header, merkle_root=merkle.merkle_root(self.data[:1]))
+        self.assertFalse(merkle.verify_proof(self.data[0], [], header))
+        self.assertFalse(merkle.verify_proof(self.data[0], branch, dict(block.header, version=None)))
@@ -0,0 +1,130 @@
+# encoding: utf-8
+
+import random
+from threading import Event
+from unittest.mock import Mock, patch
+
+from src.blockchain.models.block import Block
+from src.blockchain.models.mining import MiningKernel, MiningPool
+from src.blockchain.models.utils import get_utcnow_timestamp, hash_block, hex_to_binary
+from src.exceptions import BlockError
+from tests.unit.blockchain.utilities import BlockMixin
+
+
+class MiningKernelTest(BlockMixin):
+
+    def setUp(self):
+        super(MiningKernelTest, self).setUp()
+        self.last_block = self._generate_block(self._get_genesis_block())
+        data = [self._generate_transaction().info for _ in range(random.randint(1, 10))]
+        self.block = {
+            'index': self.last_block.index + 1,
+            'timestamp': get_utcnow_timestamp(),
+            'nonce': 0,
+            'difficulty': self.last_block.difficulty,
+            'data': data,
+            'last_hash': self.last_block.hash
+        }
+        self.kernel = MiningKernel(self.last_block, self.block)
+
+    def test_mining_kernel_digest_matches_hash_block(self):
+        for _ in range(10):
+            timestamp = get_utcnow_timestamp() + random.randint(0, 10 ** 6)
+            nonce = random.randint(0, 10 ** 9)
+            difficulty = random.randint(1, 20)
+            block = dict(self.block, timestamp=timestamp, nonce=nonce, difficulty=difficulty)
+            digest = self.kernel.digest(timestamp, nonce, difficulty)
+            self.assertEqual(digest.hex(), hash_block(*block.values()))
+
+    def test_mining_kernel_is_solved_matches_leading_zeros(self):
+        for nonce in range(100):
+            difficulty = random.randint(0, 8)
+            digest = self.kernel.digest(self.block['timestamp'], nonce, difficulty)
+            leading_zeros = hex_to_binary(digest.hex()).startswith('0' * difficulty)
+            self.assertEqual(self.kernel.is_solved(digest, difficulty), leading_zeros)
+
+    def test_mining_kernel_get_target(self):
+        self.assertEqual(self.kernel.get_target(0), 1 << 256)
+        self.assertEqual(self.kernel.get_target(8), 1 << 248)
+        self.assertEqual(self.kernel.get_target(257), 0)
+
+    def test_mining_kernel_search_range(self):
+        timestamp, difficulty = self.block['timestamp'], 4
+        nonce, hash = self.kernel.search_range(timestamp, difficulty, 0, 10 ** 6)
+        block = dict(self.block, timestamp=timestamp, nonce=nonce, difficulty=difficulty)
+        self.assertEqual(hash, hash_block(*block.values()))
+        self.assertTrue(hex_to_binary(hash).startswith('0' * difficulty))
+        self.assertIsNone(self.kernel.search_range(timestamp, 257, 0, 100))
+
+    def test_mining_kernel_search(self):
+        block = self.kernel.search()
+        self.assertEqual(block['hash'], hash_block(*[block[key] for key in block if key != 'hash']))
+        self.assertTrue(hex_to_binary(block['hash']).startswith('0' * block['difficulty']))
+        Block.is_valid(self.last_block, Block(**block))
+
+    @patch('src.blockchain.models.mining.json.dumps')
+    def test_mining_kernel_stringify_error(self, mock_json_dumps):
+        mock_json_dumps.side_effect = Mock(side_effect=TypeError('not serializable'))
+        with self.assertRaises(BlockError):
+            MiningKernel(self.last_block, self.block)
+
+
+class MiningPoolTest(BlockMixin):
+
+    def setUp(self):
+        super(MiningPoolTest, self).setUp()
+        self.last_block = self._generate_block(self._get_genesis_block())
+        self.block = {
+            'index': self.last_block.index + 1,
+            'timestamp': get_utcnow_timestamp(),
+            'nonce': 0,
+            'difficulty': self.last_block.difficulty,
+            'data': [self._generate_transaction().info],
+            'last_hash': self.last_block.hash
+        }
+        self.pool = MiningPool(random.randint(2, 3))
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def test_mining_pool_search(self):
+        for _ in range(2):
+            block = self.pool.search(self.last_block, dict(self.block))
+            self.assertEqual(block['hash'], hash_block(*[block[key] for key in block if key != 'hash']))
+            self.assertTrue(hex_to_binary(block['hash']).startswith('0' * block['difficulty']))
+            Block.is_valid(self.last_block, Block(**block))
+        self.assertIsNotNone(self.pool.executor)
+
+    def test_mining_pool_search_stopped(self):
+        self.pool.search(self.last_block, dict(self.block))
+        event = Event()
+        event.set()
+        self.assertIsNone(self.pool.search(self.last_block, dict(self.block), event))
+
+    def test_mining_pool_search_stopped_while_searching(self):
+        event = Event()
+        with patch('src.blockchain.models.mining.wait') as mock_wait:
+            future = Mock()
+            future.result.return_value = dict(self.block, hash='hash')
+            mock_wait.side_effect = lambda *args: (event.set(), ({future}, set()))[1]
+            self.assertIsNone(self.pool.search(self.last_block, dict(self.block), event))
+        self.assertFalse(future.result.called)
+
+    def test_mining_pool_shutdown(self):
+        self.pool.search(self.last_block, dict(self.block))
+        self.pool.shutdown()
+        self.assertIsNone(self.pool.executor)
+
+    def test_mining_kernel_search_stopped(self):
+        event = Event()
+        event.set()
+        block = dict(self.block, difficulty=257)
+        with patch.object(Block, 'adjust_difficulty', return_value=257):
+            self.assertIsNone(MiningKernel(self.last_block, block).search(event=event))
+
+    @patch.object(MiningPool, 'search')
+    def test_block_mine_block_pool(self, mock_search):
+        mock_search.return_value = MiningKernel(self.last_block, dict(self.block)).search()
+        mined_block = Block.mine_block(self.last_block, self.block['data'], self.pool)
+        self.assertTrue(mock_search.called)
+        self.assertEqual(mined_block.hash, mock_search.return_value['hash'])
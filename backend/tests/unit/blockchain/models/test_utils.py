@@ -44,6 +44,17 @@ class BlockUtilsTest(LoggingMixin):
             self.assertIsInstance(err, BlockError)
             self.assertIn(err_message, err.message)
 
+    def test_digest_block(self):
+        block = {'nonce': 1, 'difficulty': 2, 'data': [{'uuid': 1}]}
+        digest = utils.digest_block(block)
+        self.assertEqual(len(digest), 64)
+        self.assertEqual(digest, utils.digest_block(dict(reversed(list(block.items())))))
+        self.assertNotEqual(digest, utils.digest_block(dict(block, nonce=2, difficulty=1)))
+
+    def test_digest_block_stringify_error(self):
+        with self.assertRaises(BlockError):
+            utils.digest_block({'data': [object()]})
+
     def test_hex_to_binary_valid_hash(self):
         binary = utils.hex_to_binary(self.hash)
         self.assertIsInstance(binary, str)
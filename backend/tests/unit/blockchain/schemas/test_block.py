@@ -5,7 +5,9 @@ from unittest.mock import patch
 
 from pydantic import ValidationError
 
+from src.blockchain.models.block import Block
 from src.blockchain.schemas.block import BlockSchema
+from src.config.settings import BLOCK_HEADER_VERSION
 from tests.unit.blockchain.utilities import BlockMixin
 
 
@@ -63,3 +65,43 @@ class BlockSchemaTest(BlockMixin):
             errors = json.loads(err.json())
             self.asserEqual(len(errors), len(self.invalid_arguments_values.keys()))
             self.assertTrue(all([error.get('type') == 'value_error' for error in errors]))
+
+    def test_blockschema_legacy_block(self):
+        blockschema = BlockSchema(**self.valid_arguments)
+        self.assertIsNone(blockschema.version)
+        self.assertIsNone(blockschema.merkle_root)
+
+    def test_blockschema_versioned_block(self):
+        block = Block.mine_block(Block.genesis(BLOCK_HEADER_VERSION), [self._generate_transaction().info])
+        blockschema = BlockSchema(**block.info)
+        self.assertEqual(blockschema.version, BLOCK_HEADER_VERSION)
+        self.assertEqual(blockschema.merkle_root, block.merkle_root)
+
+    def test_blockschema_invalid_version(self):
+        block = Block.mine_block(Block.genesis(BLOCK_HEADER_VERSION), [self._generate_transaction().info])
+        with self.assertRaises(ValidationError):
+            BlockSchema(**dict(block.info, version=BLOCK_HEADER_VERSION + 1))
+
+    def test_blockschema_invalid_merkle_root(self):
+        block = Block.mine_block(Block.genesis(BLOCK_HEADER_VERSION), [self._generate_transaction().info])
+        with self.assertRaises(ValidationError):
+            BlockSchema(**dict(block.info, merkle_root='0' * 64))
+        with self.assertRaises(ValidationError):
+            BlockSchema(**dict(block.info, merkle_root=None))
+
+    def test_blockschema_legacy_block_with_merkle_root(self):
+        with self.assertRaises(ValidationError):
+            BlockSchema(**dict(self.valid_arguments, merkle_root='0' * 64))
+
+    @patch('src.blockchain.schemas.block.BLOCK_MAX_TRANSACTIONS', 1)
+    def test_blockschema_data_exceeds_max_transactions(self):
+        data = self.valid_arguments.get('data') * 2
+        with self.assertRaises(ValidationError) as err:
+            BlockSchema(**dict(self.valid_arguments, data=data))
+        self.assertIn('Block data exceeds limits', str(err.exception))
+
+    @patch('src.blockchain.schemas.block.BLOCK_MAX_BYTES', 10)
+    def test_blockschema_data_exceeds_max_bytes(self):
+        with self.assertRaises(ValidationError) as err:
+            BlockSchema(**self.valid_arguments)
+        self.assertIn('Block data exceeds limits', str(err.exception))
@@ -6,7 +6,9 @@ from unittest.mock import patch
 
 from pydantic import ValidationError
 
+from src.blockchain.models.block import Block
 from src.blockchain.schemas.blockchain import BlockchainSchema
+from src.config.settings import BLOCK_HEADER_VERSION
 from tests.unit.blockchain.utilities import BlockchainMixin
 
 
@@ -36,3 +38,16 @@ class BlockchainSchemaTest(BlockchainMixin):
             BlockchainSchema(chain=self.invalid_chain)
             error = json.loads(err.json())[0]
             self.assertEqual(error.get('type'), 'value_error')
+
+    def test_blockchainschema_valid_versioned_chain(self):
+        chain = [Block.genesis(BLOCK_HEADER_VERSION)]
+        while len(chain) < self.chain_length:
+            chain.append(self._generate_block(chain[-1]))
+        blockchainschema = BlockchainSchema(chain=chain)
+        self.assertEqual(len(blockchainschema.chain), self.chain_length)
+
+    @patch.object(Block, 'is_valid_schema')
+    def test_blockchainschema_validated_blocks_skipped(self, mock_is_valid_schema):
+        BlockchainSchema(chain=self.valid_chain)
+        BlockchainSchema(chain=self.valid_chain)
+        self.assertEqual(mock_is_valid_schema.call_count, self.chain_length - 1)
@@ -0,0 +1,122 @@
+# encoding: utf-8
+
+import os
+import tempfile
+
+from src.blockchain.models.blockchain import Blockchain
+from src.client.models.journal import PoolJournal
+from src.client.models.transaction import Transaction
+from src.client.models.transactions_pool import TransactionsPool
+from tests.unit.client.utilities import ClientMixin
+
+
+class PoolJournalTest(ClientMixin):
+
+    def setUp(self):
+        super(PoolJournalTest, self).setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'pool.jsonl')
+        self.journal = PoolJournal(self.path)
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def _count_records(self):
+        with open(self.path) as journal:
+            return len(journal.readlines())
+
+    def test_pool_journal_string_representation(self):
+        attrs = ['path', 'records', 'compactions']
+        self.assertTrue(all([attr in str(self.journal) for attr in attrs]))
+
+    def test_pool_journal_load_not_exists(self):
+        self.assertEqual(len(self.journal.load()), 0)
+
+    def test_pool_journal_load(self):
+        transactions = [self._generate_transaction() for _ in range(3)]
+        for transaction in transactions:
+            self.journal.add(transaction)
+        self.journal.remove(transactions[1].uuid)
+        self.journal.add(transactions[0])
+        loaded = self.journal.load()
+        self.assertEqual(list(loaded.keys()), [transactions[2].uuid, transactions[0].uuid])
+        self.assertEqual(loaded.get(transactions[2].uuid).serialize(), transactions[2].serialize())
+        self.assertEqual(self.journal.records, 5)
+
+    def test_pool_journal_load_skips_corrupted_records(self):
+        transaction = self._generate_transaction()
+        self.journal.add(transaction)
+        self.journal.close()
+        with open(self.path, 'a') as journal:
+            journal.write('{"op": "add", "transa')
+        self.assertEqual(list(self.journal.load().keys()), [transaction.uuid])
+
+    def test_pool_journal_compact(self):
+        transactions = [self._generate_transaction() for _ in range(3)]
+        for transaction in transactions:
+            self.journal.add(transaction)
+            self.journal.remove(transaction.uuid)
+        self.journal.compact(transactions[:1])
+        self.assertEqual(self._count_records(), 1)
+        self.assertEqual(self.journal.records, 1)
+        self.assertEqual(self.journal.compactions, 1)
+        self.journal.add(transactions[1])
+        self.assertEqual(list(self.journal.load().keys()), [transaction.uuid for transaction in transactions[:2]])
+
+    def test_pool_journal_needs_compaction(self):
+        journal = PoolJournal(self.path, compaction_ratio=2, compaction_min=3)
+        journal.records = 3
+        self.assertFalse(journal.needs_compaction(1))
+        journal.records = 4
+        self.assertTrue(journal.needs_compaction(1))
+        self.assertFalse(journal.needs_compaction(2))
+
+    def test_transactions_pool_journal_changes(self):
+        transactions_pool = TransactionsPool()
+        transactions_pool.restore(self.journal)
+        transactions = [self._generate_transaction() for _ in range(3)]
+        for transaction in transactions:
+            transactions_pool.add_transaction(transaction)
+        blockchain = Blockchain()
+        block = blockchain.add_block([transactions[0].info])
+        transactions_pool.clear_blocks([block])
+        self.assertEqual(list(self.journal.load().keys()), list(transactions_pool.pool.keys()))
+
+    def test_transactions_pool_journal_compaction(self):
+        journal = PoolJournal(self.path, compaction_ratio=2, compaction_min=2)
+        transactions_pool = TransactionsPool(max_transactions=1)
+        transactions_pool.restore(journal)
+        for _ in range(5):
+            transactions_pool.add_transaction(self._generate_transaction())
+        self.assertGreater(journal.compactions, 1)
+        self.assertLessEqual(self._count_records(), 4)
+        self.assertEqual(list(journal.load().keys()), list(transactions_pool.pool.keys()))
+        journal.close()
+
+    def test_transactions_pool_restore_invalid_transactions(self):
+        valid_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        invalid_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        invalid_transaction.output[self.recipient] = 2
+        self.journal.add(invalid_transaction)
+        self.journal.add(valid_transaction)
+        transactions_pool = TransactionsPool()
+        self.assertEqual(transactions_pool.restore(PoolJournal(self.path)), 1)
+        self.assertEqual(list(transactions_pool.pool.keys()), [valid_transaction.uuid])
+        self.assertEqual(self._count_records(), 1)
+        transactions_pool.journal.close()
+
+    def test_transactions_pool_restore(self):
+        transactions = [self._generate_transaction() for _ in range(3)]
+        for transaction in transactions:
+            self.journal.add(transaction)
+        blockchain = Blockchain()
+        blockchain.add_block([transactions[1].info])
+        transactions_pool = TransactionsPool()
+        restored = transactions_pool.restore(PoolJournal(self.path), blockchain)
+        self.assertEqual(restored, 2)
+        self.assertEqual(list(transactions_pool.pool.keys()), [transactions[0].uuid, transactions[2].uuid])
+        address = transactions[0].input.get('address')
+        self.assertEqual(transactions_pool.get_transaction(address).uuid, transactions[0].uuid)
+        self.assertEqual(self._count_records(), 2)
+        transactions_pool.journal.close()
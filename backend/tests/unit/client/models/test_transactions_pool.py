@@ -1,11 +1,14 @@
 # encoding: utf-8
 
+import json
 import random
+from unittest.mock import patch
 
 from src.blockchain.models.blockchain import Blockchain
 from src.client.models.transaction import Transaction
 from src.client.models.transactions_pool import TransactionsPool
 from src.client.models.wallet import Wallet
+from src.config.settings import MINING_REWARD, MINING_REWARD_INPUT
 from tests.unit.client.utilities import ClientMixin
 
 
@@ -59,6 +62,33 @@ class TransactionsPoolTest(ClientMixin):
         transaction = self.transactions_pool.get_transaction(address)
         self.assertIsNone(transaction)
 
+    def test_transactions_pool_get_transaction_sender_index(self):
+        first_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        second_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=2)
+        self.transactions_pool.add_transaction(first_transaction)
+        self.transactions_pool.add_transaction(second_transaction)
+        self.assertEqual(self.transactions_pool.get_transaction(self.wallet.address), first_transaction)
+        self.transactions_pool.remove_transaction(first_transaction.uuid)
+        self.assertEqual(self.transactions_pool.get_transaction(self.wallet.address), second_transaction)
+        self.transactions_pool.remove_transaction(second_transaction.uuid)
+        self.assertIsNone(self.transactions_pool.get_transaction(self.wallet.address))
+        self.assertNotIn(self.wallet.address, self.transactions_pool.senders)
+
+    def test_transactions_pool_deserialize_sender_index(self):
+        transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        self.transactions_pool.add_transaction(transaction)
+        deserialized = TransactionsPool.deserialize(self.transactions_pool.serialize())
+        self.assertEqual(deserialized.get_transaction(self.wallet.address).uuid, transaction.uuid)
+
+    def test_transactions_pool_add_transactions(self):
+        valid_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        invalid_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        invalid_transaction.input['signature'] = Wallet().sign(invalid_transaction.output)
+        added = self.transactions_pool.add_transactions([invalid_transaction, valid_transaction])
+        self.assertEqual(added, [valid_transaction])
+        self.assertIn(valid_transaction.uuid, self.transactions_pool.pool)
+        self.assertNotIn(invalid_transaction.uuid, self.transactions_pool.pool)
+
     def test_transactions_pool_add_transaction(self):
         initial_size = self.transactions_pool.size
         transaction = self._generate_transaction()
@@ -70,6 +100,16 @@ class TransactionsPoolTest(ClientMixin):
         self.assertEqual(self.transactions_pool.size, initial_size + 1)
         self.assertIn(transaction.uuid, self.transactions_pool.pool)
 
+    def test_transactions_pool_version(self):
+        initial_version = self.transactions_pool.version
+        self.transactions_pool.add_transaction(self._generate_transaction())
+        self.assertGreater(self.transactions_pool.version, initial_version)
+        version = self.transactions_pool.version
+        blockchain = Blockchain()
+        blockchain.add_block(self.transactions_pool.data)
+        self.transactions_pool.clear_pool(blockchain)
+        self.assertGreater(self.transactions_pool.version, version)
+
     def test_transactions_pool_clear_pool(self):
         data = self.transactions_pool.data
         blockchain = Blockchain()
@@ -77,3 +117,124 @@ class TransactionsPoolTest(ClientMixin):
         self.assertEqual(self.transactions_pool.size, len(data))
         self.transactions_pool.clear_pool(blockchain)
         self.assertEqual(self.transactions_pool.size, 0)
+
+    def test_transactions_pool_clear_blocks(self):
+        data = self.transactions_pool.data
+        blockchain = Blockchain()
+        blockchain.add_block(data[:1])
+        block = blockchain.add_block(data[1:])
+        self.transactions_pool.clear_blocks([block])
+        self.assertEqual(list(self.transactions_pool.pool.keys()), [data[0].get('uuid')])
+
+    def test_transactions_pool_clear_pool_sender_index(self):
+        transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        self.transactions_pool.add_transaction(transaction)
+        blockchain = Blockchain()
+        blockchain.add_block([transaction.info])
+        self.transactions_pool.clear_pool(blockchain)
+        self.assertIsNone(self.transactions_pool.get_transaction(self.wallet.address))
+
+    def test_transactions_pool_evicts_oldest_transactions(self):
+        transactions_pool = TransactionsPool(max_transactions=2)
+        transactions = [self._generate_transaction() for _ in range(3)]
+        for transaction in transactions:
+            self.assertTrue(transactions_pool.add_transaction(transaction))
+        self.assertEqual(list(transactions_pool.pool.keys()), [transaction.uuid for transaction in transactions[1:]])
+
+    def test_transactions_pool_updated_transaction_is_newest(self):
+        transactions_pool = TransactionsPool(max_transactions=2)
+        transactions = [self._generate_transaction() for _ in range(3)]
+        transactions_pool.add_transaction(transactions[0])
+        transactions_pool.add_transaction(transactions[1])
+        transactions_pool.add_transaction(transactions[0])
+        transactions_pool.add_transaction(transactions[2])
+        self.assertEqual(list(transactions_pool.pool.keys()), [transactions[0].uuid, transactions[2].uuid])
+
+    def test_transactions_pool_max_bytes(self):
+        transaction = self._generate_transaction()
+        size = len(transaction.serialize())
+        transactions_pool = TransactionsPool(max_bytes=size + 10)
+        self.assertTrue(transactions_pool.add_transaction(transaction))
+        self.assertEqual(transactions_pool.bytes, size)
+        other_transaction = self._generate_transaction()
+        transactions_pool.add_transaction(other_transaction)
+        self.assertEqual(list(transactions_pool.pool.keys()), [other_transaction.uuid])
+        self.assertLessEqual(transactions_pool.bytes, size + 10)
+        self.assertFalse(TransactionsPool(max_bytes=size - 1).add_transaction(transaction))
+
+    def test_transactions_pool_initial_pool_limits(self):
+        transactions_pool = TransactionsPool(self.pool, max_transactions=1)
+        self.assertEqual(transactions_pool.size, 1)
+        self.assertFalse(transactions_pool.is_full)
+
+    def test_transactions_pool_get_block_data(self):
+        data = self.transactions_pool.get_block_data(self.wallet)
+        self.assertEqual(data[:-1], self.transactions_pool.data)
+        self.assertEqual(data[-1].get('input'), MINING_REWARD_INPUT)
+        self.assertEqual(data[-1].get('output'), {self.wallet.address: MINING_REWARD})
+
+    def test_transactions_pool_get_block_data_max_transactions(self):
+        data = self.transactions_pool.get_block_data(self.wallet, max_transactions=1)
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0].get('input'), MINING_REWARD_INPUT)
+
+    def test_transactions_pool_get_block_data_max_bytes(self):
+        transactions = list(self.transactions_pool.pool.values())
+        max_bytes = sum([len(transaction.serialize()) for transaction in transactions[:1]]) * 2 + 10
+        data = self.transactions_pool.get_block_data(self.wallet, max_bytes=max_bytes)
+        self.assertEqual(data[:-1], [transactions[0].info])
+        self.assertLessEqual(sum([len(json.dumps(transaction_info)) for transaction_info in data]), max_bytes)
+
+    def test_transactions_pool_validate_transactions(self):
+        valid_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        invalid_transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+        invalid_transaction.input['signature'] = Wallet().sign(invalid_transaction.output)
+        initial_version = self.transactions_pool.version
+        valid = self.transactions_pool.validate_transactions([invalid_transaction, valid_transaction])
+        self.assertEqual(valid, [valid_transaction])
+        self.assertNotIn(valid_transaction.uuid, self.transactions_pool.pool)
+        self.assertEqual(self.transactions_pool.version, initial_version)
+
+    def test_transactions_pool_info(self):
+        info = self.transactions_pool.info
+        self.assertEqual(info.get('size'), self.transactions_pool.size)
+        self.assertEqual(info.get('bytes'), self.transactions_pool.bytes)
+        self.assertEqual(info.get('expired'), 0)
+        transactions_pool = TransactionsPool(dict(self.pool), max_transactions=1)
+        self.assertEqual(transactions_pool.info.get('evicted'), len(self.pool) - 1)
+
+    @patch('src.client.models.transactions_pool.time.monotonic')
+    def test_transactions_pool_expire(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        transactions_pool = TransactionsPool(ttl=10)
+        first_transaction = self._generate_transaction()
+        transactions_pool.add_transaction(first_transaction)
+        mock_monotonic.return_value = 5
+        second_transaction = self._generate_transaction()
+        transactions_pool.add_transaction(second_transaction)
+        mock_monotonic.return_value = 10
+        self.assertEqual(transactions_pool.expire(), 1)
+        self.assertEqual(list(transactions_pool.pool.keys()), [second_transaction.uuid])
+        self.assertEqual(transactions_pool.expired, 1)
+        self.assertNotIn(first_transaction.uuid, transactions_pool.expiries)
+
+    @patch('src.client.models.transactions_pool.time.monotonic')
+    def test_transactions_pool_expire_updated_transaction(self, mock_monotonic):
+        mock_monotonic.return_value = 0
+        transactions_pool = TransactionsPool(ttl=10)
+        transaction = self._generate_transaction()
+        transactions_pool.add_transaction(transaction)
+        mock_monotonic.return_value = 5
+        transactions_pool.add_transaction(transaction)
+        mock_monotonic.return_value = 10
+        self.assertEqual(transactions_pool.expire(), 0)
+        self.assertIn(transaction.uuid, transactions_pool.pool)
+        mock_monotonic.return_value = 15
+        self.assertEqual(transactions_pool.expire(), 1)
+        self.assertEqual(transactions_pool.size, 0)
+        self.assertEqual(transactions_pool.timers, [])
+
+    def test_transactions_pool_expire_without_ttl(self):
+        transactions_pool = TransactionsPool(self.pool, ttl=None)
+        self.assertEqual(transactions_pool.expire(), 0)
+        self.assertEqual(transactions_pool.timers, [])
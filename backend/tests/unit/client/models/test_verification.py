@@ -0,0 +1,66 @@
+# encoding: utf-8
+
+import random
+
+from src.client.models import verification
+from src.client.models.transaction import Transaction
+from src.client.models.verification import VerificationPool, get_verification_pool
+from src.client.models.wallet import Wallet
+from src.exceptions import TransactionError
+from tests.unit.client.utilities import ClientMixin
+
+
+class VerificationPoolTest(ClientMixin):
+
+    def setUp(self):
+        super(VerificationPoolTest, self).setUp()
+        self.transactions = [self._generate_transaction().info]
+        for _ in range(random.randint(3, 6)):
+            transaction = Transaction(sender=self.wallet, recipient=self.recipient, amount=1)
+            self.transactions.append(transaction.info)
+        self.pool = VerificationPool(workers=2, batch_size=2)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def _invalidate(self, index: int):
+        transaction = self.transactions[index]
+        transaction['input']['signature'] = Wallet().sign(transaction.get('output'))
+
+    def test_verification_pool_string_representation(self):
+        self.assertIn('workers: 2', str(self.pool))
+
+    def test_verification_pool_verify_signatures_serial(self):
+        pool = VerificationPool(workers=1)
+        self.assertTrue(all(pool.verify_signatures(self.transactions)))
+        self.assertIsNone(pool.executor)
+
+    def test_verification_pool_verify_signatures_parallel(self):
+        index = random.randint(1, len(self.transactions) - 1)
+        self._invalidate(index)
+        signatures = self.pool.verify_signatures(self.transactions)
+        self.assertIsNotNone(self.pool.executor)
+        self.assertEqual(len(signatures), len(self.transactions))
+        self.assertEqual([position for position, valid in enumerate(signatures) if not valid], [index])
+
+    def test_verification_pool_skips_cached_signatures(self):
+        self.assertTrue(all(self.pool.verify_signatures(self.transactions)))
+        hits = Wallet.signature_cache.hits
+        self.assertTrue(all(self.pool.verify_signatures(self.transactions)))
+        self.assertEqual(Wallet.signature_cache.hits, hits + len(self.transactions) - 1)
+
+    def test_verification_pool_verify_malformed_transaction(self):
+        self.transactions[-1]['input']['public_key'] = 'publ1c k3y'
+        self.assertFalse(VerificationPool(workers=1).verify_signatures(self.transactions)[-1])
+
+    def test_verification_pool_verify_first_failure(self):
+        self._invalidate(1)
+        with self.assertRaises(TransactionError) as err:
+            self.pool.verify(self.transactions)
+        self.assertEqual(err.exception.message, 'Invalid signature verification.')
+
+    def test_get_verification_pool(self):
+        pool = get_verification_pool()
+        self.assertIs(get_verification_pool(), pool)
+        self.assertEqual(get_verification_pool(pool.workers + 1).workers, pool.workers + 1)
+        verification._verification_pool = pool
@@ -3,11 +3,13 @@
 import random
 import re
 import uuid
+from unittest.mock import patch
 
 from cryptography.hazmat.backends.openssl.ec import _EllipticCurvePrivateKey
+from cryptography.hazmat.primitives import serialization
 
 from src.client.models.wallet import Wallet
-from src.config.settings import MINING_REWARD
+from src.config.settings import MINING_REWARD, MINING_REWARD_INPUT
 from tests.unit.client.utilities import ClientMixin
 
 
@@ -39,6 +41,31 @@ class WalletTest(ClientMixin):
         self.wallet.blockchain = self._generate_blockchain(blocks)
         self.assertEqual(self.wallet.balance, blocks * MINING_REWARD)
 
+    @patch.object(Wallet, 'get_balance')
+    def test_wallet_balance_snapshot(self, mock_get_balance):
+        mock_get_balance.return_value = MINING_REWARD
+        wallet = Wallet(self.wallet.blockchain)
+        for _ in range(3):
+            self.assertEqual(wallet.balance, MINING_REWARD)
+        self.assertEqual(mock_get_balance.call_count, 1)
+        wallet.blockchain.add_block([self._generate_transaction().info])
+        self.assertEqual(wallet.balance, MINING_REWARD)
+        self.assertEqual(mock_get_balance.call_count, 2)
+
+    def test_wallet_balance_without_blockchain(self):
+        self.assertEqual(Wallet().balance, 0)
+
+    def test_wallet_update_balances(self):
+        blockchain = self._generate_blockchain(random.randint(1, 10))
+        balances = {}
+        for block in blockchain.chain:
+            for transaction in block.data:
+                Wallet.update_balances(balances, transaction)
+        addresses = set(balances.keys()) - {MINING_REWARD_INPUT.get('address')}
+        self.assertTrue(addresses)
+        for address in addresses:
+            self.assertEqual(balances.get(address), Wallet.get_balance(blockchain, address))
+
     def test_wallet_sign(self):
         signature = self.wallet.sign(self.data)
         self.assertIsInstance(signature, tuple)
@@ -52,3 +79,40 @@ class WalletTest(ClientMixin):
     def test_wallet_verify_invalid_signature(self):
         signature = self.wallet.sign(self.data)
         self.assertFalse(Wallet.verify(Wallet().public_key, signature, self.data))
+
+    @patch.object(serialization, 'load_pem_public_key', wraps=serialization.load_pem_public_key)
+    def test_wallet_verify_cached_signature(self, mock_load_pem_public_key):
+        signature = self.wallet.sign(self.data)
+        hits = Wallet.signature_cache.hits
+        self.assertTrue(Wallet.verify(self.wallet.public_key, signature, self.data))
+        self.assertTrue(Wallet.verify(self.wallet.public_key, list(signature), self.data))
+        self.assertEqual(mock_load_pem_public_key.call_count, 1)
+        self.assertEqual(Wallet.signature_cache.hits, hits + 1)
+
+    def test_wallet_verify_invalid_signature_not_cached(self):
+        signature = self.wallet.sign(self.data)
+        public_key = Wallet().public_key
+        self.assertFalse(Wallet.verify(public_key, signature, self.data))
+        self.assertNotIn(Wallet.signature_digest(public_key, signature, self.data), Wallet.signature_cache)
+
+    def test_wallet_signature_digest(self):
+        signature = self.wallet.sign(self.data)
+        digest = Wallet.signature_digest(self.wallet.public_key, signature, self.data)
+        self.assertEqual(digest, Wallet.signature_digest(self.wallet.public_key, list(signature), self.data))
+        self.assertNotEqual(digest, Wallet.signature_digest(self.wallet.public_key, signature, {'other': 'data'}))
+        self.assertIsNone(Wallet.signature_digest(None, signature, self.data))
+
+    @patch.object(serialization, 'load_pem_public_key', wraps=serialization.load_pem_public_key)
+    def test_wallet_load_public_key_cached(self, mock_load_pem_public_key):
+        hits = Wallet.public_key_cache.hits
+        deserialized_key = Wallet.load_public_key(self.wallet.public_key)
+        self.assertIs(Wallet.load_public_key(self.wallet.public_key), deserialized_key)
+        self.assertEqual(mock_load_pem_public_key.call_count, 1)
+        self.assertEqual(Wallet.public_key_cache.hits, hits + 1)
+
+    def test_wallet_verify_signatures_same_key(self):
+        signatures = [self.wallet.sign({'index': index}) for index in range(3)]
+        misses = Wallet.public_key_cache.misses
+        for index, signature in enumerate(signatures):
+            self.assertTrue(Wallet.verify(self.wallet.public_key, signature, {'index': index}))
+        self.assertEqual(Wallet.public_key_cache.misses, misses + 1)
@@ -3,6 +3,7 @@
 import json
 import random
 import uuid
+from unittest.mock import patch
 
 from pydantic import ValidationError
 
@@ -130,3 +131,10 @@ class TransactionSchemaTest(ClientMixin):
             errors = json.loads(err.json())
             self.assertEqual(len(errors), len(invalid_arguments_values.keys()))
             self.assertTrue(all([error.get('type') ==  'value_error' for error in errors]))
+
+    @patch.object(Wallet, 'generate_private_key')
+    def test_transactionschema_invalid_sender_amount_no_wallet(self, mock_generate_private_key):
+        with self.assertRaises(ValidationError) as err:
+            TransactionSchema(sender='s3nd3r', recipient=self.recipient, amount=self.amount)
+        self.assertIn('exceeds wallet balance 0', str(err.exception))
+        self.assertFalse(mock_generate_private_key.called)
@@ -0,0 +1,43 @@
+# encoding: utf-8
+
+from src.cache import LRUCache
+from tests.unit.logging import LoggingMixin
+
+
+class LRUCacheTest(LoggingMixin):
+
+    def setUp(self):
+        self.cache = LRUCache(2)
+
+    def test_lru_cache_string_representation(self):
+        attrs = ['size', 'capacity', 'hits', 'misses']
+        self.assertTrue(all([attr in str(self.cache) for attr in attrs]))
+
+    def test_lru_cache_get_counters(self):
+        self.cache.set('key', 'value')
+        self.assertEqual(self.cache.get('key'), 'value')
+        self.assertIsNone(self.cache.get('other_key'))
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        self.cache.set('first', 1)
+        self.cache.set('second', 2)
+        self.cache.get('first')
+        self.cache.set('third', 3)
+        self.assertIn('first', self.cache)
+        self.assertNotIn('second', self.cache)
+        self.assertEqual(self.cache.size, 2)
+        self.assertEqual(self.cache.info.get('evictions'), 1)
+
+    def test_lru_cache_discard(self):
+        self.cache.set('key', 'value')
+        self.cache.discard('key')
+        self.cache.discard('other_key')
+        self.assertNotIn('key', self.cache)
+
+    def test_lru_cache_clear(self):
+        self.cache.set('key', 'value')
+        self.cache.get('key')
+        self.cache.clear()
+        self.assertEqual(self.cache.info, {'size': 0, 'capacity': 2, 'hits': 0, 'misses': 0, 'evictions': 0})
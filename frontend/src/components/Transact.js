@@ -2,7 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
 import { FormGroup, FormControl, Button } from 'react-bootstrap';
 import axios from 'axios';
-import { API_URL } from '../config';
+import { API_URL, API_PAGE_LIMIT } from '../config';
 import history from '../history';
 
 function Transact() {
@@ -11,12 +11,17 @@ function Transact() {
   const [addresses, setAddresses] = useState([]);
 
   useEffect(() => {
-    axios.get(`${ API_URL }/addresses`)
-      .then(response => response.data)
-      .then(data => {
-        const addresses = data.addresses;
-        setAddresses(addresses);
-      });
+    const fetchAddresses = (cursor, addresses) => {
+      const params = { limit: API_PAGE_LIMIT, cursor };
+      return axios.get(`${ API_URL }/addresses`, { params })
+        .then(response => response.data)
+        .then(data => {
+          const page = addresses.concat(data.addresses);
+          return data.cursor ? fetchAddresses(data.cursor, page) : page;
+        });
+    };
+
+    fetchAddresses(null, []).then(addresses => setAddresses(addresses));
   }, []);
 
   const updateAmount = event => {